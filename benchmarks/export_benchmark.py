@@ -0,0 +1,312 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Export benchmark for Nexus Export Pro.
+
+Generates a synthetic scene, exports it once per platform preset and writes
+the timings, peak memory and output sizes to a JSON file that can be diffed
+between versions. Run it with Blender:
+
+    blender -b --factory-startup --python benchmarks/export_benchmark.py -- --output results.json
+
+Every preset run happens in its own background Blender process, so peak RSS
+is measured per preset and no run inherits data left behind by another.
+The add-on is imported from the repository checkout (or --addon), not from
+the installed copy, so the results describe the working tree.
+"""
+
+import bpy
+import bmesh
+import argparse
+import array
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RESULTS_VERSION = 1
+DEFAULT_ADDON = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "nexus_export_pro.py")
+BENCHMARK_COLLECTION = "Benchmark"
+
+
+# -----------------------------------------------------------------------------
+# Synthetic Scene
+# -----------------------------------------------------------------------------
+
+def _make_image(name, size, seed):
+    """Create a packed RGBA noise image, so lossy compression has real work to do."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(17):
+        row = array.array('f')
+        for _ in range(size):
+            row.extend((rng.random(), rng.random(), rng.random(), 1.0))
+        rows.append(row)
+
+    pixels = array.array('f')
+    for y in range(size):
+        pixels.extend(rows[y % len(rows)])
+
+    image = bpy.data.images.new(name, size, size)
+    image.pixels.foreach_set(pixels)
+    image.pack()
+    return image
+
+
+def _make_material(name, image):
+    """Create a Principled material, with the image as base color if given."""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    if image is not None:
+        nodes = mat.node_tree.nodes
+        bsdf = nodes.get("Principled BSDF")
+        tex = nodes.new('ShaderNodeTexImage')
+        tex.image = image
+        mat.node_tree.links.new(tex.outputs['Color'], bsdf.inputs['Base Color'])
+    return mat
+
+
+def _make_mesh(name, polys):
+    """Create a wavy UV-mapped grid with roughly the requested number of quads."""
+    side = max(1, round(math.sqrt(polys)))
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_grid(bm, x_segments=side, y_segments=side, size=1.0, calc_uvs=True)
+    for vert in bm.verts:
+        vert.co.z = 0.1 * math.sin(vert.co.x * 8.0) * math.cos(vert.co.y * 8.0)
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def generate_scene(args):
+    """Build the benchmark scene from an empty file and return its root objects.
+
+    Every root carries a chain of --depth children. --textures images are
+    spread over --materials materials, so --textures 1 shares one image
+    across all of them and --textures equal to --materials gives every
+    material its own."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    collection = bpy.data.collections.new(BENCHMARK_COLLECTION)
+    scene.collection.children.link(collection)
+
+    images = [_make_image(f"bench_tex_{i}", args.texture_size, i) for i in range(args.textures)]
+    materials = [
+        _make_material(f"bench_mat_{i}", images[i % len(images)] if images else None)
+        for i in range(max(1, args.materials))
+    ]
+
+    roots = []
+    index = 0
+    for i in range(args.objects):
+        parent = None
+        for level in range(args.depth + 1):
+            name = f"bench_{i:04d}" if level == 0 else f"bench_{i:04d}_child{level}"
+            mesh = _make_mesh(name, args.polys)
+            mesh.materials.append(materials[index % len(materials)])
+            obj = bpy.data.objects.new(name, mesh)
+            obj.location = (i * 2.5, level * 2.5, 0.0)
+            collection.objects.link(obj)
+            if parent is None:
+                roots.append(obj)
+            else:
+                obj.parent = parent
+            parent = obj
+            index += 1
+    return roots
+
+
+# -----------------------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------------------
+
+def _peak_rss_bytes():
+    """Peak resident set size of this process, or None where it is unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _directory_size(path):
+    """Total size of all files below a directory."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def _import_addon(addon_path):
+    """Import the add-on module from a file path and register it."""
+    addon_dir, filename = os.path.split(os.path.abspath(addon_path))
+    sys.path.insert(0, addon_dir)
+    module = __import__(os.path.splitext(filename)[0])
+    module.register()
+    return module
+
+
+def run_preset(args):
+    """Generate the scene, export it with one preset and write the measurements."""
+    timings = {}
+
+    start = time.perf_counter()
+    roots = generate_scene(args)
+    timings['generate_scene'] = time.perf_counter() - start
+
+    addon = _import_addon(args.addon)
+    output_dir = tempfile.mkdtemp(prefix="nexus_bench_")
+    try:
+        start = time.perf_counter()
+        report = addon.run_job({
+            'collections': [BENCHMARK_COLLECTION],
+            'preset': args.run_preset,
+            'output_directory': output_dir,
+        })
+        timings['export'] = time.perf_counter() - start
+        output_bytes = _directory_size(output_dir)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    result = {
+        'preset': args.run_preset,
+        'status': report['status'],
+        'objects': len(roots),
+        'files': report['total_files'],
+        'errors': report['errors'],
+        'triangles': sum(item.get('triangles', 0) for item in report['items']),
+        'output_bytes': output_bytes,
+        'peak_rss_bytes': _peak_rss_bytes(),
+        'timings': timings,
+        'stages': dict(addon._stage_totals(report['items'])),
+    }
+    with open(args.result, 'w') as f:
+        json.dump(result, f, indent=2)
+
+
+def _available_presets(addon):
+    """Platform presets defined by the add-on, excluding Custom."""
+    prop = addon.NexusExportSettings.bl_rna.properties['platform_preset']
+    return [item.identifier for item in prop.enum_items if item.identifier != 'CUSTOM']
+
+
+def _scene_args(args):
+    """Command-line arguments that reproduce the scene in a child process."""
+    return [
+        "--objects", str(args.objects),
+        "--depth", str(args.depth),
+        "--polys", str(args.polys),
+        "--materials", str(args.materials),
+        "--textures", str(args.textures),
+        "--texture-size", str(args.texture_size),
+        "--addon", os.path.abspath(args.addon),
+    ]
+
+
+def run_all(args):
+    """Run every requested preset in a fresh Blender process and collect the results."""
+    addon = _import_addon(args.addon)
+    presets = args.presets or _available_presets(addon)
+
+    results = {
+        'version': RESULTS_VERSION,
+        'addon_version': ".".join(str(v) for v in addon.bl_info['version']),
+        'blender_version': bpy.app.version_string,
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'scene': {
+            'objects': args.objects,
+            'depth': args.depth,
+            'polys': args.polys,
+            'materials': args.materials,
+            'textures': args.textures,
+            'texture_size': args.texture_size,
+        },
+        'presets': {},
+    }
+
+    work_dir = tempfile.mkdtemp(prefix="nexus_bench_runs_")
+    try:
+        for preset in presets:
+            runs = []
+            for repeat in range(args.repeat):
+                result_path = os.path.join(work_dir, f"{preset}_{repeat}.json")
+                command = [
+                    bpy.app.binary_path, "-b", "--factory-startup", "--python-exit-code", "1",
+                    "--python", os.path.abspath(__file__), "--",
+                    "--run-preset", preset, "--result", result_path,
+                ] + _scene_args(args)
+                start = time.perf_counter()
+                proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                wall_time = time.perf_counter() - start
+
+                if proc.returncode != 0 or not os.path.exists(result_path):
+                    runs.append({'preset': preset, 'status': 'CRASHED', 'wall_time': wall_time,
+                                 'log': proc.stdout[-4000:]})
+                    continue
+                with open(result_path) as f:
+                    run = json.load(f)
+                run['wall_time'] = wall_time
+                runs.append(run)
+
+            finished = [r for r in runs if r['status'] != 'CRASHED']
+            summary = {'runs': runs}
+            if finished:
+                summary['median_wall_time'] = statistics.median(r['wall_time'] for r in finished)
+                summary['median_export_time'] = statistics.median(r['timings']['export'] for r in finished)
+                summary['max_peak_rss_bytes'] = max((r['peak_rss_bytes'] or 0) for r in finished) or None
+                summary['output_bytes'] = finished[-1]['output_bytes']
+            results['presets'][preset] = summary
+
+            export_time = summary.get('median_export_time')
+            print(f"{preset:<12} " + (f"export {export_time:.2f}s, {summary['output_bytes']} bytes"
+                                      if export_time is not None else "FAILED"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="export_benchmark",
+        description="Benchmark Nexus Export Pro on a synthetic scene.",
+    )
+    parser.add_argument("--output", default="benchmark_results.json", help="Results JSON file")
+    parser.add_argument("--presets", nargs="+", help="Presets to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per preset, summarized by the median")
+    parser.add_argument("--objects", type=int, default=20, help="Number of root objects")
+    parser.add_argument("--depth", type=int, default=1, help="Children chained below each root")
+    parser.add_argument("--polys", type=int, default=5000, help="Approximate polygons per mesh")
+    parser.add_argument("--materials", type=int, default=4, help="Number of materials")
+    parser.add_argument("--textures", type=int, default=4, help="Number of distinct images shared by the materials")
+    parser.add_argument("--texture-size", type=int, default=1024, help="Image width and height")
+    parser.add_argument("--addon", default=DEFAULT_ADDON, help="Path of nexus_export_pro.py to benchmark")
+    parser.add_argument("--run-preset", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_preset:
+        run_preset(args)
+    else:
+        run_all(args)
+
+
+if __name__ == "__main__":
+    main()
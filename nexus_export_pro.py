@@ -12,12 +12,29 @@ bl_info = {
 
 import bpy
 import bmesh
+import concurrent.futures
+import contextlib
+import csv
+import fnmatch
 import os
 import json
 import math
+import array
+import numpy as np
+import hashlib
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
 import threading
+import time
 import urllib.request
 import urllib.error
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 from bpy.props import (
     BoolProperty,
     IntProperty,
@@ -28,6 +45,7 @@ from bpy.props import (
     CollectionProperty,
 )
 from bpy.types import PropertyGroup, Operator, Panel, UIList, AddonPreferences
+from bpy.app.handlers import persistent
 
 # -----------------------------------------------------------------------------
 # GitHub Auto-Update Configuration
@@ -48,12 +66,57 @@ class ExportQueueItem(PropertyGroup):
         type=bpy.types.Object,
         description="Object to export"
     )
+    collection: PointerProperty(
+        name="Collection",
+        type=bpy.types.Collection,
+        description="Collection whose top-level objects are exported, resolved when the export starts"
+    )
+    name_filter: StringProperty(
+        name="Name Filter",
+        default="",
+        description="Only export the collection's top-level objects whose names match this pattern "
+                    "(* and ? wildcards, case-insensitive)"
+    )
+    property_filter: StringProperty(
+        name="Property Filter",
+        default="",
+        description="Only export the collection's top-level objects with this custom property set to a true value"
+    )
     include: BoolProperty(
         name="Include",
         default=True,
         description="Include this object in export"
     )
 
+    # Outcome of the last export, for filtering and sorting the queue
+    last_status: EnumProperty(
+        name="Last Status",
+        items=[
+            ('NONE', "Not Exported", "Not exported yet"),
+            ('EXPORTED', "Exported", "Exported successfully"),
+            ('UNCHANGED', "Unchanged", "Skipped as unchanged"),
+            ('FAILED', "Failed", "At least one file failed to export"),
+        ],
+        default='NONE'
+    )
+    last_triangles: IntProperty(
+        name="Last Triangles",
+        default=0,
+        description="Triangles exported by the last export"
+    )
+    last_file_size: FloatProperty(
+        name="Last File Size",
+        default=0.0,
+        description="Bytes written by the last export"
+    )
+    last_duration: FloatProperty(
+        name="Last Duration",
+        default=0.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE',
+        description="Seconds spent on the last export"
+    )
+
 
 class NexusExportSettings(PropertyGroup):
     """Main settings for Nexus Export Pro."""
@@ -69,28 +132,49 @@ class NexusExportSettings(PropertyGroup):
                 'export_glb': False, 'export_usdz': True, 'export_fbx': False,
                 'enable_draco': False, 'texture_compression': 'JPEG',
                 'max_texture_size': '2048', 'resize_textures': True,
-                'usdz_optimize_via_glb': True, 'usdz_texture_compression': 'JPEG',
+                'usdz_optimize_via_glb': True, 'usdz_optimize_method': 'DIRECT',
+                'usdz_texture_compression': 'JPEG',
                 'axis_preset': 'RCP',
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 100000, 'budget_size_mb': 8.0,
             },
             'ANDROID_AR': {
                 'export_glb': True, 'export_usdz': False, 'export_fbx': False,
                 'enable_draco': True, 'texture_compression': 'JPEG',
                 'max_texture_size': '1024', 'resize_textures': True,
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 50000, 'budget_size_mb': 5.0,
             },
             'WEB_DESKTOP': {
                 'export_glb': True, 'export_usdz': False, 'export_fbx': False,
                 'enable_draco': True, 'texture_compression': 'WEBP',
                 'max_texture_size': '2048', 'resize_textures': True,
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 0, 'budget_size_mb': 0.0,
             },
             'WEB_MOBILE': {
                 'export_glb': True, 'export_usdz': False, 'export_fbx': False,
                 'enable_draco': True, 'texture_compression': 'WEBP',
                 'max_texture_size': '1024', 'resize_textures': True,
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 0, 'budget_size_mb': 2.0,
             },
             'QUEST_VR': {
                 'export_glb': True, 'export_usdz': False, 'export_fbx': False,
-                'enable_draco': True, 'texture_compression': 'JPEG',
+                'enable_draco': True, 'texture_compression': 'KTX2',
                 'max_texture_size': '1024', 'resize_textures': True,
+                'generate_lods': True,
+                'atlas_textures': False,
+                'ktx2_encoding': 'UASTC',
+                'budget_triangles': 0, 'budget_size_mb': 0.0,
             },
             'UNITY': {
                 'export_glb': False, 'export_usdz': False, 'export_fbx': True,
@@ -98,6 +182,10 @@ class NexusExportSettings(PropertyGroup):
                 'max_texture_size': '2048', 'resize_textures': False,
                 'fbx_embed_textures': False, 'fbx_apply_transform': True,
                 'axis_preset': 'RCP',
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 0, 'budget_size_mb': 0.0,
             },
             'UNREAL': {
                 'export_glb': False, 'export_usdz': False, 'export_fbx': True,
@@ -105,11 +193,19 @@ class NexusExportSettings(PropertyGroup):
                 'max_texture_size': '2048', 'resize_textures': False,
                 'fbx_embed_textures': False, 'fbx_apply_transform': True,
                 'axis_preset': 'BLENDER',
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 0, 'budget_size_mb': 0.0,
             },
             'ECOMMERCE': {
                 'export_glb': True, 'export_usdz': False, 'export_fbx': False,
                 'enable_draco': True, 'texture_compression': 'JPEG',
                 'max_texture_size': '2048', 'resize_textures': True,
+                'generate_lods': False,
+                'atlas_textures': False,
+                'ktx2_encoding': 'ETC1S',
+                'budget_triangles': 0, 'budget_size_mb': 5.0,
             },
         }
 
@@ -165,6 +261,12 @@ class NexusExportSettings(PropertyGroup):
         default='LIT',
         description="How materials are exported. Unlit uses emission to bypass lighting"
     )
+    gpu_instancing: BoolProperty(
+        name="GPU Instancing",
+        default=False,
+        description="Write linked duplicates parented to the same empty as one mesh with "
+                    "EXT_mesh_gpu_instancing (GLB only)"
+    )
 
     # Draco Settings
     enable_draco: BoolProperty(
@@ -208,6 +310,8 @@ class NexusExportSettings(PropertyGroup):
             ('NONE', "None", "No texture compression"),
             ('JPEG', "JPEG", "Lossy compression, good for photos"),
             ('WEBP', "WebP", "Modern format with good compression"),
+            ('KTX2', "KTX2", "GPU-compressed Basis Universal textures (KHR_texture_basisu), "
+                             "encoded with the toktx tool from KTX-Software"),
         ],
         default='NONE',
         description="Texture compression method for GLB export"
@@ -219,12 +323,35 @@ class NexusExportSettings(PropertyGroup):
         max=100,
         description="Quality level for lossy texture compression (higher = better quality)"
     )
+    ktx2_encoding: EnumProperty(
+        name="KTX2 Encoding",
+        items=[
+            ('ETC1S', "ETC1S", "Smallest files and download size, lower quality"),
+            ('UASTC', "UASTC", "Higher quality, larger files (zstd supercompressed)"),
+        ],
+        default='ETC1S',
+        description="Basis Universal codec used for KTX2 textures"
+    )
+    ktx2_mipmaps: BoolProperty(
+        name="Generate Mipmaps",
+        default=True,
+        description="Store a full mipmap chain in every KTX2 texture"
+    )
 
     # USDZ Settings
     usdz_optimize_via_glb: BoolProperty(
-        name="Optimize via GLB",
+        name="Optimize USDZ",
         default=True,
-        description="Export to compressed GLB first, then convert to USDZ for smaller file size"
+        description="Compress USDZ textures for smaller file size"
+    )
+    usdz_optimize_method: EnumProperty(
+        name="Method",
+        items=[
+            ('DIRECT', "Direct", "Re-encode textures and write the USDZ straight from the scene (fast)"),
+            ('GLB', "Via GLB", "Export a compressed GLB, re-import it and convert it to USDZ (slow)"),
+        ],
+        default='DIRECT',
+        description="How optimized USDZ files are produced"
     )
     usdz_use_draco: BoolProperty(
         name="Use Draco Compression",
@@ -235,11 +362,12 @@ class NexusExportSettings(PropertyGroup):
         name="Texture Format",
         items=[
             ('JPEG', "JPEG", "Lossy compression, good balance of size and quality"),
-            ('WEBP', "WebP", "Modern format with better compression"),
+            ('WEBP', "WebP", "Modern format with better compression (written as JPEG by the direct method, "
+                             "since USDZ viewers do not read WebP)"),
             ('NONE', "None", "Keep original textures"),
         ],
         default='JPEG',
-        description="Texture compression for GLB optimization step"
+        description="Texture compression for optimized USDZ files"
     )
     usdz_texture_quality: IntProperty(
         name="Texture Quality",
@@ -415,6 +543,38 @@ class NexusExportSettings(PropertyGroup):
         description="Convert all faces to triangles before export"
     )
 
+    # LOD Settings
+    generate_lods: BoolProperty(
+        name="Generate LODs",
+        default=False,
+        description="Export decimated level-of-detail variants of every object"
+    )
+    lod_count: IntProperty(
+        name="LOD Levels",
+        default=3,
+        min=1,
+        max=6,
+        description="Number of decimated levels exported in addition to the full-detail mesh"
+    )
+    lod_ratio: FloatProperty(
+        name="Reduction Ratio",
+        default=0.5,
+        min=0.01,
+        max=0.99,
+        subtype='FACTOR',
+        description="Fraction of the previous level's triangles kept by each LOD level"
+    )
+    lod_mode: EnumProperty(
+        name="LOD Output",
+        items=[
+            ('FILES', "Separate Files", "Write each level to its own _lod1, _lod2, ... files"),
+            ('MSFT_LOD', "MSFT_lod (GLB)", "Embed the levels in the GLB with the MSFT_lod extension "
+                                          "(other formats get separate files)"),
+        ],
+        default='FILES',
+        description="How LOD levels are written"
+    )
+
     # Power-of-Two Texture Settings
     force_pot_textures: BoolProperty(
         name="Force Power-of-Two",
@@ -432,6 +592,22 @@ class NexusExportSettings(PropertyGroup):
         description="Method for determining power-of-two size"
     )
 
+    # Texture Atlas Settings
+    atlas_textures: BoolProperty(
+        name="Texture Atlas",
+        default=False,
+        description="Merge materials that differ only in their images into one material per atlas, "
+                    "packing the images into shared atlas textures"
+    )
+    atlas_padding: IntProperty(
+        name="Padding",
+        default=4,
+        min=0,
+        max=32,
+        subtype='PIXEL',
+        description="Pixels of edge color bled around every image in an atlas, to avoid seams when mipmapped"
+    )
+
     # Animation Settings
     export_animation: BoolProperty(
         name="Export Animation",
@@ -455,6 +631,69 @@ class NexusExportSettings(PropertyGroup):
         default=True,
         description="Display a summary report after export completes"
     )
+    write_report_files: BoolProperty(
+        name="Write Report Files",
+        default=False,
+        description="Append a JSON Lines record per exported file to nexus_export_report.jsonl in the "
+                    "output folder as the batch runs, and write nexus_export_report.csv when it ends"
+    )
+
+    # Budget Settings
+    enforce_budget: BoolProperty(
+        name="Enforce Budget",
+        default=False,
+        description="Lower decimation, texture size, texture quality and Draco precision per object "
+                    "until it fits the triangle and file size budget"
+    )
+    budget_triangles: IntProperty(
+        name="Max Triangles",
+        default=0,
+        min=0,
+        description="Triangle budget per exported object, including its children (0 = no limit)"
+    )
+    budget_size_mb: FloatProperty(
+        name="Max File Size (MB)",
+        default=0.0,
+        min=0.0,
+        precision=1,
+        description="Size budget for each exported file in megabytes (0 = no limit)"
+    )
+    budget_max_attempts: IntProperty(
+        name="Max Attempts",
+        default=6,
+        min=2,
+        max=12,
+        description="Maximum number of exports per object while searching for settings that fit the budget"
+    )
+
+    # Crash Recovery Settings
+    resumable_export: BoolProperty(
+        name="Resumable",
+        default=False,
+        description="Keep a journal in the output folder so an interrupted export can be resumed "
+                    "and any object left mid-export restored"
+    )
+
+    # Incremental Export Settings
+    skip_unchanged: BoolProperty(
+        name="Skip Unchanged",
+        default=False,
+        description="Reuse previous exports of objects whose geometry, materials, textures and settings have not changed"
+    )
+
+    # Parallel Export Settings
+    parallel_export: BoolProperty(
+        name="Parallel Export",
+        default=False,
+        description="Split the queue across background Blender processes that export simultaneously"
+    )
+    parallel_workers: IntProperty(
+        name="Workers",
+        default=4,
+        min=1,
+        max=64,
+        description="Number of background Blender processes to run at once"
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -470,15 +709,144 @@ def is_object_visible(obj):
     return True
 
 
-def get_all_descendants(obj, visible_only=False):
-    """Recursively get all descendant objects of the given object."""
-    descendants = []
-    for child in obj.children:
-        if visible_only and not is_object_visible(child):
-            continue
-        descendants.append(child)
-        descendants.extend(get_all_descendants(child, visible_only=visible_only))
-    return descendants
+class _HierarchyWalker:
+    """Iterative traversal of object hierarchies with memoized lookups.
+
+    Visibility and whether a visible mesh sits below an object are worked
+    out at most once per object for the walker's lifetime, so a walker
+    should not outlive the operator call or batch that created it. With
+    index_children, children come from a single pass over bpy.data.objects
+    instead of one lookup per object. No recursion is involved, so hierarchy
+    depth is only limited by memory."""
+
+    def __init__(self, index_children=False):
+        self.visible = {}
+        self.mesh_below = {}
+        self.children = None
+        if index_children:
+            self.children = {}
+            for obj in bpy.data.objects:
+                if obj.parent is not None:
+                    self.children.setdefault(obj.parent, []).append(obj)
+
+    def children_of(self, obj):
+        if self.children is not None:
+            return self.children.get(obj, ())
+        return obj.children
+
+    def is_visible(self, obj):
+        visible = self.visible.get(obj)
+        if visible is None:
+            visible = self.visible[obj] = is_object_visible(obj)
+        return visible
+
+    def walk(self, root, visible_only=False):
+        """Yield (object, depth, visible) for the descendants of root, depth-first.
+
+        visible is False for hidden objects and everything below them. With
+        visible_only, hidden objects and their subtrees are skipped."""
+        stack = [(child, 0, True) for child in reversed(self.children_of(root))]
+        while stack:
+            obj, depth, visible = stack.pop()
+            visible = visible and self.is_visible(obj)
+            if visible_only and not visible:
+                continue
+            yield obj, depth, visible
+            stack.extend((child, depth + 1, visible) for child in reversed(self.children_of(obj)))
+
+    def descendants(self, root, visible_only=False):
+        return [obj for obj, _, _ in self.walk(root, visible_only)]
+
+    def has_mesh_descendants(self, root):
+        """Check if a visible mesh sits below root, reached through visible objects only."""
+        # Post-order, so every subtree is resolved once and shared by its ancestors
+        stack = [(root, False)]
+        while stack:
+            obj, expanded = stack.pop()
+            if obj in self.mesh_below:
+                continue
+            children = [child for child in self.children_of(obj) if self.is_visible(child)]
+            if expanded:
+                self.mesh_below[obj] = any(child.type == 'MESH' or self.mesh_below[child] for child in children)
+            else:
+                stack.append((obj, True))
+                stack.extend((child, False) for child in children)
+        return self.mesh_below[root]
+
+    def without_nested(self, objects, anchors):
+        """Return the objects that have no ancestor in anchors, keeping their order.
+
+        Every parent chain is resolved once: the answer is memoized for each
+        ancestor passed on the way up, so later objects stop at the first
+        ancestor already seen and the whole call is linear in the number of
+        objects involved."""
+        under_anchor = {}
+        kept = []
+        for obj in objects:
+            chain = []
+            nested = False
+            parent = obj.parent
+            while parent is not None:
+                if parent in under_anchor:
+                    nested = under_anchor[parent]
+                    break
+                if parent in anchors:
+                    nested = under_anchor[parent] = True
+                    break
+                chain.append(parent)
+                parent = parent.parent
+            for ancestor in chain:
+                under_anchor[ancestor] = nested
+            if not nested:
+                kept.append(obj)
+        return kept
+
+
+def get_all_descendants(obj, visible_only=False, walker=None):
+    """Get all descendant objects of the given object, depth-first.
+
+    Pass a walker to share its memoized lookups between calls."""
+    return (walker or _HierarchyWalker()).descendants(obj, visible_only)
+
+
+class _HierarchyIndex:
+    """Visible descendants and counts of queue roots, for drawing the queue.
+
+    Each root is walked once, on first use, and its entry is kept until the
+    depsgraph reports a change that can add, remove, reparent or hide
+    objects. Drawing the queue then reads the entries instead of walking
+    every hierarchy on every redraw."""
+
+    def __init__(self):
+        self.entries = {}
+        self.walker = _HierarchyWalker()
+
+    def get(self, root):
+        """Return the entry for a root object, building it if needed.
+
+        'tree' lists the visible descendants depth-first as (object, depth),
+        skipping hidden objects along with their children."""
+        entry = self.entries.get(root)
+        if entry is None:
+            tree = []
+            total = 0
+            for obj, depth, visible in self.walker.walk(root):
+                total += 1
+                if visible:
+                    tree.append((obj, depth))
+            entry = self.entries[root] = {
+                'tree': tree,
+                'mesh_count': sum(1 for obj, _ in tree if obj.type == 'MESH'),
+                'hidden_count': total - len(tree),
+            }
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+        self.walker = _HierarchyWalker()
+
+
+_hierarchy_index = _HierarchyIndex()
 
 
 def get_type_icon(obj):
@@ -494,9 +862,95 @@ def get_type_icon(obj):
     return icons.get(obj.type, 'OBJECT_DATA')
 
 
+def _queue_item_name(item):
+    """Display name of a queue item, empty if its object or collection is gone."""
+    if item.obj:
+        return item.obj.name
+    if item.collection:
+        return item.collection.name
+    return ""
+
+
+def _queue_item_type(item):
+    """Type of a queue item as used by the list's type filter."""
+    if item.obj:
+        return item.obj.type if item.obj.type in {'MESH', 'EMPTY'} else 'OTHER'
+    if item.collection:
+        return 'COLLECTION'
+    return 'OTHER'
+
+
+def _queue_item_key(item):
+    """Identify the object or collection behind a queue item by type and name."""
+    if item.obj:
+        return ('OBJECT', item.obj.name)
+    if item.collection:
+        return ('COLLECTION', item.collection.name)
+    return None
+
+
+class _QueueListCache:
+    """Filter flags and display order of the queue list, kept between redraws.
+
+    The list asks for both on every redraw. They are rebuilt only when the
+    scene, a filter or sort option or the queue length changes, or when the
+    depsgraph reports an edit, which includes any change to the queue items
+    themselves."""
+
+    def __init__(self):
+        self.key = None
+        self.flags = []
+        self.order = []
+
+    def clear(self):
+        self.key = None
+        self.flags = []
+        self.order = []
+
+
+_queue_list_cache = _QueueListCache()
+
+
 class NEXUS_UL_export_queue(UIList):
     """UIList for displaying export queue items."""
 
+    filter_type: EnumProperty(
+        name="Type",
+        items=[
+            ('ALL', "All Types", "Show every item"),
+            ('MESH', "Meshes", "Show mesh objects"),
+            ('EMPTY', "Empties", "Show empties (hierarchy roots)"),
+            ('COLLECTION', "Collections", "Show collection items"),
+            ('OTHER', "Other", "Show other object types and missing items"),
+        ],
+        default='ALL'
+    )
+    filter_status: EnumProperty(
+        name="Status",
+        items=[
+            ('ALL', "Any Status", "Show every item"),
+            ('INCLUDED', "Included", "Show items included in the export"),
+            ('EXCLUDED', "Excluded", "Show items excluded from the export"),
+            ('NONE', "Not Exported", "Show items not exported yet"),
+            ('EXPORTED', "Exported", "Show items exported successfully last time"),
+            ('UNCHANGED', "Unchanged", "Show items skipped as unchanged last time"),
+            ('FAILED', "Failed", "Show items that failed last time"),
+        ],
+        default='ALL'
+    )
+    sort_key: EnumProperty(
+        name="Sort By",
+        items=[
+            ('QUEUE', "Queue Order", "Keep the queue order"),
+            ('NAME', "Name", "Sort alphabetically"),
+            ('TRIANGLES', "Triangles", "Most triangles in the last export first"),
+            ('SIZE', "File Size", "Largest last export first"),
+            ('TIME', "Export Time", "Slowest last export first"),
+            ('FAILED', "Failures", "Items that failed last time first"),
+        ],
+        default='QUEUE'
+    )
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             row = layout.row(align=True)
@@ -505,72 +959,144 @@ class NEXUS_UL_export_queue(UIList):
                 row.prop(item, "include", text="")
                 row.label(text=item.obj.name, icon=get_type_icon(item.obj))
                 # Show visible child count badge for objects with children
-                children = get_all_descendants(item.obj, visible_only=True)
-                if children:
-                    mesh_count = sum(1 for c in children if c.type == 'MESH')
-                    row.label(text=f"[{mesh_count}]")
+                hierarchy = _hierarchy_index.get(item.obj)
+                if hierarchy['tree']:
+                    row.label(text=f"[{hierarchy['mesh_count']}]")
+            elif item.collection:
+                row.prop(item, "include", text="")
+                row.label(text=item.collection.name, icon='OUTLINER_COLLECTION')
+                if item.name_filter or item.property_filter:
+                    row.label(text=" ".join(f for f in (item.name_filter, item.property_filter) if f), icon='FILTER')
             else:
                 row.label(text="(Missing Object)", icon='ERROR')
+                return
+
+            # Show the value the list is sorted by, so the ranking can be read off
+            if item.last_status != 'NONE':
+                if self.sort_key == 'TRIANGLES':
+                    row.label(text=f"{item.last_triangles:,}")
+                elif self.sort_key == 'SIZE':
+                    row.label(text=f"{item.last_file_size / (1024 * 1024):.2f} MB")
+                elif self.sort_key == 'TIME':
+                    row.label(text=f"{item.last_duration:.1f} s")
+            if item.last_status == 'FAILED':
+                row.label(text="", icon='ERROR')
 
         elif self.layout_type == 'GRID':
             layout.alignment = 'CENTER'
-            obj_icon = get_type_icon(item.obj) if item.obj else 'OBJECT_DATA'
+            if item.obj:
+                obj_icon = get_type_icon(item.obj)
+            elif item.collection:
+                obj_icon = 'OUTLINER_COLLECTION'
+            else:
+                obj_icon = 'OBJECT_DATA'
             layout.label(text="", icon=obj_icon)
 
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+
+        row = layout.row(align=True)
+        row.prop(self, "filter_type", text="")
+        row.prop(self, "filter_status", text="")
+
+        row = layout.row(align=True)
+        row.prop(self, "sort_key", text="")
+        row.prop(self, "use_filter_sort_reverse", text="",
+                 icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        """Return the cached filter flags and display order, rebuilding them if stale."""
+        queue = getattr(data, propname)
+        key = (data.name_full, len(queue), self.filter_name, self.use_filter_invert,
+               self.filter_type, self.filter_status, self.sort_key, self.use_filter_sort_reverse)
+        if _queue_list_cache.key != key:
+            _queue_list_cache.flags = self.filter_flags(queue)
+            _queue_list_cache.order = self.sort_order(queue)
+            _queue_list_cache.key = key
+        return _queue_list_cache.flags, _queue_list_cache.order
+
+    def filter_flags(self, queue):
+        """One flag per item: shown items get bitflag_filter_item, hidden ones 0."""
+        pattern = f"*{self.filter_name.lower()}*" if self.filter_name else ""
+        flags = []
+        for item in queue:
+            shown = True
+            if pattern:
+                shown = fnmatch.fnmatchcase(_queue_item_name(item).lower(), pattern) != self.use_filter_invert
+            if shown and self.filter_type != 'ALL':
+                shown = _queue_item_type(item) == self.filter_type
+            if shown and self.filter_status == 'INCLUDED':
+                shown = item.include
+            elif shown and self.filter_status == 'EXCLUDED':
+                shown = not item.include
+            elif shown and self.filter_status != 'ALL':
+                shown = item.last_status == self.filter_status
+            flags.append(self.bitflag_filter_item if shown else 0)
+        return flags
+
+    def sort_order(self, queue):
+        """New position of each item, or an empty list to keep the queue order."""
+        if self.sort_key == 'QUEUE':
+            return []
+        if self.sort_key == 'NAME':
+            values = [_queue_item_name(item).lower() for item in queue]
+        elif self.sort_key == 'TRIANGLES':
+            values = [-item.last_triangles for item in queue]
+        elif self.sort_key == 'SIZE':
+            values = [-item.last_file_size for item in queue]
+        elif self.sort_key == 'TIME':
+            values = [-item.last_duration for item in queue]
+        else:
+            values = [item.last_status != 'FAILED' for item in queue]
+
+        order = [0] * len(values)
+        for position, index in enumerate(sorted(range(len(values)), key=values.__getitem__)):
+            order[index] = position
+        return order
+
 
 # -----------------------------------------------------------------------------
 # Operators
 # -----------------------------------------------------------------------------
 
+def _queue_roots(objects, existing_objects, walker):
+    """Pick which of the given objects become new queue items.
+
+    Meshes and empties with a visible mesh below them qualify, unless they
+    are already queued or sit below another queued or qualifying object,
+    since children export with their parent."""
+    candidates = [
+        obj for obj in objects
+        if obj not in existing_objects
+        and (obj.type == 'MESH' or (obj.type == 'EMPTY' and walker.has_mesh_descendants(obj)))
+    ]
+    return walker.without_nested(candidates, existing_objects.union(candidates))
+
+
+def _add_queue_items(queue, objects):
+    """Append an included queue item for each object and return how many were added."""
+    for obj in objects:
+        item = queue.add()
+        item.obj = obj
+        item.include = True
+    return len(objects)
+
+
 class NEXUS_OT_add_selected(Operator):
     """Add selected objects to the export queue"""
     bl_idname = "nexus.add_selected"
     bl_label = "Add Selected"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def is_ancestor_in_set(self, obj, obj_set):
-        """Check if any ancestor of obj is in the given set."""
-        parent = obj.parent
-        while parent:
-            if parent in obj_set:
-                return True
-            parent = parent.parent
-        return False
-
-    def has_mesh_descendants(self, obj):
-        """Check if object has any visible mesh descendants."""
-        for child in obj.children:
-            if not is_object_visible(child):
-                continue
-            if child.type == 'MESH':
-                return True
-            if self.has_mesh_descendants(child):
-                return True
-        return False
-
     def execute(self, context):
         queue = context.scene.nexus_queue
         existing_objects = {item.obj for item in queue if item.obj}
 
-        # Collect all objects being added this batch
-        candidates = []
-        for obj in context.selected_objects:
-            if obj.type == 'MESH' and obj not in existing_objects:
-                candidates.append(obj)
-            elif obj.type == 'EMPTY' and obj not in existing_objects:
-                if self.has_mesh_descendants(obj):
-                    candidates.append(obj)
-
-        # Filter out objects whose ancestor is already in the queue or being added
-        candidates_set = set(candidates)
-        all_parents = existing_objects | candidates_set
-        added_count = 0
-        for obj in candidates:
-            if not self.is_ancestor_in_set(obj, all_parents):
-                item = queue.add()
-                item.obj = obj
-                item.include = True
-                added_count += 1
+        walker = _HierarchyWalker(index_children=True)
+        roots = _queue_roots(context.selected_objects, existing_objects, walker)
+        added_count = _add_queue_items(queue, roots)
 
         if added_count > 0:
             self.report({'INFO'}, f"Added {added_count} object(s) to queue")
@@ -580,6 +1106,30 @@ class NEXUS_OT_add_selected(Operator):
         return {'FINISHED'}
 
 
+class NEXUS_OT_add_collection(Operator):
+    """Add the active collection to the export queue (its objects are resolved at export time)"""
+    bl_idname = "nexus.add_collection"
+    bl_label = "Add Collection"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        collection = context.view_layer.active_layer_collection.collection
+        if collection == context.scene.collection:
+            self.report({'WARNING'}, "Make a collection active in the Outliner first")
+            return {'CANCELLED'}
+
+        queue = context.scene.nexus_queue
+        if any(item.collection == collection for item in queue):
+            self.report({'WARNING'}, f"Collection '{collection.name}' is already in the queue")
+            return {'CANCELLED'}
+
+        item = queue.add()
+        item.collection = collection
+        item.include = True
+        self.report({'INFO'}, f"Added collection '{collection.name}' to queue")
+        return {'FINISHED'}
+
+
 class NEXUS_OT_remove_item(Operator):
     """Remove item from the export queue"""
     bl_idname = "nexus.remove_item"
@@ -669,41 +1219,14 @@ class NEXUS_OT_add_all_scene(Operator):
     bl_label = "Add All in Scene"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def has_mesh_descendants(self, obj):
-        """Check if object has any visible mesh descendants."""
-        for child in obj.children:
-            if not is_object_visible(child):
-                continue
-            if child.type == 'MESH':
-                return True
-            if self.has_mesh_descendants(child):
-                return True
-        return False
-
     def execute(self, context):
         queue = context.scene.nexus_queue
         existing_objects = {item.obj for item in queue if item.obj}
+        walker = _HierarchyWalker(index_children=True)
 
-        # Gather all top-level mesh objects and empties with mesh children
-        candidates = []
-        for obj in context.scene.objects:
-            if not is_object_visible(obj):
-                continue
-            if obj in existing_objects:
-                continue
-            if obj.parent is not None:
-                continue  # Only add top-level objects; children export with parents
-            if obj.type == 'MESH':
-                candidates.append(obj)
-            elif obj.type == 'EMPTY' and self.has_mesh_descendants(obj):
-                candidates.append(obj)
-
-        added_count = 0
-        for obj in candidates:
-            item = queue.add()
-            item.obj = obj
-            item.include = True
-            added_count += 1
+        # Only top-level objects; children export with their parents
+        top_level = [obj for obj in context.scene.objects if obj.parent is None and walker.is_visible(obj)]
+        added_count = _add_queue_items(queue, _queue_roots(top_level, existing_objects, walker))
 
         if added_count > 0:
             self.report({'INFO'}, f"Added {added_count} object(s) from scene")
@@ -720,7 +1243,12 @@ class NEXUS_OT_export_selected(Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        global _export_override_objects
+        return self.export_selected(context, modal=False)
+
+    def invoke(self, context, event):
+        return self.export_selected(context, modal=True)
+
+    def export_selected(self, context, modal):
         selected = [obj for obj in context.selected_objects
                     if obj.type == 'MESH' or
                     (obj.type == 'EMPTY' and any(c.type == 'MESH' for c in obj.children_recursive))]
@@ -729,14 +1257,82 @@ class NEXUS_OT_export_selected(Operator):
             self.report({'ERROR'}, "No mesh objects selected")
             return {'CANCELLED'}
 
-        # Set override so process_export uses these objects instead of the queue
-        _export_override_objects = selected
-        return bpy.ops.nexus.process_export()
+        return _run_override_export(self, selected, modal)
+
+
+class NEXUS_OT_resume_export(Operator):
+    """Restore objects left mid-export and continue the interrupted batch in the output folder"""
+    bl_idname = "nexus.resume_export"
+    bl_label = "Resume Export"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        output_dir = bpy.path.abspath(context.scene.nexus_export.output_directory)
+        return not _export_progress['running'] and bool(output_dir) and _read_journal(output_dir) is not None
+
+    def execute(self, context):
+        return self.resume(context, modal=False)
+
+    def invoke(self, context, event):
+        return self.resume(context, modal=True)
+
+    def resume(self, context, modal):
+        settings = context.scene.nexus_export
+        output_dir = bpy.path.abspath(settings.output_directory)
+        journal = _read_journal(output_dir)
+        if journal is None:
+            self.report({'ERROR'}, "No interrupted export found in the output directory")
+            return {'CANCELLED'}
+
+        recovered = _recover_from_journal(journal)
+        if recovered:
+            self.report({'INFO'}, f"Restored {recovered} object(s) left mid-export")
+
+        # Continue with the batch's own settings
+        _apply_settings_dict(settings, journal['settings'])
+        settings.output_directory = output_dir
+
+        remaining = [name for name in journal['objects'] if name not in journal['done']]
+        missing = [name for name in remaining if name not in bpy.data.objects]
+        if missing:
+            self.report({'WARNING'}, f"{len(missing)} object(s) no longer exist: {', '.join(missing[:5])}")
+        remaining_objects = [bpy.data.objects[name] for name in remaining if name not in missing]
+
+        if not remaining_objects:
+            os.remove(os.path.join(output_dir, _ExportJournal.FILENAME))
+            self.report({'INFO'}, "Nothing left to export")
+            return {'FINISHED'}
+
+        return _run_override_export(self, remaining_objects, modal, resume=True)
 
 
 # Override list: when set, process_export uses these objects instead of the queue
 _export_override_objects = None
 
+
+def _run_override_export(operator, objects, modal, resume=False):
+    """Export objects instead of the queue, as a modal batch or synchronously.
+
+    With resume, the batch continues the report files of an interrupted one.
+    Returns the calling operator's result: FINISHED once the export has run
+    (or, when modal, started) and CANCELLED if it could not run."""
+    global _export_override_objects
+    _export_override_objects = objects
+    try:
+        if modal:
+            result = bpy.ops.nexus.process_export('INVOKE_DEFAULT', resume=resume)
+        else:
+            result = bpy.ops.nexus.process_export(resume=resume)
+    except RuntimeError as e:
+        operator.report({'ERROR'}, str(e))
+        return {'CANCELLED'}
+    finally:
+        # prepare_batch consumes the override; drop it if the export never got that far
+        _export_override_objects = None
+    return {'FINISHED'} if result & {'FINISHED', 'RUNNING_MODAL'} else {'CANCELLED'}
+
+
 # Global storage for export report data
 _export_report_data = {
     'items': [],
@@ -745,6 +1341,130 @@ _export_report_data = {
     'errors': 0,
 }
 
+# Live state of the running export, drawn by the Output panel
+_export_progress = {
+    'running': False,
+    'cancel_requested': False,
+    'index': 0,
+    'total': 0,
+    'current': "",
+    'start_time': 0.0,
+    'bytes': 0,
+    'log': [],
+}
+
+# Number of finished items listed in the Output panel while exporting
+_PROGRESS_LOG_LENGTH = 6
+
+
+def _log_export_progress(name, status, file_size=0):
+    """Record the outcome of one item in the live progress log."""
+    _export_progress['bytes'] += file_size
+    _export_progress['log'].append(f"{name}: {status}")
+    del _export_progress['log'][:-_PROGRESS_LOG_LENGTH]
+
+
+def _export_throughput(object_count, size_bytes, elapsed):
+    """Format export throughput as objects and megabytes per minute."""
+    minutes = max(elapsed, 0.001) / 60
+    return f"{object_count / minutes:.1f} objects/min, {size_bytes / (1024 * 1024) / minutes:.1f} MB/min"
+
+
+# Report names of the timed export stages, in pipeline order
+_STAGE_LABELS = {
+    'hash': "Change Check",
+    'copy': "Mesh Copies",
+    'transforms': "Apply Transforms",
+    'cleanup': "Mesh Cleanup",
+    'unlit': "Unlit Materials",
+    'atlas': "Texture Atlas",
+    'stats': "Statistics",
+    'textures': "Texture Resize",
+    'glb': "GLB Export",
+    'ktx2': "KTX2 Encoding",
+    'usdz': "USDZ Export",
+    'fbx': "FBX Export",
+    'budget': "Budget Solver",
+    'lods': "LOD Generation",
+    'restore': "Restore",
+}
+
+
+def _peak_rss_bytes():
+    """Peak resident memory of this process so far, or None where it is unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _StageTimer:
+    """Per-item record of wall time, CPU time and peak memory growth per stage.
+
+    Memory is the growth of the process's peak resident size during the
+    stage, so a stage that only reuses memory freed earlier shows zero."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the enclosed block, adding to any earlier run of the same stage."""
+        peak_before = _peak_rss_bytes()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'memory': None})
+            entry['wall'] += time.perf_counter() - wall_start
+            entry['cpu'] += time.process_time() - cpu_start
+            if peak_before is not None:
+                entry['memory'] = (entry['memory'] or 0) + _peak_rss_bytes() - peak_before
+
+
+def _stage_totals(items):
+    """Sum the stage timings of report items, slowest stage first."""
+    totals = {}
+    for item in items:
+        for name, timing in item.get('timings', {}).items():
+            entry = totals.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'memory': None})
+            entry['wall'] += timing['wall']
+            entry['cpu'] += timing['cpu']
+            if timing['memory'] is not None:
+                entry['memory'] = (entry['memory'] or 0) + timing['memory']
+    return sorted(totals.items(), key=lambda stage: stage[1]['wall'], reverse=True)
+
+
+def _format_budget(budget):
+    """Summarize the budget solver's outcome for an item."""
+    status = "met" if budget['met'] else "NOT met"
+    return (f"Budget {status} in {budget['attempts']} attempt(s): quality {budget['quality']:.2f}, "
+            f"decimation {budget['decimation']:.2f}, {budget['max_texture_size']}px, "
+            f"texture quality {budget['texture_quality']}")
+
+
+def _format_stage(name, timing, detailed=False):
+    """Format one stage timing, e.g. 'GLB Export: 0.82 s'."""
+    text = f"{_STAGE_LABELS.get(name, name)}: {timing['wall']:.2f} s"
+    if detailed:
+        text += f" wall, {timing['cpu']:.2f} s CPU"
+        if timing['memory'] is not None:
+            text += f", +{timing['memory'] / (1024 * 1024):.1f} MB peak"
+    return text
+
+
+class NEXUS_OT_cancel_export(Operator):
+    """Cancel the running export once the current object is finished"""
+    bl_idname = "nexus.cancel_export"
+    bl_label = "Cancel Export"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        _export_progress['cancel_requested'] = True
+        return {'FINISHED'}
+
 
 class NEXUS_OT_show_report(Operator):
     """Display the export report"""
@@ -774,9 +1494,20 @@ class NEXUS_OT_show_report(Operator):
         col = box.column(align=True)
         col.label(text=f"Total Files: {report['total_files']}")
         col.label(text=f"Total Size: {self.format_size(report['total_size'])}")
+        if report.get('elapsed'):
+            throughput = _export_throughput(len(report['items']), report['total_size'], report['elapsed'])
+            col.label(text=f"Time: {report['elapsed']:.1f} s ({throughput})")
         if report['errors'] > 0:
             col.label(text=f"Errors: {report['errors']}", icon='ERROR')
 
+        # Where the time went across the whole batch
+        stage_totals = _stage_totals(report['items'])
+        if stage_totals:
+            col.separator()
+            col.label(text="Slowest Stages:", icon='TIME')
+            for name, timing in stage_totals[:3]:
+                col.label(text=f"   {_format_stage(name, timing, detailed=True)}")
+
         # Individual items
         layout.separator()
 
@@ -786,18 +1517,33 @@ class NEXUS_OT_show_report(Operator):
 
             # Object name and status
             status_icon = 'CHECKMARK' if item['success'] else 'ERROR'
-            col.label(text=item['object_name'], icon='OBJECT_DATA')
+            if item.get('cached'):
+                col.label(text=f"{item['object_name']} (unchanged)", icon='OBJECT_DATA')
+            else:
+                col.label(text=item['object_name'], icon='OBJECT_DATA')
 
             # Stats row
             row = col.row()
             row.label(text=f"Triangles: {item['triangles']:,}")
             row.label(text=f"Size: {self.format_size(item['file_size'])}")
+            if item.get('vertices'):
+                row = col.row()
+                row.label(text=f"Vertices: {item['vertices']:,}")
+                row.label(text=f"UV Sets: {item['uv_sets']}, Materials: {item['materials']}")
 
             # Format and texture info
             row = col.row()
             row.label(text=f"Format: {item['format']}")
             if item['textures']:
                 row.label(text=f"Textures: {item['textures']}")
+            if item.get('lods'):
+                col.label(text="LOD Triangles: " + " / ".join(f"{lod['triangles']:,}" for lod in item['lods']))
+            if item.get('budget'):
+                col.label(text=_format_budget(item['budget']), icon='CHECKMARK' if item['budget']['met'] else 'ERROR')
+
+            timings = sorted(item.get('timings', {}).items(), key=lambda stage: stage[1]['wall'], reverse=True)
+            if timings:
+                col.label(text=", ".join(_format_stage(name, timing) for name, timing in timings[:3]), icon='TIME')
 
             if not item['success'] and item.get('error'):
                 col.label(text=f"Error: {item['error']}", icon='ERROR')
@@ -824,21 +1570,45 @@ class NEXUS_OT_copy_report(Operator):
 
         for item in report['items']:
             status = "OK" if item['success'] else "FAILED"
+            if item.get('cached'):
+                status += ", unchanged"
             lines.append(f"Object: {item['object_name']} [{status}]")
             lines.append(f"  - Triangles: {item['triangles']:,}")
+            if item.get('vertices'):
+                lines.append(f"  - Vertices: {item['vertices']:,}")
+                lines.append(f"  - UV Sets: {item['uv_sets']}, Materials: {item['materials']}")
             lines.append(f"  - File Size: {self.format_size(item['file_size'])}")
             lines.append(f"  - Format: {item['format']}")
             if item['textures']:
                 lines.append(f"  - Textures: {item['textures']}")
+            if item.get('lods'):
+                lines.append("  - LOD Triangles: " + " / ".join(f"{lod['triangles']:,}" for lod in item['lods']))
+            if item.get('budget'):
+                lines.append(f"  - {_format_budget(item['budget'])}")
+            if item.get('timings'):
+                lines.append("  - Timings:")
+                for name in _STAGE_LABELS:
+                    if name in item['timings']:
+                        lines.append(f"    - {_format_stage(name, item['timings'][name], detailed=True)}")
             if not item['success'] and item.get('error'):
                 lines.append(f"  - Error: {item['error']}")
             lines.append("")
 
         lines.append(f"Total Files: {report['total_files']}")
         lines.append(f"Total Size: {self.format_size(report['total_size'])}")
+        if report.get('elapsed'):
+            throughput = _export_throughput(len(report['items']), report['total_size'], report['elapsed'])
+            lines.append(f"Time: {report['elapsed']:.1f} s ({throughput})")
         if report['errors'] > 0:
             lines.append(f"Errors: {report['errors']}")
 
+        stage_totals = _stage_totals(report['items'])
+        if stage_totals:
+            lines.append("")
+            lines.append("Stage Totals:")
+            for name, timing in stage_totals:
+                lines.append(f"  - {_format_stage(name, timing, detailed=True)}")
+
         text = "\n".join(lines)
         context.window_manager.clipboard = text
         self.report({'INFO'}, "Report copied to clipboard")
@@ -862,14 +1632,388 @@ def _map_axis_to_usd_enum(axis_str):
     return mapping.get(axis_str, 'Y')
 
 
+def _usd_export_kwargs(filepath, settings):
+    """Build the wm.usd_export arguments for the selected objects."""
+    usd_kwargs = {
+        'filepath': filepath,
+        'selected_objects_only': True,
+        'export_animation': settings.export_animation,
+        'export_armatures': settings.export_armatures,
+        'export_shapekeys': settings.export_shapekeys,
+    }
+    needs_convert = (settings.export_axis_up != 'Z' or settings.export_axis_forward != 'Y')
+    if needs_convert:
+        usd_kwargs['convert_orientation'] = True
+        usd_kwargs['export_global_up_selection'] = _map_axis_to_usd_enum(settings.export_axis_up)
+        usd_kwargs['export_global_forward_selection'] = _map_axis_to_usd_enum(settings.export_axis_forward)
+    return usd_kwargs
+
+
+def _gltf_exporter_supports(option):
+    """Whether the installed glTF exporter has an option, as its options vary between versions."""
+    return option in bpy.ops.export_scene.gltf.get_rna_type().properties
+
+
+def _gltf_export_kwargs(filepath, settings, use_draco, texture_compression, texture_quality,
+                        gpu_instances=False):
+    """Build the export_scene.gltf arguments that write the selected objects as GLB.
+
+    Options the installed exporter does not have are left out."""
+    gltf_kwargs = {
+        'filepath': filepath,
+        'export_format': 'GLB',
+        'use_selection': True,
+        'export_apply': True,
+        'export_yup': settings.export_axis_up == 'Y',
+        'export_animations': settings.export_animation,
+        'export_draco_mesh_compression_enable': use_draco,
+    }
+    if use_draco:
+        gltf_kwargs['export_draco_mesh_compression_level'] = settings.draco_compression_level
+        gltf_kwargs['export_draco_position_quantization'] = settings.draco_position_quantization
+        gltf_kwargs['export_draco_normal_quantization'] = settings.draco_normal_quantization
+        gltf_kwargs['export_draco_texcoord_quantization'] = settings.draco_texcoord_quantization
+
+    if texture_compression == 'JPEG':
+        gltf_kwargs['export_image_format'] = 'JPEG'
+        gltf_kwargs['export_jpeg_quality'] = texture_quality
+    elif texture_compression == 'WEBP':
+        gltf_kwargs['export_image_format'] = 'WEBP'
+    else:
+        # KTX2 is encoded afterwards from the PNG/JPEG images
+        gltf_kwargs['export_image_format'] = 'AUTO'
+
+    if gpu_instances and _gltf_exporter_supports('export_gpu_instances'):
+        gltf_kwargs['export_gpu_instances'] = True
+    return gltf_kwargs
+
+
+# Datablock types the glTF importer can create
+_IMPORT_TRACKED_COLLECTIONS = (
+    'objects', 'meshes', 'materials', 'images', 'textures', 'node_groups',
+    'actions', 'armatures', 'cameras', 'lights',
+)
+
+
+def _snapshot_datablocks():
+    """Record the datablocks that exist now, per tracked bpy.data collection."""
+    return {attr: set(getattr(bpy.data, attr)) for attr in _IMPORT_TRACKED_COLLECTIONS}
+
+
+def _remove_new_datablocks(snapshot):
+    """Remove every tracked datablock created since the snapshot in a single batch.
+
+    Only the new datablocks are touched, so orphans the user keeps around
+    on purpose survive, and the cost stays linear in the size of the file
+    rather than paying a full remap for every removed block."""
+    new_blocks = []
+    for attr, before in snapshot.items():
+        new_blocks.extend(block for block in getattr(bpy.data, attr) if block not in before)
+    if new_blocks:
+        bpy.data.batch_remove(new_blocks)
+    return len(new_blocks)
+
+
+# Texture size caps tried by the budget solver, smallest first
+_BUDGET_TEXTURE_SIZES = (256, 512, 1024, 2048, 4096, 8192)
+
+
+def _search_budget_quality(attempt, max_attempts):
+    """Binary search the highest quality level whose export fits the budget.
+
+    attempt(quality) exports at a quality level between 0 and 1 and returns
+    (fits, errors, result). Full quality is tried first. At most
+    max_attempts exports are made, the final one kept in reserve to
+    re-export the best fit when a worse level was exported last. Returns
+    the outcome of the last export and the number of exports."""
+    attempts = 1
+    fits, errors, result = attempt(1.0)
+    best = 1.0 if fits else None
+    last = 1.0
+    if not fits:
+        low, high = 0.0, 1.0
+        while attempts < max_attempts - 1 and high - low > 0.02:
+            quality = (low + high) / 2
+            fits, errors, result = attempt(quality)
+            attempts += 1
+            last = quality
+            if fits:
+                best, low = quality, quality
+            else:
+                high = quality
+        if best is None and attempts < max_attempts:
+            fits, errors, result = attempt(0.0)
+            attempts += 1
+            last = 0.0
+            if fits:
+                best = 0.0
+        if best is not None and last != best:
+            fits, errors, result = attempt(best)
+            attempts += 1
+    return fits, errors, result, attempts
+
+
+class _SettingsOverride:
+    """Read-only view of NexusExportSettings with some values replaced.
+
+    Lets the budget solver export with trial settings without touching the
+    scene's settings (and their update callbacks)."""
+
+    def __init__(self, settings, **overrides):
+        self._settings = settings
+        self._overrides = overrides
+
+    def __getattr__(self, name):
+        overrides = self.__dict__['_overrides']
+        if name in overrides:
+            return overrides[name]
+        return getattr(self.__dict__['_settings'], name)
+
+
+class _TextureCache:
+    """Batch-scoped store of resized and re-encoded copies of images.
+
+    Every image is scaled at most once per target size and encoded at most
+    once per quality, however many queue items use it. The copies are swapped
+    into the materials' image texture nodes only while an item exports and
+    are removed when the batch ends, so the original images are never
+    modified."""
+
+    def __init__(self):
+        self.copies = {}
+        self.encoded_images = {}
+        self.temp_dir = None
+
+    def get(self, image, width, height):
+        """Return a copy of the image scaled to the given size, creating it once."""
+        key = (image.name, width, height)
+        copy = self.copies.get(key)
+        if copy is None:
+            copy = image.copy()
+            # Exporters name textures after the image, so avoid a '.001' suffix
+            copy.name = f"{os.path.splitext(image.name)[0]}_{width}x{height}"
+            copy.scale(width, height)
+            self.copies[key] = copy
+        return copy
+
+    def encoded(self, image, quality):
+        """Return a JPEG copy of the image (PNG if it has alpha), loaded back from disk.
+
+        The copy is file-backed so exporters that pack textures, such as the
+        USD exporter, write the compressed file as-is."""
+        key = (image.name, quality)
+        loaded = self.encoded_images.get(key)
+        if loaded is not None:
+            return loaded
+        if image.channels != 4:
+            # Single-channel and RGB float buffers are passed through untouched
+            return image
+
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.mkdtemp(prefix="nexus_tex_")
+
+        # Image depth counts bits over all channels, so these are the RGBA layouts
+        has_alpha = image.depth in {32, 64, 128}
+        ext = "png" if has_alpha else "jpg"
+        path = os.path.join(self.temp_dir, f"{bpy.path.clean_name(image.name)}.{ext}")
+        if os.path.exists(path):
+            path = os.path.join(self.temp_dir, f"{bpy.path.clean_name(image.name)}_{len(self.encoded_images)}.{ext}")
+
+        # Copy the pixels into a scratch image; copying the image itself would
+        # not carry over the unsaved pixels of resized copies
+        width, height = image.size
+        pixels = array.array('f', [0]) * (width * height * 4)
+        image.pixels.foreach_get(pixels)
+        temp = bpy.data.images.new("_nexus_encode", width, height, alpha=has_alpha)
+        try:
+            temp.colorspace_settings.name = image.colorspace_settings.name
+            temp.pixels.foreach_set(pixels)
+            temp.filepath_raw = path
+            temp.file_format = 'PNG' if has_alpha else 'JPEG'
+            temp.save(quality=0 if has_alpha else quality)
+        finally:
+            bpy.data.images.remove(temp)
+
+        loaded = bpy.data.images.load(path)
+        loaded.colorspace_settings.name = image.colorspace_settings.name
+        loaded.alpha_mode = image.alpha_mode
+        self.encoded_images[key] = loaded
+        return loaded
+
+    def swap_in(self, all_objects, replacements):
+        """Point image nodes at replacement images, given a dict of image -> replacement.
+
+        Image nodes inside node groups are swapped too. Returns the (node,
+        original image) pairs needed to restore the materials."""
+        swaps = []
+        if not replacements:
+            return swaps
+
+        seen_materials = set()
+        seen_groups = set()
+        for obj in all_objects:
+            if obj.type != 'MESH':
+                continue
+            for mat_slot in obj.material_slots:
+                mat = mat_slot.material
+                if not mat or not mat.use_nodes or mat.name in seen_materials:
+                    continue
+                seen_materials.add(mat.name)
+                for node in _image_nodes(mat.node_tree, seen_groups):
+                    if node.image in replacements:
+                        original = node.image
+                        node.image = replacements[original]
+                        swaps.append((node, original))
+        return swaps
+
+    def restore(self, swaps):
+        """Undo swap_in."""
+        for node, original in reversed(swaps):
+            node.image = original
+
+    def clear(self):
+        """Remove all copies and their encoded files."""
+        for copy in self.copies.values():
+            bpy.data.images.remove(copy)
+        self.copies.clear()
+        for loaded in self.encoded_images.values():
+            bpy.data.images.remove(loaded)
+        self.encoded_images.clear()
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
+
+def _tree_has_images(tree):
+    """Whether a node tree or any node group inside it samples an image."""
+    for node in tree.nodes:
+        if node.type == 'TEX_IMAGE':
+            return True
+        if node.type == 'GROUP' and node.node_tree and _tree_has_images(node.node_tree):
+            return True
+    return False
+
+
+def _image_nodes(tree, seen_groups=None):
+    """Yield the image texture nodes of a node tree and of the node groups inside it.
+
+    Every group is visited once; pass the same seen_groups set to skip groups
+    already visited for other trees."""
+    seen_groups = set() if seen_groups is None else seen_groups
+    for node in tree.nodes:
+        if node.type == 'TEX_IMAGE':
+            yield node
+        elif node.type == 'GROUP' and node.node_tree and node.node_tree not in seen_groups:
+            seen_groups.add(node.node_tree)
+            yield from _image_nodes(node.node_tree, seen_groups)
+
+
+def _atlas_node_role(node):
+    """What an image node feeds and how its image is read, so matching images share an atlas."""
+    targets = sorted(f"{link.from_socket.identifier}>{link.to_node.bl_idname}.{link.to_socket.identifier}"
+                     for output in node.outputs for link in output.links)
+    return (tuple(targets), node.image.colorspace_settings.name, node.image.alpha_mode)
+
+
+def _atlas_material_key(mat):
+    """Key shared by materials that can be merged into one atlased material, or None.
+
+    Materials share a key when their node trees match in everything but
+    their images. A material qualifies only if all of its images are RGBA
+    stills read through the default UV map, at most one per role."""
+    if not mat.use_nodes or mat.node_tree is None:
+        return None
+
+    roles = {}
+    for node in mat.node_tree.nodes:
+        if node.type == 'GROUP' and node.node_tree and _tree_has_images(node.node_tree):
+            return None
+        if node.type != 'TEX_IMAGE':
+            continue
+        image = node.image
+        if (image is None or image.source not in {'FILE', 'GENERATED'} or image.channels != 4
+                or image.size[0] <= 0 or image.size[1] <= 0
+                or node.projection != 'FLAT' or node.inputs['Vector'].is_linked):
+            return None
+        roles[node.name] = _atlas_node_role(node)
+    if not roles or len(set(roles.values())) != len(roles):
+        return None
+
+    h = hashlib.sha256()
+    h.update(f"{getattr(mat, 'blend_method', '')}|{mat.use_backface_culling}".encode())
+    _hash_node_tree(h, mat.node_tree, set(), include_images=False)
+    h.update(repr(sorted(roles.items())).encode())
+    return h.hexdigest()
+
+
+def _loop_material_indices(mesh):
+    """Material slot index of every loop of a mesh, as a flat array."""
+    count = len(mesh.polygons)
+    starts = array.array('i', [0]) * count
+    totals = array.array('i', [0]) * count
+    indices = array.array('i', [0]) * count
+    mesh.polygons.foreach_get('loop_start', starts)
+    mesh.polygons.foreach_get('loop_total', totals)
+    mesh.polygons.foreach_get('material_index', indices)
+
+    loop_materials = array.array('i', [0]) * len(mesh.loops)
+    for start, total, index in zip(starts, totals, indices):
+        loop_materials[start:start + total] = array.array('i', [index]) * total
+    return loop_materials
+
+
+def _pack_atlas(sizes, page_size, padding):
+    """Shelf-pack rectangles into square pages of page_size pixels.
+
+    sizes is a list of (key, width, height); rectangles too large for a page
+    are scaled down to fit. Returns the pages as lists of
+    (key, x, y, width, height), where x and y include the padding."""
+    pages = []
+    page = None
+    x = y = shelf_height = 0
+    limit = page_size - 2 * padding
+    for key, width, height in sorted(sizes, key=lambda size: (-size[2], -size[1])):
+        scale = min(1.0, limit / width, limit / height)
+        width, height = max(1, int(width * scale)), max(1, int(height * scale))
+
+        if page is not None and x + width + 2 * padding > page_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if page is None or y + height + 2 * padding > page_size:
+            page = []
+            pages.append(page)
+            x = y = shelf_height = 0
+
+        page.append((key, x + padding, y + padding, width, height))
+        x += width + 2 * padding
+        shelf_height = max(shelf_height, height + 2 * padding)
+    return pages
+
+
+def _blit_padded(dest, pixels, x, y, padding):
+    """Copy an RGBA pixel array into a larger one at (x, y), repeating its edges into the padding.
+
+    Both arrays are shaped (height, width, 4)."""
+    height, width = pixels.shape[:2]
+    if padding:
+        pixels = np.pad(pixels, ((padding, padding), (padding, padding), (0, 0)), mode='edge')
+    dest[y - padding:y + height + padding, x - padding:x + width + padding] = pixels
+
+
 class NEXUS_OT_process_export(Operator):
     """Process and export all included objects"""
     bl_idname = "nexus.process_export"
     bl_label = "Process & Export"
     bl_options = {'REGISTER'}
 
+    resume: BoolProperty(
+        name="Resume",
+        default=False,
+        options={'HIDDEN', 'SKIP_SAVE'},
+        description="Continue the report files of an interrupted batch instead of starting new ones"
+    )
+
     def get_object_textures(self, obj):
-        """Get all image textures used by an object's materials."""
+        """Get all image textures used by an object's materials, including their node groups."""
         images = set()
         if obj.type != 'MESH':
             return images
@@ -877,37 +2021,36 @@ class NEXUS_OT_process_export(Operator):
         for mat_slot in obj.material_slots:
             mat = mat_slot.material
             if mat and mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image:
+                for node in _image_nodes(mat.node_tree):
+                    if node.image:
                         images.add(node.image)
         return images
 
     def get_hierarchy_textures(self, obj):
         """Get all textures from object and all visible descendants."""
         images = self.get_object_textures(obj)
-        for child in get_all_descendants(obj, visible_only=True):
+        for child in get_all_descendants(obj, visible_only=True, walker=self.walker):
             images.update(self.get_object_textures(child))
         return images
 
-    def get_hierarchy_triangle_count(self, obj):
-        """Get triangle count for object and all visible descendants."""
-        total = self.get_triangle_count(obj)
-        for child in get_all_descendants(obj, visible_only=True):
-            total += self.get_triangle_count(child)
-        return total
+    def get_hierarchy_stats(self, all_objects, depsgraph):
+        """Get triangle, vertex, UV set and material counts for a hierarchy in one pass.
 
-    def get_triangle_count(self, obj):
-        """Get triangle count for a mesh object."""
-        if obj.type != 'MESH':
-            return 0
-        # Create temporary mesh with modifiers applied
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        mesh = obj_eval.to_mesh()
-        # Calculate triangles (each polygon with n verts = n-2 triangles)
-        tri_count = sum(len(p.vertices) - 2 for p in mesh.polygons)
-        obj_eval.to_mesh_clear()
-        return tri_count
+        Reads each evaluated mesh in place instead of building a to_mesh() copy.
+        A polygon with n corners gives n - 2 triangles, so a mesh has
+        len(loops) - 2 * len(polygons) triangles without visiting any polygon."""
+        stats = {'triangles': 0, 'vertices': 0, 'uv_sets': 0, 'materials': 0}
+        materials = set()
+        for obj in all_objects:
+            if obj.type != 'MESH':
+                continue
+            mesh = obj.evaluated_get(depsgraph).data
+            stats['triangles'] += len(mesh.loops) - 2 * len(mesh.polygons)
+            stats['vertices'] += len(mesh.vertices)
+            stats['uv_sets'] = max(stats['uv_sets'], len(mesh.uv_layers))
+            materials.update(slot.material for slot in obj.material_slots if slot.material)
+        stats['materials'] = len(materials)
+        return stats
 
     def nearest_pot(self, value, method='NEAREST'):
         """Calculate nearest power-of-two for a given value."""
@@ -926,18 +2069,92 @@ class NEXUS_OT_process_export(Operator):
                 return lower
             return upper
 
-    def apply_mesh_cleanup(self, obj, settings):
-        """Apply mesh cleanup operations using bmesh."""
-        if obj.type != 'MESH':
-            return
+    def export_usdz_direct(self, all_objects, filepath, settings):
+        """Export the selected hierarchy to USDZ without a GLB round-trip.
+
+        When USDZ optimization is on, textures are swapped for JPEG copies
+        (PNG where they carry alpha) just for the export. USD stores mesh
+        data uncompressed either way, so only the textures affect size."""
+        swaps = []
+        if settings.usdz_optimize_via_glb and settings.usdz_texture_compression != 'NONE':
+            encoded = {}
+            for obj in all_objects:
+                for img in self.get_object_textures(obj):
+                    if img not in encoded and img.size[0] > 0 and img.size[1] > 0:
+                        encoded[img] = self.texture_cache.encoded(img, settings.usdz_texture_quality)
+            swaps = self.texture_cache.swap_in(all_objects, encoded)
 
-        # Get the mesh data
-        mesh = obj.data
+        try:
+            bpy.ops.wm.usd_export(**_usd_export_kwargs(filepath, settings))
+        finally:
+            self.texture_cache.restore(swaps)
 
+    def apply_mesh_cleanup(self, mesh, settings):
+        """Apply mesh cleanup operations to a mesh in place using bmesh."""
         # Create bmesh from mesh
         bm = bmesh.new()
         bm.from_mesh(mesh)
+        self.clean_bmesh(bm, settings)
+
+        # Write back to mesh
+        bm.to_mesh(mesh)
+        bm.free()
+
+        # Update mesh
+        mesh.update()
+
+    def cleaned_mesh(self, mesh, settings, matrix=None, target=None):
+        """Return a processed version of a mesh, leaving the mesh untouched.
+
+        The mesh is read straight into a bmesh, moved by matrix when
+        transforms are baked, cleaned if cleanup is enabled and written to
+        target (or a new empty mesh), so no full copy of the original exists
+        next to the bmesh. Meshes with shape keys are copied and processed
+        in place instead, as only a copy carries the shape keys over; the
+        copy is returned in place of target."""
+        if mesh.shape_keys is not None:
+            working = mesh.copy()
+            if matrix is not None:
+                working.transform(matrix, shape_keys=True)
+            if settings.cleanup_mesh:
+                self.apply_mesh_cleanup(working, settings)
+            return working
 
+        working = target if target is not None else bpy.data.meshes.new(mesh.name)
+        self.copy_mesh_settings(mesh, working)
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(mesh)
+            if matrix is not None:
+                bm.transform(matrix)
+            if settings.cleanup_mesh:
+                self.clean_bmesh(bm, settings)
+            bm.to_mesh(working)
+        finally:
+            bm.free()
+        working.update()
+        return working
+
+    def copy_mesh_settings(self, source, target):
+        """Copy the mesh-level settings a bmesh round trip does not carry."""
+        target.materials.clear()
+        for mat in source.materials:
+            target.materials.append(mat)
+        # Custom normals only apply with auto smooth before Blender 4.1
+        if hasattr(source, 'use_auto_smooth'):
+            target.use_auto_smooth = source.use_auto_smooth
+            target.auto_smooth_angle = source.auto_smooth_angle
+        target.use_auto_texspace = source.use_auto_texspace
+        if not source.use_auto_texspace:
+            target.texspace_location = source.texspace_location
+            target.texspace_size = source.texspace_size
+        # Custom properties are exported as extras
+        for key in source.keys():
+            value = source[key]
+            target[key] = value.to_dict() if hasattr(value, 'to_dict') else value
+
+    def clean_bmesh(self, bm, settings):
+        """Run the enabled cleanup operations on a bmesh."""
         # Remove doubles (merge by distance)
         if settings.cleanup_remove_doubles:
             bmesh.ops.remove_doubles(
@@ -964,29 +2181,22 @@ class NEXUS_OT_process_export(Operator):
         if settings.cleanup_triangulate:
             bmesh.ops.triangulate(bm, faces=bm.faces)
 
-        # Write back to mesh
-        bm.to_mesh(mesh)
-        bm.free()
-
-        # Update mesh
-        mesh.update()
-
-    def apply_pot_resize(self, images, settings):
-        """Apply power-of-two resizing to images."""
-        original_sizes = {}
-        for img in images:
-            if img.size[0] <= 0 or img.size[1] <= 0:
-                continue
+    def get_texture_target_size(self, img, settings):
+        """Return the size an image should be exported at (max size, then power-of-two)."""
+        width, height = img.size[0], img.size[1]
 
-            new_width = self.nearest_pot(img.size[0], settings.pot_method)
-            new_height = self.nearest_pot(img.size[1], settings.pot_method)
+        if settings.resize_textures:
+            max_size = int(settings.max_texture_size)
+            if width > max_size or height > max_size:
+                ratio = min(max_size / width, max_size / height)
+                width = int(width * ratio)
+                height = int(height * ratio)
 
-            # Only resize if dimensions changed
-            if new_width != img.size[0] or new_height != img.size[1]:
-                original_sizes[img.name] = (img.size[0], img.size[1])
-                img.scale(new_width, new_height)
+        if settings.force_pot_textures:
+            width = self.nearest_pot(width, settings.pot_method)
+            height = self.nearest_pot(height, settings.pot_method)
 
-        return original_sizes
+        return width, height
 
     def convert_materials_unlit(self, all_objects):
         """Convert all materials on objects to unlit (emission-based) for export.
@@ -1072,300 +2282,984 @@ class NEXUS_OT_process_export(Operator):
             # Remove temp emission node
             tree.nodes.remove(entry['emit_node'])
 
-    def execute(self, context):
-        global _export_report_data, _export_override_objects
-        settings = context.scene.nexus_export
+    def begin_parallel(self, context):
+        """Start exporting the batch by sharding it across background Blender processes.
+
+        A snapshot of the current file is saved to a temporary job directory
+        together with a manifest describing each worker's shard. Every worker
+        opens the snapshot, runs this same operator on its objects and writes
+        its report back to the job directory; poll_workers merges each
+        shard's report into the export report as soon as its worker exits.
+        Unchanged objects are skipped here, before sharding, so workers never
+        touch the export cache. Returns None once the workers run, otherwise
+        the operator result."""
+        global _export_report_data
+        settings = self.settings
+        start_time = time.perf_counter()
+        self.cached_items = []
+        self.content_hashes = {}
+        self.workers = []
+        self.report_writer = None
+        self._timer = None
+        changed_objects = self.export_objects
+        if self.export_cache is not None:
+            depsgraph = context.evaluated_depsgraph_get()
+            changed_objects = []
+            for obj in self.export_objects:
+                base_name = settings.export_prefix + obj.name + settings.export_suffix
+                all_objects = [obj] + get_all_descendants(obj, visible_only=True, walker=self.walker)
+                self.content_hashes[base_name] = _hierarchy_content_hash(all_objects, settings, depsgraph)
+                cached_item = self.export_cache.lookup(base_name, self.content_hashes[base_name])
+                if cached_item:
+                    self.cached_items.append(cached_item)
+                else:
+                    changed_objects.append(obj)
+
+        self.manifest = {'shards': []}
+        self.job_dir = None
+        if changed_objects:
+            self.job_dir = tempfile.mkdtemp(prefix="nexus_job_")
+            manifest = self.start_workers(context, settings, changed_objects, self.output_dir, self.job_dir)
+            if manifest is None:
+                shutil.rmtree(self.job_dir, ignore_errors=True)
+                return {'CANCELLED'}
+            self.manifest = manifest
+
+        context.window_manager.progress_begin(0, max(len(self.manifest['shards']), 1))
+        _export_progress.update({
+            'running': True,
+            'cancel_requested': False,
+            'index': 0,
+            'total': len(self.export_objects),
+            'current': f"{len(self.workers)} worker(s) running",
+            'start_time': start_time,
+            'bytes': 0,
+            'log': [],
+        })
+
+        # Workers do not write report files, so the report is streamed from here
+        if settings.write_report_files:
+            self.report_writer = _ReportWriter(self.output_dir, self.resumed_objects())
+        _export_report_data = _shard_report([])
+        self.merge_items(_shard_report(self.cached_items), "unchanged, skipped")
+        return None
+
+    def start_workers(self, context, settings, export_objects, output_dir, job_dir):
+        """Save a snapshot and launch one worker per shard, without waiting for them.
+
+        Returns the job manifest, or None if the snapshot could not be saved."""
+        worker_count = min(settings.parallel_workers, len(export_objects))
+        snapshot_path = os.path.join(job_dir, "snapshot.blend")
+
+        # The snapshot only holds image edits that were saved or packed
+        dirty_images = set()
+        for obj in export_objects:
+            dirty_images.update(image.name for image in self.get_hierarchy_textures(obj) if image.is_dirty)
+        if dirty_images:
+            self.report({'ERROR'}, "Save or pack the modified images before a parallel export: "
+                                   + ", ".join(sorted(dirty_images)))
+            return None
 
-        # Reset export report
-        _export_report_data = {
-            'items': [],
-            'total_files': 0,
-            'total_size': 0,
-            'errors': 0,
-        }
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=snapshot_path, copy=True)
+        except Exception as e:
+            self.report({'ERROR'}, f"Could not save scene snapshot for workers: {e}")
+            return None
 
-        # Validation
-        output_dir = bpy.path.abspath(settings.output_directory)
-        if not output_dir or not os.path.isdir(output_dir):
-            self.report({'ERROR'}, "Please set a valid output directory")
-            return {'CANCELLED'}
+        manifest = _write_job_manifest(
+            job_dir, snapshot_path, output_dir, settings,
+            [obj.name for obj in export_objects], worker_count,
+        )
+        manifest_path = os.path.join(job_dir, "manifest.json")
+
+        self.report({'INFO'}, f"Exporting {len(export_objects)} object(s) with {worker_count} worker(s)")
+
+        # Launch one background Blender per shard
+        for shard in manifest['shards']:
+            log_file = open(shard['log'], 'w')
+            try:
+                proc = subprocess.Popen(
+                    _worker_command(snapshot_path, manifest_path, shard['index']),
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                )
+            except OSError as e:
+                log_file.write(f"Failed to start worker: {e}\n")
+                log_file.close()
+                continue
+            self.workers.append((proc, log_file, shard))
 
-        if not any([settings.export_glb, settings.export_usdz, settings.export_fbx]):
-            self.report({'ERROR'}, "Please select at least one export format")
-            return {'CANCELLED'}
+        return manifest
 
-        # Use override objects if set (from Export Selected), otherwise use queue
-        if _export_override_objects is not None:
-            export_objects = list(_export_override_objects)
-            _export_override_objects = None
-        else:
-            queue = context.scene.nexus_queue
-            export_objects = [item.obj for item in queue if item.include and item.obj]
+    def poll_workers(self, context):
+        """Merge the reports of the workers that exited. True once all have exited."""
+        for entry in self.workers[:]:
+            proc, log_file, shard = entry
+            if proc.poll() is None:
+                continue
+            log_file.close()
+            self.workers.remove(entry)
+            _log_export_progress(f"Worker {shard['index']}", "finished" if proc.returncode == 0 else "FAILED")
+            self.merge_items(_read_shard_report(shard, self.settings))
+
+        finished_shards = len(self.manifest['shards']) - len(self.workers)
+        context.window_manager.progress_update(finished_shards)
+        _export_progress['current'] = f"{len(self.workers)} worker(s) running"
+        return not self.workers
+
+    def wait_for_workers(self, context):
+        """Block until every worker has exited, merging each report as it arrives."""
+        while not self.poll_workers(context):
+            # Waiting on a process returns as soon as it exits, unlike sleeping
+            self.workers[0][0].wait()
+
+    def merge_items(self, report, status=None):
+        """Add a partial report to the export report, streaming and logging its items."""
+        for key in ('total_files', 'total_size', 'errors'):
+            _export_report_data[key] += report[key]
+        for item in report['items']:
+            _export_report_data['items'].append(item)
+            if self.report_writer is not None:
+                self.report_writer.write_item(item)
+            if status:
+                _log_export_progress(item['object_name'], status)
+            else:
+                _log_export_progress(item['object_name'], item['format'] or "FAILED", item['file_size'])
+        _export_progress['index'] += len(report['items'])
 
-        if not export_objects:
-            self.report({'ERROR'}, "No objects selected for export")
-            return {'CANCELLED'}
+    def finish_parallel(self, context, cancelled=False):
+        """Stop any remaining workers, finalize the report and show the summary."""
+        settings = self.settings
 
-        # Store original selection
-        original_selected = context.selected_objects[:]
-        original_active = context.view_layer.objects.active
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
-        success_count = 0
-        error_count = 0
-        total_items = len(export_objects)
+        for proc, log_file, shard in self.workers:
+            proc.terminate()
+            proc.wait()
+            log_file.close()
+            self.merge_items(_read_shard_report(shard, settings))
+        self.workers = []
 
-        context.window_manager.progress_begin(0, total_items)
+        context.window_manager.progress_end()
+        _export_progress['running'] = False
 
-        for item_index, obj in enumerate(export_objects):
+        order = {
+            settings.export_prefix + obj.name + settings.export_suffix: index
+            for index, obj in enumerate(self.export_objects)
+        }
+        _export_report_data['items'].sort(key=lambda item: order.get(item['object_name'], len(order)))
+        _record_queue_results(context.scene.nexus_queue, self.queue_sources, _export_report_data['items'], settings)
+        _export_report_data['elapsed'] = time.perf_counter() - _export_progress['start_time']
+
+        if self.export_cache is not None:
+            for item in _export_report_data['items']:
+                # Workers name their items themselves, so an item may have no hash here
+                content_hash = self.content_hashes.get(item['object_name'])
+                if content_hash and item['success'] and not item['error'] and not item.get('cached'):
+                    self.export_cache.store(item['object_name'], content_hash, item)
+            self.export_cache.save()
+
+        if self.report_writer is not None:
+            self.report_writer.close(_export_report_data['items'])
+
+        failed_shards = [s for s in self.manifest['shards'] if not os.path.exists(s['result'])]
+        if cancelled:
+            if self.job_dir:
+                shutil.rmtree(self.job_dir, ignore_errors=True)
+            self.report({'WARNING'}, f"Export cancelled, {len(failed_shards)} worker(s) stopped")
+        else:
+            if failed_shards:
+                self.report({'WARNING'}, f"{len(failed_shards)} worker(s) failed, logs kept in {self.job_dir}")
+            elif self.job_dir:
+                shutil.rmtree(self.job_dir, ignore_errors=True)
+            self.report_summary(_export_report_data['total_files'], _export_report_data['errors'],
+                                len(self.cached_items), _export_report_data['elapsed'])
 
-            # Update progress bar and status
-            context.window_manager.progress_update(item_index)
-            self.report({'INFO'}, f"Exporting {item_index + 1}/{total_items}: {obj.name}")
+        if settings.show_export_report and _export_report_data['items']:
+            bpy.ops.nexus.show_report('INVOKE_DEFAULT')
 
-            # Get all visible descendants (children, grandchildren, etc.)
-            descendants = get_all_descendants(obj, visible_only=True)
-            all_objects = [obj] + descendants
+        _redraw_panels()
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
 
-            # Select object and all its descendants
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            for child in descendants:
-                child.select_set(True)
-            context.view_layer.objects.active = obj
+    def resumed_objects(self):
+        """Report names of the objects a resumed batch exports again, or None for a new batch."""
+        if not self.resume:
+            return None
+        return {self.settings.export_prefix + name + self.settings.export_suffix for name in self.export_names}
 
-            base_name = settings.export_prefix + obj.name + settings.export_suffix
+    def report_summary(self, file_count, error_count, skipped_count=0, elapsed=None):
+        """Report the outcome of a batch in the status bar."""
+        extra = f", {skipped_count} unchanged object(s) skipped" if skipped_count else ""
+        if elapsed:
+            extra += f" in {elapsed:.1f} s"
+        if error_count == 0:
+            self.report({'INFO'}, f"Successfully exported {file_count} file(s){extra}")
+        else:
+            self.report({'WARNING'}, f"Exported {file_count} file(s), {error_count} failed{extra}")
+
+    def export_item(self, context, obj):
+        """Run the export pipeline for one queue item and add it to the report.
+
+        Transforms, mesh data, materials and texture sizes changed for the
+        export are restored before returning, even if an exporter raises."""
+        settings = self.settings
+        output_dir = self.output_dir
+
+        # Get all visible descendants (children, grandchildren, etc.)
+        all_objects = [obj] + get_all_descendants(obj, visible_only=True, walker=self.walker)
+
+        # Select object and all its descendants
+        self.select_hierarchy(context, all_objects)
+
+        base_name = settings.export_prefix + obj.name + settings.export_suffix
+        timer = _StageTimer()
+
+        # Reuse the previous export if nothing that affects the output changed
+        content_hash = None
+        if self.export_cache is not None:
+            with timer.stage('hash'):
+                content_hash = _hierarchy_content_hash(all_objects, settings, context.evaluated_depsgraph_get())
+                cached_item = self.export_cache.lookup(base_name, content_hash)
+            if cached_item:
+                cached_item['timings'] = timer.stages
+                _export_report_data['items'].append(cached_item)
+                _export_report_data['total_size'] += cached_item['file_size']
+                _export_report_data['total_files'] += len(cached_item['files'])
+                self.skipped_count += 1
+                _log_export_progress(base_name, "unchanged, skipped")
+                if self.report_writer is not None:
+                    self.report_writer.write_item(cached_item)
+                # A resumed batch then skips it without hashing it again
+                if self.journal is not None:
+                    self.journal.item_done(obj.name)
+                return
+
+        item_errors = {}
+        original_transforms = {}
+        original_mesh_data = {}
+        mesh_names = {}
+        unlit_restore_data = []
+        texture_swaps = []
+        budget_modifiers = []
+        atlas_blocks = []
+
+        try:
+            # Transforms and cleanup work on copies of the meshes, so the
+            # originals are never modified. The originals keep a fake user
+            # while swapped out, so they survive a save if Blender crashes.
+            # Objects sharing a mesh share one copy, so it is processed once
+            # and the exporters still write it once; baked transforms differ
+            # per object, so applying them needs a copy each. Cleaned and
+            # transformed meshes are written straight from the original
+            # through a bmesh instead of copying it first.
+            clean_while_copying = settings.cleanup_mesh and not settings.apply_transforms
+            if settings.apply_transforms or settings.cleanup_mesh or settings.atlas_textures:
+                with timer.stage('cleanup' if clean_while_copying else 'copy'):
+                    working_copies = {}
+                    fake_users = {}
+                    for mesh_obj in all_objects:
+                        if mesh_obj.type == 'MESH' and mesh_obj.data is not None:
+                            original = mesh_obj.data
+                            fake_user = fake_users.setdefault(original, original.use_fake_user)
+                            original_mesh_data[mesh_obj.name] = (original, fake_user)
+                            original.use_fake_user = True
+                            key = mesh_obj if settings.apply_transforms else original
+                            if key not in working_copies:
+                                if settings.apply_transforms:
+                                    # Left empty until the transforms are applied
+                                    working = bpy.data.meshes.new(original.name)
+                                elif clean_while_copying:
+                                    working = self.cleaned_mesh(original, settings)
+                                else:
+                                    working = original.copy()
+                                # Exporters name meshes after the datablock, so the
+                                # working copy takes the original's name meanwhile
+                                if original not in mesh_names and original.library is None:
+                                    mesh_names[original] = original.name
+                                    original.name = original.name + _ORIGINAL_MESH_SUFFIX
+                                    working.name = mesh_names[original]
+                                working_copies[key] = working
+                            mesh_obj.data = working_copies[key]
 
-            # Apply transforms if enabled (store originals for restoration)
-            original_transforms = {}
             if settings.apply_transforms:
                 for t_obj in all_objects:
-                    original_transforms[t_obj.name] = {
-                        'location': t_obj.location.copy(),
-                        'rotation': t_obj.rotation_euler.copy(),
-                        'scale': t_obj.scale.copy(),
-                    }
-                bpy.ops.object.transform_apply(
-                    location=settings.apply_location,
-                    rotation=settings.apply_rotation,
-                    scale=settings.apply_scale,
-                )
+                    original_transforms[t_obj.name] = (t_obj.matrix_basis.copy(), t_obj.matrix_parent_inverse.copy())
 
-            # Store original mesh data for cleanup restoration (for all mesh objects)
-            original_mesh_data = {}
-            if settings.cleanup_mesh:
-                for mesh_obj in all_objects:
-                    if mesh_obj.type == 'MESH':
-                        # Create a copy of the original mesh data
-                        original_mesh_data[mesh_obj.name] = mesh_obj.data.copy()
-                        # Apply cleanup operations
-                        self.apply_mesh_cleanup(mesh_obj, settings)
+            if self.journal is not None:
+                self.journal.item_start(obj.name, original_transforms, original_mesh_data, mesh_names, all_objects)
+
+            # Apply transforms if enabled (restored from the stored matrices).
+            # The operator runs on the empty working meshes, and whatever it
+            # moved out of each object's transform is then baked into its
+            # working mesh along with the cleanup.
+            if settings.apply_transforms:
+                with timer.stage('transforms'):
+                    world_matrices = {
+                        o.name: o.matrix_world.copy() for o in all_objects if o.name in original_mesh_data
+                    }
+                    bpy.ops.object.transform_apply(
+                        location=settings.apply_location,
+                        rotation=settings.apply_rotation,
+                        scale=settings.apply_scale,
+                    )
+                    context.view_layer.update()
+                with timer.stage('cleanup' if settings.cleanup_mesh else 'transforms'):
+                    for mesh_obj in all_objects:
+                        if mesh_obj.name in original_mesh_data:
+                            original = original_mesh_data[mesh_obj.name][0]
+                            target = mesh_obj.data
+                            matrix = mesh_obj.matrix_world.inverted_safe() @ world_matrices[mesh_obj.name]
+                            working = self.cleaned_mesh(original, settings, matrix, target)
+                            if working != target:
+                                name = target.name
+                                mesh_obj.data = working
+                                bpy.data.meshes.remove(target)
+                                working.name = name
 
             # Convert materials to unlit if needed
-            unlit_restore_data = []
             if settings.material_mode == 'UNLIT':
-                unlit_restore_data = self.convert_materials_unlit(all_objects)
-
-            # Get triangle count for report (after cleanup if applied) - includes children
-            triangle_count = self.get_hierarchy_triangle_count(obj)
+                with timer.stage('unlit'):
+                    unlit_restore_data = self.convert_materials_unlit(all_objects)
+                if self.journal is not None:
+                    self.journal.item_unlit(obj.name, unlit_restore_data)
+
+            # Merge materials that only differ in their images, sharing atlas textures
+            atlas_info = ""
+            if settings.atlas_textures:
+                with timer.stage('atlas'):
+                    atlas_blocks, merged_count, page_count = self.build_texture_atlas(all_objects, base_name, settings)
+                if merged_count:
+                    atlas_info = f", {merged_count} materials in {page_count} atlas(es)"
+
+            # Get mesh statistics for report (after cleanup if applied) - includes children
+            with timer.stage('stats'):
+                mesh_stats = self.get_hierarchy_stats(all_objects, context.evaluated_depsgraph_get())
 
             # Get textures for this object and all children
             images = self.get_hierarchy_textures(obj)
-            texture_info = f"{len(images)} texture(s)" if images else ""
-
-            # Global texture resizing (applies to all formats)
-            original_sizes = {}
-            if settings.resize_textures:
-                max_size = int(settings.max_texture_size)
-                for img in images:
-                    if img.size[0] > max_size or img.size[1] > max_size:
-                        original_sizes[img.name] = (img.size[0], img.size[1])
-                        ratio = min(max_size / img.size[0], max_size / img.size[1])
-                        new_width = int(img.size[0] * ratio)
-                        new_height = int(img.size[1] * ratio)
-                        img.scale(new_width, new_height)
-
-            # Power-of-two texture resize
-            pot_original_sizes = {}
-            if settings.force_pot_textures:
-                pot_original_sizes = self.apply_pot_resize(images, settings)
-
-            # Export GLB
-            if settings.export_glb:
-                filepath = os.path.join(output_dir, f"{base_name}.glb")
-                try:
-                    export_kwargs = {
-                        'filepath': filepath,
-                        'export_format': 'GLB',
-                        'use_selection': True,
-                        'export_apply': True,
-                        'export_yup': settings.export_axis_up == 'Y',
-                        'export_animations': settings.export_animation,
-                    }
+            texture_info = f"{len(images)} texture(s){atlas_info}" if images else ""
+
+            # Texture resizing (max size and power-of-two, applies to all formats).
+            # Resized copies are shared across the batch; originals stay untouched.
+            resized = {}
+            if settings.resize_textures or settings.force_pot_textures:
+                with timer.stage('textures'):
+                    resized, texture_swaps = self.swap_resized_textures(all_objects, images, settings)
+
+            formats = {f for f in ('GLB', 'USDZ', 'FBX') if getattr(settings, f"export_{f.lower()}")}
+            embed_lods = settings.generate_lods and settings.lod_mode == 'MSFT_LOD' and 'GLB' in formats
+
+            budget = None
+            lod_formats = formats
+            lod_triangles = {}
+            if settings.enforce_budget and (settings.budget_triangles or settings.budget_size_mb):
+                # Search for settings that fit the budget; the last attempt's files are kept
+                budget, resized, lod_triangles = self.export_within_budget(
+                    context, all_objects, images, base_name, formats, item_errors, timer,
+                    texture_swaps, budget_modifiers, embed_lods)
+                if embed_lods:
+                    # The budget search measured and kept the GLB with its LODs embedded
+                    lod_formats = formats - {'GLB'}
+                with timer.stage('stats'):
+                    mesh_stats = self.get_hierarchy_stats(all_objects, context.evaluated_depsgraph_get())
+            else:
+                self.export_formats(context, all_objects, base_name, formats - {'GLB'} if embed_lods else formats,
+                                    item_errors, timer)
+
+            # Resolutions the textures are exported at
+            texture_sizes = []
+            for img in sorted(images, key=lambda image: image.name):
+                exported = resized.get(img, img)
+                texture_size = {'name': img.name, 'width': exported.size[0], 'height': exported.size[1]}
+                if exported is not img:
+                    # Name the texture carries in the exported files
+                    texture_size['exported_name'] = exported.name
+                texture_sizes.append(texture_size)
+
+            # Decimated LOD variants (the GLB is written here when it embeds them)
+            lod_base_names = []
+            if settings.generate_lods:
+                lod_base_names, lod_counts = self.export_lods(
+                    context, all_objects, base_name, lod_formats, embed_lods and 'GLB' in lod_formats,
+                    item_errors, timer)
+                lod_triangles.update(lod_counts)
 
-                    # Draco settings
-                    if settings.enable_draco:
-                        export_kwargs['export_draco_mesh_compression_enable'] = True
-                        export_kwargs['export_draco_mesh_compression_level'] = settings.draco_compression_level
-                        export_kwargs['export_draco_position_quantization'] = settings.draco_position_quantization
-                        export_kwargs['export_draco_normal_quantization'] = settings.draco_normal_quantization
-                        export_kwargs['export_draco_texcoord_quantization'] = settings.draco_texcoord_quantization
-                    else:
-                        export_kwargs['export_draco_mesh_compression_enable'] = False
-
-                    # Texture settings
-                    if settings.texture_compression == 'JPEG':
-                        export_kwargs['export_image_format'] = 'JPEG'
-                        export_kwargs['export_jpeg_quality'] = settings.texture_quality
-                    elif settings.texture_compression == 'WEBP':
-                        export_kwargs['export_image_format'] = 'WEBP'
-                    else:
-                        export_kwargs['export_image_format'] = 'AUTO'
+            # Collect file sizes and report data for this object
+            exported_formats = []
+            exported_files = []
+            total_file_size = 0
 
-                    bpy.ops.export_scene.gltf(**export_kwargs)
-                    success_count += 1
-                except Exception as e:
-                    self.report({'WARNING'}, f"GLB export failed for {base_name}: {str(e)}")
-                    error_count += 1
+            for file_base in [base_name] + lod_base_names:
+                for file_format in ('GLB', 'USDZ', 'FBX'):
+                    if file_format not in formats:
+                        continue
+                    path = os.path.join(output_dir, f"{file_base}.{file_format.lower()}")
+                    if os.path.exists(path):
+                        total_file_size += os.path.getsize(path)
+                        if file_format not in exported_formats:
+                            exported_formats.append(file_format)
+                        exported_files.append(os.path.basename(path))
+
+            if self.journal is not None:
+                for file_format in ('GLB', 'USDZ', 'FBX'):
+                    if getattr(settings, f"export_{file_format.lower()}"):
+                        self.journal.item_format(obj.name, file_format, file_format not in item_errors)
 
-            # Export USDZ
-            if settings.export_usdz:
-                filepath = os.path.join(output_dir, f"{base_name}.usdz")
+            # Add to report data
+            report_item = {
+                'object_name': base_name,
+                'triangles': mesh_stats['triangles'],
+                'vertices': mesh_stats['vertices'],
+                'uv_sets': mesh_stats['uv_sets'],
+                'materials': mesh_stats['materials'],
+                'file_size': total_file_size,
+                'format': ', '.join(exported_formats),
+                'files': exported_files,
+                'textures': texture_info,
+                'success': len(exported_files) > 0,
+                'error': '; '.join(f"{fmt}: {message}" for fmt, message in item_errors.items()) or None,
+                'format_errors': item_errors,
+                'texture_sizes': texture_sizes,
+                'lods': [{'level': level, 'triangles': count} for level, count in sorted(lod_triangles.items())],
+                'budget': budget,
+                'content_hash': content_hash,
+                'timings': timer.stages,
+            }
+            _export_report_data['items'].append(report_item)
+            _export_report_data['total_size'] += total_file_size
+            _export_report_data['total_files'] += len(exported_files)
+
+            if self.export_cache is not None and report_item['success'] and not item_errors:
+                self.export_cache.store(base_name, content_hash, report_item)
+
+            _log_export_progress(base_name, report_item['format'] or "FAILED", total_file_size)
+
+        finally:
+            with timer.stage('restore'):
+                # Point texture nodes back at the original images
+                if texture_swaps:
+                    self.texture_cache.restore(texture_swaps)
+
+                # Remove budget decimation
+                for mesh_obj, modifier in budget_modifiers:
+                    mesh_obj.modifiers.remove(modifier)
+
+                # Put the original meshes back and drop the working copies
+                if original_mesh_data:
+                    working_meshes = set()
+                    for mesh_obj in all_objects:
+                        if mesh_obj.name in original_mesh_data:
+                            original, fake_user = original_mesh_data[mesh_obj.name]
+                            working_meshes.add(mesh_obj.data)
+                            mesh_obj.data = original
+                            original.use_fake_user = fake_user
+                    bpy.data.batch_remove(list(working_meshes))
+                    for original, name in mesh_names.items():
+                        original.name = name
+
+                # Restore original transforms
+                if original_transforms:
+                    for t_obj in all_objects:
+                        if t_obj.name in original_transforms:
+                            t_obj.matrix_basis, t_obj.matrix_parent_inverse = original_transforms[t_obj.name]
+
+                # Restore materials from unlit
+                if unlit_restore_data:
+                    self.restore_materials_from_unlit(unlit_restore_data)
+
+                # Remove the atlased materials and atlas images
+                if atlas_blocks:
+                    bpy.data.batch_remove(atlas_blocks)
+
+            if self.journal is not None:
+                self.journal.item_done(obj.name)
+
+        # Stream once restored, so the record carries the complete timings
+        if self.report_writer is not None:
+            self.report_writer.write_item(report_item)
+
+    def select_hierarchy(self, context, all_objects):
+        """Select exactly the hierarchy being exported, with its root active."""
+        bpy.ops.object.select_all(action='DESELECT')
+        for hierarchy_obj in all_objects:
+            hierarchy_obj.select_set(True)
+        context.view_layer.objects.active = all_objects[0]
 
-                if settings.usdz_optimize_via_glb:
-                    # Optimize via GLB pipeline
-                    try:
-                        import tempfile
-
-                        # Create temp GLB path
-                        temp_dir = tempfile.gettempdir()
-                        temp_glb = os.path.join(temp_dir, f"_nexus_temp_{base_name}.glb")
-
-                        # Export compressed GLB
-                        glb_kwargs = {
-                            'filepath': temp_glb,
-                            'export_format': 'GLB',
-                            'use_selection': True,
-                            'export_apply': True,
-                            'export_yup': settings.export_axis_up == 'Y',
-                            'export_animations': settings.export_animation,
-                        }
+    def swap_resized_textures(self, all_objects, images, settings):
+        """Swap resized copies of the images into the hierarchy's materials.
 
-                        # Draco compression
-                        if settings.usdz_use_draco:
-                            glb_kwargs['export_draco_mesh_compression_enable'] = True
-                            glb_kwargs['export_draco_mesh_compression_level'] = settings.draco_compression_level
-                            glb_kwargs['export_draco_position_quantization'] = settings.draco_position_quantization
-                            glb_kwargs['export_draco_normal_quantization'] = settings.draco_normal_quantization
-                            glb_kwargs['export_draco_texcoord_quantization'] = settings.draco_texcoord_quantization
-                        else:
-                            glb_kwargs['export_draco_mesh_compression_enable'] = False
-
-                        # Texture compression
-                        if settings.usdz_texture_compression == 'JPEG':
-                            glb_kwargs['export_image_format'] = 'JPEG'
-                            glb_kwargs['export_jpeg_quality'] = settings.usdz_texture_quality
-                        elif settings.usdz_texture_compression == 'WEBP':
-                            glb_kwargs['export_image_format'] = 'WEBP'
-                        else:
-                            glb_kwargs['export_image_format'] = 'AUTO'
+        Returns the dict of image -> resized copy and the swaps to restore."""
+        resized = {}
+        for img in images:
+            if img.size[0] <= 0 or img.size[1] <= 0:
+                continue
+            size = self.get_texture_target_size(img, settings)
+            if size != (img.size[0], img.size[1]):
+                resized[img] = self.texture_cache.get(img, *size)
+        return resized, self.texture_cache.swap_in(all_objects, resized)
+
+    def build_texture_atlas(self, all_objects, base_name, settings):
+        """Merge materials that differ only in their images into atlased copies.
+
+        The images of each group of matching materials are packed into
+        atlas pages no larger than the maximum texture size (power-of-two
+        if forced). Every page gets one copy of the group's material with
+        the atlases in its image nodes, and the UVs of the working mesh
+        copies are remapped into each material's region. Materials with
+        UVs outside 0-1, object-linked slots or no UV map are left alone.
+        Returns the temporary materials and images for export_item to
+        remove, the number of merged materials and the number of pages."""
+        padding = settings.atlas_padding
+        page_size = int(settings.max_texture_size)
+        if settings.force_pot_textures:
+            page_size = self.nearest_pot(page_size, 'DOWN')
+
+        # Candidate materials and the mesh objects that use them
+        keys = {}
+        excluded = set()
+        mesh_objects = [o for o in all_objects if o.type == 'MESH' and o.data is not None]
+        for mesh_obj in mesh_objects:
+            has_uvs = any(layer.active_render for layer in mesh_obj.data.uv_layers)
+            for slot in mesh_obj.material_slots:
+                mat = slot.material
+                if mat is None:
+                    continue
+                if mat not in keys:
+                    keys[mat] = _atlas_material_key(mat)
+                if slot.link != 'DATA' or not has_uvs:
+                    excluded.add(mat)
+
+        # UVs outside 0-1 rely on the texture repeating, which an atlas can't do
+        layouts = {}
+        for mesh_obj in mesh_objects:
+            slots = mesh_obj.material_slots
+            if mesh_obj.data in layouts or not any(keys.get(slot.material) and slot.material not in excluded for slot in slots):
+                continue
+            mesh = mesh_obj.data
+            uv_layer = next(layer for layer in mesh.uv_layers if layer.active_render)
+            loop_materials = _loop_material_indices(mesh)
+            uvs = array.array('f', [0]) * (len(mesh.loops) * 2)
+            uv_layer.data.foreach_get('uv', uvs)
+            outside = set()
+            for i, index in enumerate(loop_materials):
+                u, v = uvs[2 * i], uvs[2 * i + 1]
+                if u < -0.001 or u > 1.001 or v < -0.001 or v > 1.001:
+                    outside.add(index)
+            for index in outside:
+                if index < len(slots) and slots[index].material:
+                    excluded.add(slots[index].material)
+            layouts[mesh] = (mesh_obj, uv_layer, loop_materials, uvs)
+
+        groups = {}
+        for mat, key in keys.items():
+            if key and mat not in excluded:
+                groups.setdefault(key, []).append(mat)
+
+        blocks = []
+        regions = {}
+        page_count = 0
+        for materials in groups.values():
+            # A material on its own gains nothing from an atlas
+            if len(materials) < 2:
+                continue
+            materials.sort(key=lambda m: m.name)
+
+            sizes = []
+            for index, mat in enumerate(materials):
+                widths, heights = zip(*(self.get_texture_target_size(node.image, settings)
+                                        for node in mat.node_tree.nodes if node.type == 'TEX_IMAGE'))
+                sizes.append((index, max(widths), max(heights)))
+
+            for placements in _pack_atlas(sizes, page_size, padding):
+                width = max(x + w + padding for _, x, _, w, _ in placements)
+                height = max(y + h + padding for _, _, y, _, h in placements)
+                if settings.force_pot_textures:
+                    width, height = self.nearest_pot(width, 'UP'), self.nearest_pot(height, 'UP')
+
+                # One buffer per image role, filled with every material's image for that role
+                buffers = {}
+                for index, x, y, w, h in placements:
+                    for node in materials[index].node_tree.nodes:
+                        if node.type != 'TEX_IMAGE':
+                            continue
+                        role = _atlas_node_role(node)
+                        if role not in buffers:
+                            buffers[role] = np.zeros((height, width, 4), dtype=np.float32)
+                        image = node.image
+                        if (image.size[0], image.size[1]) != (w, h):
+                            image = self.texture_cache.get(image, w, h)
+                        pixels = np.empty(w * h * 4, dtype=np.float32)
+                        image.pixels.foreach_get(pixels)
+                        _blit_padded(buffers[role], pixels.reshape(h, w, 4), x, y, padding)
+
+                atlases = {}
+                for role_index, (role, pixels) in enumerate(sorted(buffers.items())):
+                    atlas = bpy.data.images.new(f"{base_name}_atlas{page_count}_{role_index}", width, height,
+                                                alpha=True)
+                    blocks.append(atlas)
+                    atlas.colorspace_settings.name = role[1]
+                    atlas.alpha_mode = role[2]
+                    atlas.pixels.foreach_set(pixels.ravel())
+                    # Packed, so every exporter can write (or embed) it like a file
+                    atlas.pack()
+                    atlases[role] = atlas
+
+                page_material = materials[placements[0][0]].copy()
+                page_material.name = f"{base_name}_atlas{page_count}"
+                blocks.append(page_material)
+                for node in page_material.node_tree.nodes:
+                    if node.type == 'TEX_IMAGE':
+                        node.image = atlases[_atlas_node_role(node)]
+
+                for index, x, y, w, h in placements:
+                    regions[materials[index]] = (page_material, x / width, y / height, w / width, h / height)
+                page_count += 1
+
+        # Move the faces of merged materials onto the atlased copies, once per shared mesh
+        for mesh, (mesh_obj, uv_layer, loop_materials, uvs) in layouts.items():
+            remap = {}
+            for index, slot in enumerate(mesh_obj.material_slots):
+                if slot.material not in regions:
+                    continue
+                page_material = regions[slot.material][0]
+                target = next((i for i, m in enumerate(mesh.materials) if m == page_material), None)
+                if target is None:
+                    mesh.materials.append(page_material)
+                    target = len(mesh.materials) - 1
+                remap[index] = (target,) + regions[slot.material][1:]
+            if not remap:
+                continue
 
-                        bpy.ops.export_scene.gltf(**glb_kwargs)
+            for i, index in enumerate(loop_materials):
+                region = remap.get(index)
+                if region is not None:
+                    uvs[2 * i] = region[1] + uvs[2 * i] * region[3]
+                    uvs[2 * i + 1] = region[2] + uvs[2 * i + 1] * region[4]
+            uv_layer.data.foreach_set('uv', uvs)
+
+            indices = array.array('i', [0]) * len(mesh.polygons)
+            mesh.polygons.foreach_get('material_index', indices)
+            for i, index in enumerate(indices):
+                if index in remap:
+                    indices[i] = remap[index][0]
+            mesh.polygons.foreach_set('material_index', indices)
+
+            # Drop the now unused slots; popping shifts the later material indices down
+            for index in sorted(remap, reverse=True):
+                mesh.materials.pop(index=index)
+            mesh.update()
+
+        return blocks, len(regions), page_count
+
+    def budget_overrides(self, quality):
+        """Settings to export with at a quality level between 0 (smallest) and 1 (as configured)."""
+        settings = self.settings
+
+        def scale(value, floor):
+            return round(min(value, floor) + quality * (value - min(value, floor)))
+
+        base_max = int(settings.max_texture_size) if settings.resize_textures else 8192
+        sizes = [size for size in _BUDGET_TEXTURE_SIZES if size <= base_max] or [base_max]
+        return {
+            'resize_textures': True,
+            'max_texture_size': str(sizes[round(quality * (len(sizes) - 1))]),
+            'texture_quality': scale(settings.texture_quality, 30),
+            'usdz_texture_quality': scale(settings.usdz_texture_quality, 30),
+            'draco_position_quantization': scale(settings.draco_position_quantization, 8),
+            'draco_normal_quantization': scale(settings.draco_normal_quantization, 6),
+            'draco_texcoord_quantization': scale(settings.draco_texcoord_quantization, 8),
+        }
 
-                        # Track objects before import
-                        objects_before = set(bpy.data.objects)
+    def export_within_budget(self, context, all_objects, images, base_name, formats, item_errors, timer,
+                             texture_swaps, budget_modifiers, embed_lods=False):
+        """Export the hierarchy with the highest quality that fits the triangle and file size budget.
+
+        Triangles are brought under budget with a Decimate modifier first.
+        File size is then met by binary search over a quality level that
+        scales extra decimation, maximum texture size, texture quality and
+        Draco quantization together, re-exporting at most
+        budget_max_attempts times. texture_swaps and budget_modifiers are
+        filled in for export_item to undo. With embed_lods, each attempt
+        writes the GLB with its MSFT_lod levels, so the file that is measured
+        is the one that ships. Returns the chosen parameters for the report,
+        the dict of resized textures and the triangle count per embedded LOD."""
+        settings = self.settings
+        max_triangles = settings.budget_triangles
+        max_bytes = int(settings.budget_size_mb * 1024 * 1024)
+        start_counts = (self.success_count, self.error_count)
+
+        # Exports run against the originals again, with the budget's own resizing
+        self.texture_cache.restore(texture_swaps)
+        texture_swaps.clear()
+
+        for mesh_obj in all_objects:
+            if mesh_obj.type == 'MESH':
+                budget_modifiers.append((mesh_obj, mesh_obj.modifiers.new(_BUDGET_TAG, 'DECIMATE')))
+
+        state = {'triangle_ratio': 1.0, 'resized': {}, 'lod_triangles': {}}
+
+        def attempt(quality):
+            with timer.stage('budget'):
+                # Decimate until the hierarchy is under the triangle budget
+                ratio = state['triangle_ratio'] * (0.25 + 0.75 * quality)
+                for _ in range(4):
+                    for mesh_obj, modifier in budget_modifiers:
+                        modifier.ratio = min(ratio, 1.0)
+                        # An idle modifier would stop the exporters sharing linked meshes
+                        modifier.show_viewport = ratio < 1.0
+                    triangles = self.get_hierarchy_stats(all_objects, context.evaluated_depsgraph_get())['triangles']
+                    if not max_triangles or triangles <= max_triangles or ratio <= 0.001:
+                        break
+                    ratio *= 0.98 * max_triangles / triangles
+                    state['triangle_ratio'] = ratio / (0.25 + 0.75 * quality)
+
+                overrides = self.budget_overrides(quality)
+                view = _SettingsOverride(settings, **overrides)
+                self.texture_cache.restore(texture_swaps)
+                texture_swaps.clear()
+                state['resized'], swaps = self.swap_resized_textures(all_objects, images, view)
+                texture_swaps.extend(swaps)
+
+            errors = {}
+            self.success_count, self.error_count = start_counts
+            self.settings = view
+            try:
+                if embed_lods:
+                    self.export_formats(context, all_objects, base_name, formats - {'GLB'}, errors, timer)
+                    _, state['lod_triangles'] = self.export_lods(
+                        context, all_objects, base_name, {'GLB'}, True, errors, timer)
+                else:
+                    self.export_formats(context, all_objects, base_name, formats, errors, timer)
+            finally:
+                self.settings = settings
+
+            largest = 0
+            for file_format in formats:
+                path = os.path.join(self.output_dir, f"{base_name}.{file_format.lower()}")
+                if os.path.exists(path):
+                    largest = max(largest, os.path.getsize(path))
+            fits = (not errors
+                    and (not max_triangles or triangles <= max_triangles)
+                    and (not max_bytes or largest <= max_bytes))
+            result = dict(overrides, quality=round(quality, 3), decimation=round(min(ratio, 1.0), 4),
+                          triangles=triangles, largest_file=largest)
+            return fits, errors, result
+
+        fits, errors, result, attempts = _search_budget_quality(attempt, settings.budget_max_attempts)
+        item_errors.update(errors)
+        if not fits and not errors:
+            message = (f"over budget after {attempts} attempt(s): {result['triangles']:,} triangles, "
+                       f"largest file {result['largest_file'] / (1024 * 1024):.2f} MB")
+            self.report({'WARNING'}, f"{base_name} is {message}")
+            item_errors['BUDGET'] = message
+            self.error_count += 1
+
+        result.update(met=fits, attempts=attempts,
+                      max_triangles=max_triangles, max_bytes=max_bytes)
+        return result, state['resized'], state['lod_triangles']
+
+    def export_lods(self, context, all_objects, base_name, formats, embed, item_errors, timer):
+        """Export decimated LOD1..LODn variants of the selected hierarchy.
+
+        Each level keeps lod_ratio of the previous level's triangles, via a
+        temporary Decimate modifier that the exporters apply. With embed,
+        the GLB is exported here with every level as MSFT_lod alternatives
+        of its mesh nodes; the other formats always get separate _lod<n>
+        files. Returns the base names of the LOD files written and the
+        triangle count per level."""
+        settings = self.settings
+        mesh_objects = [o for o in all_objects if o.type == 'MESH']
+        levels = range(1, settings.lod_count + 1)
+        lod_base_names = []
+        lod_triangles = {}
+
+        if embed:
+            lod_objects = {}
+            try:
+                with timer.stage('lods'):
+                    for level in levels:
+                        for mesh_obj in mesh_objects:
+                            lod_obj = mesh_obj.copy()
+                            lod_obj.name = f"{mesh_obj.name}_LOD{level}"
+                            lod_obj[_LOD_TAG] = True
+                            context.scene.collection.objects.link(lod_obj)
+                            modifier = lod_obj.modifiers.new(_LOD_TAG, 'DECIMATE')
+                            modifier.ratio = settings.lod_ratio ** level
+                            lod_obj.select_set(True)
+                            lod_objects.setdefault(level, []).append(lod_obj)
+                    depsgraph = context.evaluated_depsgraph_get()
+                    for level in levels:
+                        lod_triangles[level] = self.get_hierarchy_stats(lod_objects[level], depsgraph)['triangles']
+
+                self.export_formats(context, all_objects, base_name, {'GLB'}, item_errors, timer)
+
+                glb_path = os.path.join(self.output_dir, f"{base_name}.glb")
+                if 'GLB' not in item_errors and os.path.exists(glb_path):
+                    with timer.stage('lods'):
+                        alternatives = {
+                            mesh_obj.name: [lod_objects[level][i].name for level in levels]
+                            for i, mesh_obj in enumerate(mesh_objects)
+                        }
+                        coverages = [0.5 * settings.lod_ratio ** level for level in range(len(levels) + 1)]
+                        try:
+                            _embed_msft_lod(glb_path, alternatives, coverages)
+                        except Exception as e:
+                            self.report({'WARNING'}, f"MSFT_lod embedding failed for {base_name}: {e}")
+                            item_errors['GLB'] = f"MSFT_lod: {e}"
+                            self.error_count += 1
+            finally:
+                for objects in lod_objects.values():
+                    for lod_obj in objects:
+                        bpy.data.objects.remove(lod_obj)
+
+        file_formats = formats - {'GLB'} if embed else formats
+        if not file_formats:
+            return lod_base_names, lod_triangles
+
+        modifiers = []
+        try:
+            for mesh_obj in mesh_objects:
+                modifiers.append((mesh_obj, mesh_obj.modifiers.new(_LOD_TAG, 'DECIMATE')))
+            for level in levels:
+                with timer.stage('lods'):
+                    for mesh_obj, modifier in modifiers:
+                        modifier.ratio = settings.lod_ratio ** level
+                    stats = self.get_hierarchy_stats(all_objects, context.evaluated_depsgraph_get())
+                    lod_triangles[level] = stats['triangles']
+
+                lod_base_name = f"{base_name}_lod{level}"
+                self.export_formats(context, all_objects, lod_base_name, file_formats, item_errors, timer,
+                                    error_suffix=f" LOD{level}")
+                lod_base_names.append(lod_base_name)
+        finally:
+            for mesh_obj, modifier in modifiers:
+                mesh_obj.modifiers.remove(modifier)
+
+        return lod_base_names, lod_triangles
+
+    def export_formats(self, context, all_objects, base_name, formats, item_errors, timer, error_suffix=""):
+        """Export the selected hierarchy to each of the given formats as base_name.
+
+        Failures are added to item_errors under the format name plus
+        error_suffix, and counted, without stopping the other formats."""
+        settings = self.settings
+
+        # Export GLB
+        written_glb = None
+        if 'GLB' in formats:
+            with timer.stage('glb'):
+                filepath = os.path.join(self.output_dir, f"{base_name}.glb")
+                try:
+                    export_kwargs = _gltf_export_kwargs(
+                        filepath, settings, settings.enable_draco,
+                        settings.texture_compression, settings.texture_quality, settings.gpu_instancing)
 
-                        # Import the compressed GLB
-                        bpy.ops.import_scene.gltf(filepath=temp_glb)
+                    bpy.ops.export_scene.gltf(**export_kwargs)
+                    self.success_count += 1
+                    written_glb = export_kwargs
+                except Exception as e:
+                    self.report({'WARNING'}, f"GLB export failed for {base_name}: {str(e)}")
+                    item_errors['GLB' + error_suffix] = str(e)
+                    self.error_count += 1
+
+            if (settings.texture_compression == 'KTX2' and self.ktx2_encoder
+                    and 'GLB' + error_suffix not in item_errors):
+                # The importer can't read KTX2 textures, so the file is no use to USDZ
+                written_glb = None
+                with timer.stage('ktx2'):
+                    try:
+                        _compress_glb_textures_ktx2(filepath, self.ktx2_encoder, settings)
+                    except Exception as e:
+                        self.report({'WARNING'}, f"KTX2 texture encoding failed for {base_name}: {e}")
+                        item_errors['GLB' + error_suffix] = f"KTX2: {e}"
+                        self.error_count += 1
 
-                        # Find newly imported objects
-                        imported_objects = set(bpy.data.objects) - objects_before
+        # Export USDZ
+        if 'USDZ' in formats:
+            with timer.stage('usdz'):
+                filepath = os.path.join(self.output_dir, f"{base_name}.usdz")
 
-                        # Select only imported objects
-                        bpy.ops.object.select_all(action='DESELECT')
-                        for imp_obj in imported_objects:
-                            imp_obj.select_set(True)
-                            context.view_layer.objects.active = imp_obj
+                if settings.usdz_optimize_via_glb and settings.usdz_optimize_method == 'GLB':
+                    # Optimize via GLB pipeline
+                    temp_glb = None
+                    try:
+                        glb_kwargs = _gltf_export_kwargs(
+                            None, settings, settings.usdz_use_draco,
+                            settings.usdz_texture_compression, settings.usdz_texture_quality)
 
-                        # Activate NLA strip actions for USD animation export.
-                        # GLB import puts most animations into NLA tracks only,
-                        # but Blender's USD exporter requires an active action.
-                        if settings.export_animation:
+                        # The GLB just written is the same file when its compression matches
+                        if written_glb and dict(written_glb, filepath=None) == glb_kwargs:
+                            source_glb = written_glb['filepath']
+                        else:
+                            temp_glb = os.path.join(tempfile.gettempdir(), f"_nexus_temp_{base_name}.glb")
+                            glb_kwargs['filepath'] = temp_glb
+                            bpy.ops.export_scene.gltf(**glb_kwargs)
+                            source_glb = temp_glb
+
+                        # Record every datablock that exists before import
+                        datablocks_before = _snapshot_datablocks()
+                        try:
+                            # Import the compressed GLB
+                            bpy.ops.import_scene.gltf(filepath=source_glb)
+
+                            # Find newly imported objects
+                            imported_objects = [o for o in bpy.data.objects if o not in datablocks_before['objects']]
+
+                            # Select only imported objects
+                            bpy.ops.object.select_all(action='DESELECT')
                             for imp_obj in imported_objects:
-                                ad = imp_obj.animation_data
-                                if ad and not ad.action and ad.nla_tracks:
-                                    for track in ad.nla_tracks:
-                                        for strip in track.strips:
-                                            if strip.action:
-                                                ad.action = strip.action
+                                imp_obj.select_set(True)
+                                context.view_layer.objects.active = imp_obj
+
+                            # Activate NLA strip actions for USD animation export.
+                            # GLB import puts most animations into NLA tracks only,
+                            # but Blender's USD exporter requires an active action.
+                            if settings.export_animation:
+                                for imp_obj in imported_objects:
+                                    ad = imp_obj.animation_data
+                                    if ad and not ad.action and ad.nla_tracks:
+                                        for track in ad.nla_tracks:
+                                            for strip in track.strips:
+                                                if strip.action:
+                                                    ad.action = strip.action
+                                                    break
+                                            if ad.action:
                                                 break
-                                        if ad.action:
-                                            break
-
-                        # Export USDZ from imported objects
-                        usd_kwargs = {
-                            'filepath': filepath,
-                            'selected_objects_only': True,
-                            'export_animation': settings.export_animation,
-                            'export_armatures': settings.export_armatures,
-                            'export_shapekeys': settings.export_shapekeys,
-                        }
-                        needs_convert = (settings.export_axis_up != 'Z' or settings.export_axis_forward != 'Y')
-                        if needs_convert:
-                            usd_kwargs['convert_orientation'] = True
-                            usd_kwargs['export_global_up_selection'] = _map_axis_to_usd_enum(settings.export_axis_up)
-                            usd_kwargs['export_global_forward_selection'] = _map_axis_to_usd_enum(settings.export_axis_forward)
-                        bpy.ops.wm.usd_export(**usd_kwargs)
-
-                        # Cleanup: delete imported objects and their data
-                        bpy.ops.object.delete()
-
-                        # Remove orphan meshes and materials from import
-                        for block in bpy.data.meshes:
-                            if block.users == 0:
-                                bpy.data.meshes.remove(block)
-                        for block in bpy.data.materials:
-                            if block.users == 0:
-                                bpy.data.materials.remove(block)
-                        for block in bpy.data.images:
-                            if block.users == 0:
-                                bpy.data.images.remove(block)
-
-                        # Delete temp GLB file
-                        if os.path.exists(temp_glb):
-                            os.remove(temp_glb)
 
-                        success_count += 1
+                            # Export USDZ from imported objects
+                            bpy.ops.wm.usd_export(**_usd_export_kwargs(filepath, settings))
+                        finally:
+                            # Remove exactly what the import created, in one batch
+                            _remove_new_datablocks(datablocks_before)
+                            # The formats that follow export the hierarchy's selection
+                            self.select_hierarchy(context, all_objects)
+
+                        self.success_count += 1
 
                     except Exception as e:
                         self.report({'WARNING'}, f"USDZ export failed for {base_name}: {str(e)}")
-                        error_count += 1
-                        # Cleanup temp file on error
-                        if 'temp_glb' in locals() and os.path.exists(temp_glb):
+                        item_errors['USDZ' + error_suffix] = str(e)
+                        self.error_count += 1
+                    finally:
+                        # Delete the temp GLB, if one was written
+                        if temp_glb and os.path.exists(temp_glb):
                             os.remove(temp_glb)
                 else:
-                    # Direct USDZ export (no optimization)
+                    # Direct USDZ export, re-encoding textures when optimizing
                     try:
-                        usd_kwargs = {
-                            'filepath': filepath,
-                            'selected_objects_only': True,
-                            'export_animation': settings.export_animation,
-                            'export_armatures': settings.export_armatures,
-                            'export_shapekeys': settings.export_shapekeys,
-                        }
-                        needs_convert = (settings.export_axis_up != 'Z' or settings.export_axis_forward != 'Y')
-                        if needs_convert:
-                            usd_kwargs['convert_orientation'] = True
-                            usd_kwargs['export_global_up_selection'] = _map_axis_to_usd_enum(settings.export_axis_up)
-                            usd_kwargs['export_global_forward_selection'] = _map_axis_to_usd_enum(settings.export_axis_forward)
-                        bpy.ops.wm.usd_export(**usd_kwargs)
-                        success_count += 1
+                        self.export_usdz_direct(all_objects, filepath, settings)
+                        self.success_count += 1
                     except Exception as e:
                         self.report({'WARNING'}, f"USDZ export failed for {base_name}: {str(e)}")
-                        error_count += 1
+                        item_errors['USDZ' + error_suffix] = str(e)
+                        self.error_count += 1
 
-            # Export FBX
-            if settings.export_fbx:
-                filepath = os.path.join(output_dir, f"{base_name}.fbx")
+        # Export FBX
+        if 'FBX' in formats:
+            with timer.stage('fbx'):
+                filepath = os.path.join(self.output_dir, f"{base_name}.fbx")
                 try:
                     bpy.ops.export_scene.fbx(
                         filepath=filepath,
@@ -1381,106 +3275,1518 @@ class NEXUS_OT_process_export(Operator):
                         bake_space_transform=settings.fbx_apply_transform,
                         bake_anim=settings.export_animation,
                     )
-                    success_count += 1
+                    self.success_count += 1
                 except Exception as e:
                     self.report({'WARNING'}, f"FBX export failed for {base_name}: {str(e)}")
-                    error_count += 1
+                    item_errors['FBX' + error_suffix] = str(e)
+                    self.error_count += 1
 
-            # Collect file sizes and report data for this object
-            exported_formats = []
-            total_file_size = 0
+    def prepare_batch(self, context):
+        """Validate the settings, collect the objects to export and reset the report.
 
-            if settings.export_glb:
-                glb_path = os.path.join(output_dir, f"{base_name}.glb")
-                if os.path.exists(glb_path):
-                    size = os.path.getsize(glb_path)
-                    total_file_size += size
-                    exported_formats.append('GLB')
-
-            if settings.export_usdz:
-                usdz_path = os.path.join(output_dir, f"{base_name}.usdz")
-                if os.path.exists(usdz_path):
-                    size = os.path.getsize(usdz_path)
-                    total_file_size += size
-                    exported_formats.append('USDZ')
-
-            if settings.export_fbx:
-                fbx_path = os.path.join(output_dir, f"{base_name}.fbx")
-                if os.path.exists(fbx_path):
-                    size = os.path.getsize(fbx_path)
-                    total_file_size += size
-                    exported_formats.append('FBX')
+        Returns None when the batch can start, otherwise the operator result."""
+        global _export_report_data, _export_override_objects
+        settings = context.scene.nexus_export
 
-            # Add to report data
-            _export_report_data['items'].append({
-                'object_name': base_name,
-                'triangles': triangle_count,
-                'file_size': total_file_size,
-                'format': ', '.join(exported_formats),
-                'textures': texture_info,
-                'success': len(exported_formats) > 0,
-                'error': None,
-            })
-            _export_report_data['total_size'] += total_file_size
-            _export_report_data['total_files'] += len(exported_formats)
-
-            # Restore original texture sizes after all exports for this object
-            if original_sizes:
-                for img_name, (orig_w, orig_h) in original_sizes.items():
-                    img = bpy.data.images.get(img_name)
-                    if img:
-                        img.scale(orig_w, orig_h)
-
-            # Restore POT texture sizes
-            if pot_original_sizes:
-                for img_name, (orig_w, orig_h) in pot_original_sizes.items():
-                    img = bpy.data.images.get(img_name)
-                    if img:
-                        img.scale(orig_w, orig_h)
-
-            # Restore original mesh data after cleanup (for all mesh objects)
-            if original_mesh_data:
-                for mesh_obj in all_objects:
-                    if mesh_obj.name in original_mesh_data:
-                        old_mesh = mesh_obj.data
-                        mesh_obj.data = original_mesh_data[mesh_obj.name]
-                        bpy.data.meshes.remove(old_mesh)
-
-            # Restore original transforms
-            if original_transforms:
-                for t_obj in all_objects:
-                    if t_obj.name in original_transforms:
-                        t = original_transforms[t_obj.name]
-                        t_obj.location = t['location']
-                        t_obj.rotation_euler = t['rotation']
-                        t_obj.scale = t['scale']
+        if _export_progress['running']:
+            self.report({'ERROR'}, "An export is already running")
+            return {'CANCELLED'}
 
-            # Restore materials from unlit
-            if unlit_restore_data:
-                self.restore_materials_from_unlit(unlit_restore_data)
+        # Reset export report
+        _export_report_data = {
+            'items': [],
+            'total_files': 0,
+            'total_size': 0,
+            'errors': 0,
+        }
+
+        # Validation
+        output_dir = bpy.path.abspath(settings.output_directory)
+        if not output_dir or not os.path.isdir(output_dir):
+            self.report({'ERROR'}, "Please set a valid output directory")
+            return {'CANCELLED'}
+
+        if not any([settings.export_glb, settings.export_usdz, settings.export_fbx]):
+            self.report({'ERROR'}, "Please select at least one export format")
+            return {'CANCELLED'}
+
+        # One walker per batch: visibility and children are looked up once per object
+        self.walker = _HierarchyWalker(index_children=True)
+
+        self.ktx2_encoder = None
+        if settings.export_glb and settings.texture_compression == 'KTX2':
+            # Search again if the cached lookup failed, toktx may have been installed since
+            self.ktx2_encoder = _find_ktx2_encoder() or _find_ktx2_encoder(refresh=True)
+            if self.ktx2_encoder is None:
+                self.report({'WARNING'}, "KTX2 encoder (toktx) not found, GLB textures are kept as PNG/JPEG")
+
+        # Use override objects if set (from Export Selected), otherwise use queue
+        self.queue_sources = {}
+        if _export_override_objects is not None:
+            export_objects = list(_export_override_objects)
+            _export_override_objects = None
+        else:
+            export_objects = _resolve_queue(context.scene.nexus_queue, self.walker, self.queue_sources)
+
+        if not export_objects:
+            self.report({'ERROR'}, "No objects selected for export")
+            return {'CANCELLED'}
+
+        self.settings = settings
+        self.output_dir = output_dir
+        self.export_objects = export_objects
+        self.export_names = [obj.name for obj in export_objects]
+        self.export_cache = _ExportCache(output_dir) if settings.skip_unchanged else None
+        return None
+
+    def begin_batch(self, context):
+        """Remember the selection and start the progress display."""
+        self.original_selected = context.selected_objects[:]
+        self.original_active = context.view_layer.objects.active
+
+        self.success_count = 0
+        self.error_count = 0
+        self.skipped_count = 0
+        self.item_index = 0
+        self.texture_cache = _TextureCache()
+        self.report_writer = None
+        if self.settings.write_report_files:
+            self.report_writer = _ReportWriter(self.output_dir, self.resumed_objects())
+        self.journal = None
+        if self.settings.resumable_export:
+            self.journal = _ExportJournal(self.output_dir)
+            self.journal.begin(self.export_names, self.settings)
+        self._timer = None
+
+        _export_progress.update({
+            'running': True,
+            'cancel_requested': False,
+            'index': 0,
+            'total': len(self.export_objects),
+            'current': self.export_names[0],
+            'start_time': time.perf_counter(),
+            'bytes': 0,
+            'log': [],
+        })
+        context.window_manager.progress_begin(0, len(self.export_objects))
+
+    def export_next(self, context):
+        """Export the next object of the batch and advance the progress."""
+        name = self.export_names[self.item_index]
+        total = len(self.export_objects)
+
+        # Update progress bar and status
+        context.window_manager.progress_update(self.item_index)
+        self.report({'INFO'}, f"Exporting {self.item_index + 1}/{total}: {name}")
+
+        try:
+            self.export_item(context, self.export_objects[self.item_index])
+        except Exception as e:
+            # Objects can be deleted between modal steps; never abort the batch
+            self.report({'WARNING'}, f"Export failed for {name}: {e}")
+            base_name = self.settings.export_prefix + name + self.settings.export_suffix
+            failed_item = {
+                'object_name': base_name,
+                'triangles': 0,
+                'file_size': 0,
+                'format': '',
+                'files': [],
+                'textures': '',
+                'success': False,
+                'error': str(e),
+            }
+            _export_report_data['items'].append(failed_item)
+            if self.report_writer is not None:
+                self.report_writer.write_item(failed_item)
+            self.error_count += 1
+            _log_export_progress(base_name, "FAILED")
+
+        self.item_index += 1
+        _export_progress['index'] = self.item_index
+        if self.item_index < total:
+            _export_progress['current'] = self.export_names[self.item_index]
+
+    def finish_batch(self, context, cancelled=False):
+        """Finalize the report, restore the selection and show the summary."""
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
         # Update error count in report
-        _export_report_data['errors'] = error_count
+        _export_report_data['errors'] = self.error_count
+        _export_report_data['elapsed'] = time.perf_counter() - _export_progress['start_time']
         context.window_manager.progress_end()
-
-        # Restore original selection
+        _export_progress['running'] = False
+
+        self.texture_cache.clear()
+        if self.export_cache is not None:
+            self.export_cache.save()
+        if self.report_writer is not None:
+            self.report_writer.close(_export_report_data['items'])
+        if self.journal is not None:
+            self.journal.close(completed=not cancelled)
+        _record_queue_results(context.scene.nexus_queue, self.queue_sources,
+                              _export_report_data['items'], self.settings)
+
+        # Restore original selection (objects may have been deleted meanwhile)
         bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selected:
-            if obj:
+        for obj in self.original_selected:
+            try:
                 obj.select_set(True)
-        if original_active:
-            context.view_layer.objects.active = original_active
+            except ReferenceError:
+                pass
+        try:
+            if self.original_active:
+                context.view_layer.objects.active = self.original_active
+        except ReferenceError:
+            pass
 
-        if error_count == 0:
-            self.report({'INFO'}, f"Successfully exported {success_count} file(s)")
+        if cancelled:
+            self.report({'WARNING'}, f"Export cancelled after {self.item_index} of {len(self.export_objects)} object(s)")
         else:
-            self.report({'WARNING'}, f"Exported {success_count} file(s), {error_count} failed")
+            self.report_summary(self.success_count, self.error_count, self.skipped_count,
+                                _export_report_data['elapsed'])
 
         # Show export report if enabled
-        if settings.show_export_report and _export_report_data['items']:
+        if self.settings.show_export_report and _export_report_data['items']:
             bpy.ops.nexus.show_report('INVOKE_DEFAULT')
 
-        return {'FINISHED'}
+        _redraw_panels()
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
+
+    def execute(self, context):
+        result = self.prepare_batch(context)
+        if result:
+            return result
+
+        # Hand the batch to background worker processes if enabled
+        self.parallel = self.settings.parallel_export and len(self.export_objects) > 1
+        if self.parallel:
+            result = self.begin_parallel(context)
+            if result:
+                return result
+            self.wait_for_workers(context)
+            return self.finish_parallel(context)
+
+        self.begin_batch(context)
+        while self.item_index < len(self.export_objects):
+            self.export_next(context)
+        return self.finish_batch(context)
+
+    def invoke(self, context, event):
+        """Export one object per timer tick so the UI stays responsive (Esc cancels).
+
+        Parallel batches check on their workers every timer tick instead."""
+        result = self.prepare_batch(context)
+        if result:
+            return result
+
+        self.parallel = self.settings.parallel_export and len(self.export_objects) > 1
+        if self.parallel:
+            result = self.begin_parallel(context)
+            if result:
+                return result
+            interval = 0.5
+        else:
+            self.begin_batch(context)
+            interval = 0.01
+        self._timer = context.window_manager.event_timer_add(interval, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        _redraw_panels()
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' or _export_progress['cancel_requested']:
+            if self.parallel:
+                return self.finish_parallel(context, cancelled=True)
+            return self.finish_batch(context, cancelled=True)
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self.parallel:
+            if self.poll_workers(context):
+                return self.finish_parallel(context)
+            _redraw_panels()
+            return {'RUNNING_MODAL'}
+
+        if self.item_index < len(self.export_objects):
+            self.export_next(context)
+            _redraw_panels()
+            return {'RUNNING_MODAL'}
+
+        return self.finish_batch(context)
+
+
+# -----------------------------------------------------------------------------
+# Incremental Export Cache
+# -----------------------------------------------------------------------------
+
+# Settings that do not change the content of the exported files
+_CACHE_IGNORED_SETTINGS = {
+    'platform_preset', 'output_directory', 'show_export_report',
+    'skip_unchanged', 'parallel_export', 'parallel_workers', 'write_report_files',
+    'resumable_export',
+}
+
+_node_ui_properties = None
+
+
+def _rna_value(value):
+    """Convert an RNA property value into something with a stable repr."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    try:
+        return tuple(value)
+    except TypeError:
+        return getattr(value, 'name', repr(value))
+
+
+def _hash_buffer(h, collection, attr, length, typecode='f'):
+    """Feed a flat foreach_get buffer of a bpy collection into a hash."""
+    buf = array.array(typecode, [0]) * length
+    if length:
+        collection.foreach_get(attr, buf)
+    h.update(buf.tobytes())
+
+
+def _hash_image(h, image, seen):
+    """Hash an image by file identity, or by its pixels if it only lives in memory."""
+    h.update(image.name.encode())
+    if ('IMAGE', image.name) in seen:
+        return
+    seen.add(('IMAGE', image.name))
+
+    h.update(f"{image.source}|{image.filepath}|{tuple(image.size)}|"
+             f"{image.colorspace_settings.name}|{image.alpha_mode}".encode())
+    if image.packed_file:
+        h.update(image.packed_file.data)
+    elif image.is_dirty or image.source == 'GENERATED':
+        pixels = array.array('f', [0]) * (image.size[0] * image.size[1] * image.channels)
+        image.pixels.foreach_get(pixels)
+        h.update(pixels.tobytes())
+    else:
+        try:
+            stat = os.stat(bpy.path.abspath(image.filepath, library=image.library))
+            h.update(f"{stat.st_size}|{stat.st_mtime_ns}".encode())
+        except OSError:
+            pass
+
+
+def _hash_node_tree(h, tree, seen, include_images=True):
+    """Hash the nodes, values and links of a (material or group) node tree.
+
+    With include_images off, the images used by image nodes are left out."""
+    global _node_ui_properties
+    if _node_ui_properties is None:
+        _node_ui_properties = {p.identifier for p in bpy.types.Node.bl_rna.properties}
+
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        h.update(f"{node.name}|{node.bl_idname}".encode())
+        for prop in node.bl_rna.properties:
+            if prop.identifier in _node_ui_properties:
+                continue
+            if prop.type in {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}:
+                h.update(f"{prop.identifier}={_rna_value(getattr(node, prop.identifier))!r}".encode())
+        for socket in node.inputs:
+            if not socket.is_linked and hasattr(socket, 'default_value'):
+                h.update(f"{socket.identifier}={_rna_value(socket.default_value)!r}".encode())
+        image = getattr(node, 'image', None)
+        if image and include_images:
+            _hash_image(h, image, seen)
+        group = getattr(node, 'node_tree', None)
+        if group and ('GROUP', group.name) not in seen:
+            seen.add(('GROUP', group.name))
+            _hash_node_tree(h, group, seen, include_images)
+
+    for link in tree.links:
+        h.update(f"{link.from_node.name}.{link.from_socket.identifier}>"
+                 f"{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+
+def _hash_action(h, action):
+    """Hash the keyframes of an action, with the interpolation and handles that shape the sampled curve."""
+    h.update(action.name.encode())
+    for fcurve in action.fcurves:
+        h.update(f"{fcurve.data_path}[{fcurve.array_index}]|{fcurve.extrapolation}".encode())
+        points = fcurve.keyframe_points
+        _hash_buffer(h, points, 'co', len(points) * 2)
+        _hash_buffer(h, points, 'interpolation', len(points), 'i')
+        _hash_buffer(h, points, 'easing', len(points), 'i')
+        _hash_buffer(h, points, 'handle_left', len(points) * 2)
+        _hash_buffer(h, points, 'handle_right', len(points) * 2)
+
+
+def _hash_mesh(h, mesh):
+    """Hash everything of a mesh the exporters write.
+
+    Covers positions, topology, material indices, shading (smooth faces,
+    sharp edges and the resulting corner normals, custom ones included),
+    UVs and color attributes."""
+    h.update(f"{len(mesh.vertices)}|{len(mesh.edges)}|{len(mesh.loops)}|{len(mesh.polygons)}".encode())
+    _hash_buffer(h, mesh.vertices, 'co', len(mesh.vertices) * 3)
+    _hash_buffer(h, mesh.loops, 'vertex_index', len(mesh.loops), 'i')
+    _hash_buffer(h, mesh.polygons, 'loop_total', len(mesh.polygons), 'i')
+    _hash_buffer(h, mesh.polygons, 'material_index', len(mesh.polygons), 'i')
+    _hash_buffer(h, mesh.polygons, 'use_smooth', len(mesh.polygons), 'b')
+    _hash_buffer(h, mesh.edges, 'use_edge_sharp', len(mesh.edges), 'b')
+    if hasattr(mesh, 'corner_normals'):  # Blender 4.1+
+        _hash_buffer(h, mesh.corner_normals, 'vector', len(mesh.loops) * 3)
+    else:
+        h.update(f"custom_normals={mesh.has_custom_normals}".encode())
+        if mesh.has_custom_normals:
+            mesh.calc_normals_split()
+            _hash_buffer(h, mesh.loops, 'normal', len(mesh.loops) * 3)
+    for uv_layer in mesh.uv_layers:
+        h.update(uv_layer.name.encode())
+        _hash_buffer(h, uv_layer.data, 'uv', len(mesh.loops) * 2)
+    for attribute in mesh.color_attributes:
+        h.update(f"{attribute.name}|{attribute.domain}|{attribute.data_type}".encode())
+        _hash_buffer(h, attribute.data, 'color', len(attribute.data) * 4)
+
+
+def _hash_vertex_weights(h, obj, mesh):
+    """Hash an object's vertex groups and the weights its evaluated mesh carries (exported as skin weights)."""
+    h.update("|".join(group.name for group in obj.vertex_groups).encode())
+    weights = array.array('f')
+    for vertex in mesh.vertices:
+        weights.append(len(vertex.groups))
+        for element in vertex.groups:
+            weights.extend((element.group, element.weight))
+    h.update(weights.tobytes())
+
+
+def _hierarchy_content_hash(all_objects, settings, depsgraph):
+    """Hash everything about an export hierarchy that affects the exported files.
+
+    Covers the relevant export settings and, per object, its transform, evaluated
+    geometry and shading, vertex weights, shape keys, armature rest pose,
+    animation, material settings, node trees and images."""
+    h = hashlib.sha1()
+    settings_values = {k: v for k, v in _settings_to_dict(settings).items()
+                       if k not in _CACHE_IGNORED_SETTINGS}
+    h.update(json.dumps(settings_values, sort_keys=True).encode())
+
+    seen = set()
+    for obj in all_objects:
+        h.update(f"{obj.name}|{obj.type}|{obj.parent.name if obj.parent else ''}".encode())
+        h.update(array.array('f', [v for row in obj.matrix_world for v in row]).tobytes())
+
+        if obj.type == 'MESH':
+            mesh = obj.evaluated_get(depsgraph).data
+            _hash_mesh(h, mesh)
+            if obj.vertex_groups:
+                _hash_vertex_weights(h, obj, mesh)
+            if obj.data.shape_keys:
+                for key_block in obj.data.shape_keys.key_blocks:
+                    h.update(f"{key_block.name}={key_block.value}".encode())
+                    _hash_buffer(h, key_block.data, 'co', len(key_block.data) * 3)
+        elif obj.type == 'ARMATURE':
+            bones = obj.data.bones
+            _hash_buffer(h, bones, 'head_local', len(bones) * 3)
+            _hash_buffer(h, bones, 'tail_local', len(bones) * 3)
+
+        anim = obj.animation_data
+        if anim:
+            if anim.action:
+                _hash_action(h, anim.action)
+            for track in anim.nla_tracks:
+                for strip in track.strips:
+                    if strip.action:
+                        _hash_action(h, strip.action)
+
+        for slot in obj.material_slots:
+            mat = slot.material
+            h.update((mat.name if mat else "").encode())
+            if not mat or ('MATERIAL', mat.name) in seen:
+                continue
+            seen.add(('MATERIAL', mat.name))
+            h.update(repr(tuple(mat.diffuse_color)).encode())
+            # Blending and culling become the glTF alphaMode, alphaCutoff and doubleSided
+            h.update(f"{getattr(mat, 'blend_method', '')}|{getattr(mat, 'surface_render_method', '')}|"
+                     f"{mat.alpha_threshold}|{mat.use_backface_culling}".encode())
+            if mat.use_nodes and mat.node_tree:
+                _hash_node_tree(h, mat.node_tree, seen)
+
+    return h.hexdigest()
+
+
+class _ExportCache:
+    """Record of previous exports, stored beside the exported files.
+
+    Maps each export's base name to the content hash it was exported with and
+    the report item it produced."""
+
+    FILENAME = ".nexus_export_cache.json"
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.entries = {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get('version') == 1:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def lookup(self, base_name, content_hash):
+        """Return the previous report item if its export is still valid, else None."""
+        entry = self.entries.get(base_name)
+        if not entry or entry['hash'] != content_hash:
+            return None
+        item = entry['item']
+        for filename in item['files']:
+            if not os.path.exists(os.path.join(self.output_dir, filename)):
+                return None
+        return dict(item, cached=True)
+
+    def store(self, base_name, content_hash, item):
+        """Remember a successful export."""
+        item = {key: value for key, value in item.items() if key != 'timings'}
+        self.entries[base_name] = {'hash': content_hash, 'item': dict(item, cached=False)}
+
+    def save(self):
+        """Write the cache file atomically."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'version': 1, 'entries': self.entries}, f)
+        os.replace(temp_path, self.path)
+
+
+# -----------------------------------------------------------------------------
+# GLB Post-Processing
+# -----------------------------------------------------------------------------
+
+_GLB_MAGIC = 0x46546C67  # b'glTF'
+_GLB_CHUNK_JSON = 0x4E4F534A
+_GLB_CHUNK_BIN = 0x004E4942
+
+# Name of the temporary Decimate modifiers, and tag of temporary LOD objects
+_LOD_TAG = "_nexus_lod"
+_BUDGET_TAG = "_nexus_budget"
+
+# Suffix of original meshes while their working copies carry their names
+_ORIGINAL_MESH_SUFFIX = "_nexus_original"
+
+
+def _read_glb(filepath):
+    """Read a GLB file into its JSON document and binary chunk (or None)."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    magic, version, length = struct.unpack_from('<III', data, 0)
+    if magic != _GLB_MAGIC or version != 2:
+        raise ValueError("Not a glTF 2.0 binary file")
+
+    gltf = None
+    binary = None
+    offset = 12
+    while offset < length:
+        chunk_length, chunk_type = struct.unpack_from('<II', data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == _GLB_CHUNK_JSON:
+            gltf = json.loads(chunk.decode('utf-8'))
+        elif chunk_type == _GLB_CHUNK_BIN and binary is None:
+            binary = chunk
+        offset += 8 + chunk_length
+    if gltf is None:
+        raise ValueError("GLB file has no JSON chunk")
+    return gltf, binary
+
+
+def _write_glb(filepath, gltf, binary):
+    """Write a JSON document and binary chunk as a GLB file, atomically."""
+    json_chunk = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    chunks = [struct.pack('<II', len(json_chunk), _GLB_CHUNK_JSON) + json_chunk]
+    if binary:
+        binary = bytes(binary) + b'\0' * (-len(binary) % 4)
+        chunks.append(struct.pack('<II', len(binary), _GLB_CHUNK_BIN) + binary)
+    body = b''.join(chunks)
+
+    temp_path = filepath + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack('<III', _GLB_MAGIC, 2, 12 + len(body)))
+        f.write(body)
+    os.replace(temp_path, filepath)
+
+
+def _embed_msft_lod(filepath, alternatives, coverages):
+    """Turn exported LOD nodes into MSFT_lod alternatives of their LOD0 nodes.
+
+    alternatives maps a LOD0 node name to its LOD node names, finest first.
+    The LOD nodes are detached from the scene graph, so they are only
+    reachable through the extension, and the LOD0 node gets the screen
+    coverage thresholds in its extras."""
+    gltf, binary = _read_glb(filepath)
+    nodes = gltf.get('nodes', [])
+    index = {node.get('name'): i for i, node in enumerate(nodes)}
+
+    lod_indices = set()
+    for name, lod_names in alternatives.items():
+        ids = [index[lod_name] for lod_name in lod_names if lod_name in index]
+        if name not in index or not ids:
+            continue
+        node = nodes[index[name]]
+        node.setdefault('extensions', {})['MSFT_lod'] = {'ids': ids}
+        node.setdefault('extras', {})['MSFT_screencoverage'] = coverages[:len(ids) + 1]
+        lod_indices.update(ids)
+
+    if not lod_indices:
+        return
+    for node in nodes:
+        if 'children' in node:
+            node['children'] = [child for child in node['children'] if child not in lod_indices]
+            if not node['children']:
+                del node['children']
+    for scene in gltf.get('scenes', []):
+        scene['nodes'] = [n for n in scene.get('nodes', []) if n not in lod_indices]
+
+    extensions_used = gltf.setdefault('extensionsUsed', [])
+    if 'MSFT_lod' not in extensions_used:
+        extensions_used.append('MSFT_lod')
+    _write_glb(filepath, gltf, binary)
+
+
+# -----------------------------------------------------------------------------
+# KTX2 Textures
+# -----------------------------------------------------------------------------
+
+# Material texture slots that hold color; every other texture is linear data
+_SRGB_TEXTURE_SLOTS = {
+    'baseColorTexture', 'emissiveTexture', 'diffuseTexture', 'specularGlossinessTexture',
+    'sheenColorTexture', 'specularColorTexture',
+}
+_KTX2_INPUT_EXTENSIONS = {'image/png': ".png", 'image/jpeg': ".jpg"}
+
+
+# Result of the last encoder lookup; dropped when the toktx_path preference changes
+_ktx2_encoder_lookup = {}
+
+
+def _find_ktx2_encoder(refresh=False):
+    """Path of the toktx encoder, or None.
+
+    The lookup is cached, since the texture panel asks on every redraw;
+    refresh searches again."""
+    if refresh or 'path' not in _ktx2_encoder_lookup:
+        _ktx2_encoder_lookup['path'] = _locate_ktx2_encoder()
+    return _ktx2_encoder_lookup['path']
+
+
+def _locate_ktx2_encoder():
+    """Search for the toktx encoder.
+
+    Looks at the add-on preference first, then for a copy bundled next to
+    the add-on, then on PATH."""
+    prefs = bpy.context.preferences.addons.get(__name__)
+    if prefs and prefs.preferences.toktx_path:
+        path = bpy.path.abspath(prefs.preferences.toktx_path)
+        return path if os.path.isfile(path) else None
+
+    executable = "toktx.exe" if sys.platform == "win32" else "toktx"
+    bundled = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin", executable)
+    if os.path.isfile(bundled):
+        return bundled
+    return shutil.which("toktx")
+
+
+def _image_dimensions(data):
+    """Width and height of PNG or JPEG data, or None if it can't be read."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return struct.unpack_from('>II', data, 16)
+    if data[:2] == b'\xff\xd8':
+        offset = 2
+        while offset + 9 <= len(data) and data[offset] == 0xFF:
+            marker = data[offset + 1]
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                offset += 2
+                continue
+            # Start-of-frame markers carry the size; C4, C8 and CC are not frames
+            if 0xC0 <= marker <= 0xCF and marker not in {0xC4, 0xC8, 0xCC}:
+                height, width = struct.unpack_from('>HH', data, offset + 5)
+                return width, height
+            offset += 2 + struct.unpack_from('>H', data, offset + 2)[0]
+    return None
+
+
+def _texture_color_spaces(gltf):
+    """Map image indices to True for color (sRGB) images and False for linear data."""
+    texture_srgb = {}
+
+    def visit(value, key=None):
+        if isinstance(value, dict):
+            if key and key.endswith('Texture') and 'index' in value:
+                index = value['index']
+                texture_srgb[index] = texture_srgb.get(index, False) or key in _SRGB_TEXTURE_SLOTS
+            for child_key, child in value.items():
+                visit(child, child_key)
+        elif isinstance(value, list):
+            for child in value:
+                visit(child, key)
+
+    for material in gltf.get('materials', []):
+        visit(material)
+
+    image_srgb = {}
+    for index, texture in enumerate(gltf.get('textures', [])):
+        if 'source' in texture:
+            source = texture['source']
+            image_srgb[source] = image_srgb.get(source, False) or texture_srgb.get(index, True)
+    return image_srgb
+
+
+def _ktx2_command(encoder, source, target, srgb, size, settings):
+    """toktx command line that encodes one image.
+
+    KHR_texture_basisu requires dimensions that are multiples of four, so
+    other sizes are rounded up."""
+    command = [encoder, "--t2", "--threads", "1"]
+    if settings.ktx2_encoding == 'UASTC':
+        command += ["--encode", "uastc", "--uastc_quality", str(min(4, settings.texture_quality // 25)),
+                    "--zcmp", "18"]
+    else:
+        command += ["--encode", "etc1s", "--clevel", "2",
+                    "--qlevel", str(max(1, round(settings.texture_quality * 2.55)))]
+    if settings.ktx2_mipmaps:
+        command.append("--genmipmap")
+    command += ["--assign_oetf", "srgb" if srgb else "linear"]
+    if size and (size[0] % 4 or size[1] % 4):
+        command += ["--resize", f"{-(-size[0] // 4) * 4}x{-(-size[1] // 4) * 4}"]
+    return command + [target, source]
+
+
+def _compress_glb_textures_ktx2(filepath, encoder, settings):
+    """Re-encode the PNG and JPEG images embedded in a GLB as KTX2 with KHR_texture_basisu.
+
+    Images are encoded in parallel by a pool of toktx processes. Textures
+    refer to the KTX2 images through the extension only, without a PNG
+    fallback, so the extension is marked as required. The file is only
+    rewritten if every image encoded. Returns the number of images
+    converted."""
+    gltf, binary = _read_glb(filepath)
+    images = gltf.get('images', [])
+    views = gltf.get('bufferViews', [])
+    srgb = _texture_color_spaces(gltf)
+
+    jobs = {}
+    temp_dir = tempfile.mkdtemp(prefix="nexus_ktx2_")
+    try:
+        for index, image in enumerate(images):
+            ext = _KTX2_INPUT_EXTENSIONS.get(image.get('mimeType'))
+            if ext is None or 'bufferView' not in image:
+                continue
+            view = views[image['bufferView']]
+            start = view.get('byteOffset', 0)
+            data = binary[start:start + view['byteLength']]
+            source = os.path.join(temp_dir, f"{index}{ext}")
+            with open(source, 'wb') as f:
+                f.write(data)
+            target = os.path.join(temp_dir, f"{index}.ktx2")
+            jobs[index] = (target, _ktx2_command(encoder, source, target, srgb.get(index, True),
+                                                 _image_dimensions(data), settings))
+        if not jobs:
+            return 0
+
+        def encode(command):
+            return subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            results = dict(zip(jobs, pool.map(encode, (command for _, command in jobs.values()))))
+        for index, proc in results.items():
+            if proc.returncode != 0:
+                raise RuntimeError(f"toktx failed on image {index}: {proc.stdout.strip()[-300:]}")
+
+        encoded = {}
+        for index, (target, _) in jobs.items():
+            with open(target, 'rb') as f:
+                encoded[images[index]['bufferView']] = f.read()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    # Rebuild the binary chunk with the KTX2 data in place of the images
+    chunks = []
+    offset = 0
+    for view_index, view in enumerate(views):
+        data = encoded.get(view_index)
+        if data is None:
+            start = view.get('byteOffset', 0)
+            data = binary[start:start + view['byteLength']]
+        padding = -offset % 4
+        chunks.append(b'\0' * padding + bytes(data))
+        offset += padding
+        view['byteOffset'] = offset
+        view['byteLength'] = len(data)
+        offset += len(data)
+    binary = b''.join(chunks)
+    gltf['buffers'][0]['byteLength'] = len(binary)
+
+    for index in jobs:
+        images[index]['mimeType'] = 'image/ktx2'
+    for texture in gltf.get('textures', []):
+        if texture.get('source') in jobs:
+            texture.setdefault('extensions', {})['KHR_texture_basisu'] = {'source': texture.pop('source')}
+    for key in ('extensionsUsed', 'extensionsRequired'):
+        extensions = gltf.setdefault(key, [])
+        if 'KHR_texture_basisu' not in extensions:
+            extensions.append('KHR_texture_basisu')
+
+    _write_glb(filepath, gltf, binary)
+    return len(jobs)
+
+
+# -----------------------------------------------------------------------------
+# Report Files
+# -----------------------------------------------------------------------------
+
+class _ReportWriter:
+    """Machine-readable export report in the output directory.
+
+    One JSON Lines record per exported file is appended and flushed to disk
+    as soon as its object is done, so a crash mid-batch keeps everything
+    exported so far. A CSV summary with one row per object is written when
+    the batch ends. A resumed batch keeps the records of the objects the
+    interrupted batch finished, and lists them in the CSV too."""
+
+    JSONL_FILENAME = "nexus_export_report.jsonl"
+    CSV_FILENAME = "nexus_export_report.csv"
+    CSV_COLUMNS = (
+        'object', 'status', 'formats', 'files', 'triangles', 'vertices',
+        'bytes', 'textures', 'seconds', 'error',
+    )
+
+    def __init__(self, output_dir, resumed_objects=None):
+        """Start the report files; resumed_objects names the objects a resumed batch exports again."""
+        self.output_dir = output_dir
+        path = os.path.join(output_dir, self.JSONL_FILENAME)
+        self.earlier_records = []
+        if resumed_objects is not None:
+            self.earlier_records = [record for record in _read_report_records(path)
+                                    if record['object'] not in resumed_objects]
+        self.file = open(path, 'w')
+        for record in self.earlier_records:
+            self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def file_record(self, item, file_format, filename, error):
+        """Build the record for one output file of a report item."""
+        path = os.path.join(self.output_dir, filename) if filename else None
+        exists = path is not None and os.path.exists(path)
+        return {
+            'object': item['object_name'],
+            'format': file_format,
+            'path': path,
+            'bytes': os.path.getsize(path) if exists else 0,
+            'triangles': item['triangles'],
+            'vertices': item.get('vertices', 0),
+            'textures': item.get('texture_sizes', []),
+            'timings': item.get('timings', {}),
+            'hash': _file_sha256(path) if exists else None,
+            'content_hash': item.get('content_hash'),
+            'cached': bool(item.get('cached')),
+            'error': error,
+        }
+
+    def write_item(self, item):
+        """Append the records of one report item and flush them to disk."""
+        format_errors = item.get('format_errors', {})
+        records = []
+        for filename in item['files']:
+            file_format = os.path.splitext(filename)[1][1:].upper()
+            records.append(self.file_record(item, file_format, filename, format_errors.get(file_format)))
+
+        # Formats that produced no file, or an object that failed outright
+        written = {record['format'] for record in records}
+        for file_format, message in format_errors.items():
+            if file_format not in written:
+                records.append(self.file_record(item, file_format, None, message))
+        if not records:
+            records.append(self.file_record(item, None, None, item.get('error')))
+
+        for record in records:
+            self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self, items):
+        """Finish the JSON Lines file and write the CSV summary."""
+        self.file.close()
+        with open(os.path.join(self.output_dir, self.CSV_FILENAME), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CSV_COLUMNS)
+
+            # Objects finished before a resumed batch, rebuilt from their file records
+            earlier = {}
+            for record in self.earlier_records:
+                earlier.setdefault(record['object'], []).append(record)
+            for object_name, records in earlier.items():
+                errors = [record['error'] for record in records if record['error']]
+                written = [record for record in records if record['path']]
+                if records[0]['cached']:
+                    status = "unchanged"
+                elif written and not errors:
+                    status = "ok"
+                else:
+                    status = "failed"
+                writer.writerow([
+                    object_name,
+                    status,
+                    ", ".join(record['format'] for record in written),
+                    ";".join(os.path.basename(record['path']) for record in written),
+                    records[0]['triangles'],
+                    records[0].get('vertices', 0),
+                    sum(record['bytes'] for record in written),
+                    len(records[0]['textures']),
+                    f"{sum(t['wall'] for t in records[0]['timings'].values()):.3f}",
+                    "; ".join(errors),
+                ])
+
+            for item in items:
+                if item.get('cached'):
+                    status = "unchanged"
+                elif item['success'] and not item.get('error'):
+                    status = "ok"
+                else:
+                    status = "failed"
+                writer.writerow([
+                    item['object_name'],
+                    status,
+                    item['format'],
+                    ";".join(item['files']),
+                    item['triangles'],
+                    item.get('vertices', 0),
+                    item['file_size'],
+                    len(item.get('texture_sizes', [])),
+                    f"{sum(t['wall'] for t in item.get('timings', {}).values()):.3f}",
+                    item.get('error') or "",
+                ])
+
+
+def _read_report_records(path):
+    """Read the records of a JSON Lines report, stopping at a torn final line."""
+    records = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    except OSError:
+        pass
+    return records
+
+
+def _file_sha256(path):
+    """SHA-256 hex digest of a file, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# Export Journal
+# -----------------------------------------------------------------------------
+
+def _matrix_to_list(matrix):
+    """Convert a mathutils matrix into nested lists for JSON."""
+    return [list(row) for row in matrix]
+
+
+class _ExportJournal:
+    """Append-only checkpoint log of a running batch, kept in the output directory.
+
+    Each object logs a 'start' record with everything needed to undo its
+    temporary changes before anything is modified. It logs an 'unlit'
+    record once its materials are converted, a 'format' record per
+    exporter, and a 'done' record once the scene is restored. Records are
+    fsynced as they are written. The journal is deleted when a batch runs
+    to completion. After a crash or cancel it is left behind for
+    NEXUS_OT_resume_export."""
+
+    FILENAME = ".nexus_export_journal.jsonl"
+
+    def __init__(self, output_dir):
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.file = None
+
+    def write(self, record):
+        """Append one record and force it to disk."""
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def begin(self, object_names, settings):
+        """Start a new journal for a batch, replacing any earlier one."""
+        self.file = open(self.path, 'w')
+        self.write({
+            'event': 'batch',
+            'blend_file': bpy.data.filepath,
+            'objects': object_names,
+            'settings': _settings_to_dict(settings),
+        })
+
+    def item_start(self, name, original_transforms, original_mesh_data, mesh_names, all_objects):
+        """Record how to restore an object's hierarchy before it is modified."""
+        objects = {o.name: o for o in all_objects}
+        self.write({
+            'event': 'start',
+            'object': name,
+            'hierarchy': list(objects),
+            'transforms': {
+                obj_name: {'basis': _matrix_to_list(basis), 'parent_inverse': _matrix_to_list(parent_inverse)}
+                for obj_name, (basis, parent_inverse) in original_transforms.items()
+            },
+            'meshes': {
+                obj_name: {
+                    'original': original.name,
+                    'working': objects[obj_name].data.name,
+                    'name': mesh_names.get(original, original.name),
+                    'fake_user': fake_user,
+                }
+                for obj_name, (original, fake_user) in original_mesh_data.items()
+            },
+        })
+
+    def item_unlit(self, name, restore_data):
+        """Record the shader links replaced by the unlit conversion."""
+        self.write({
+            'event': 'unlit',
+            'object': name,
+            'materials': [{
+                'material': entry['material'].name,
+                'node': entry['original_socket'].node.name,
+                'socket': entry['original_socket'].identifier,
+                'emission': entry['emit_node'].name,
+            } for entry in restore_data],
+        })
+
+    def item_format(self, name, file_format, ok):
+        """Record the outcome of one exporter."""
+        self.write({'event': 'format', 'object': name, 'format': file_format, 'ok': ok})
+
+    def item_done(self, name):
+        """Record that an object is finished and the scene restored."""
+        self.write({'event': 'done', 'object': name})
+
+    def close(self, completed):
+        """Close the journal, deleting it if the whole batch finished."""
+        self.file.close()
+        if completed:
+            os.remove(self.path)
+
+
+# Parsed journals by path, reused while the file's modification time and size
+# are unchanged, so the output panel and Resume Export's poll only stat the file
+_journal_cache = {}
+
+
+def _read_journal(output_dir):
+    """Parse the journal in an output directory, or return None if there is none.
+
+    Returns a dict with the batch's 'objects' (in queue order), 'settings',
+    'blend_file', the names of finished objects in 'done', and the 'start'
+    records of objects that were started but never finished in 'started',
+    each with the object's 'unlit' materials merged in."""
+    path = os.path.join(output_dir, _ExportJournal.FILENAME)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _journal_cache.pop(path, None)
+        return None
+    # The size catches appends within one tick of a coarse file system clock
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _journal_cache.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    journal = None
+    started = {}
+    done = set()
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # Torn final write
+            event = record.get('event')
+            if event == 'batch':
+                journal = dict(record, done=done, started=started)
+            elif event == 'start':
+                started[record['object']] = dict(record, materials=[])
+            elif event == 'unlit' and record['object'] in started:
+                started[record['object']]['materials'] = record['materials']
+            elif event == 'done':
+                done.add(record['object'])
+                started.pop(record['object'], None)
+
+    _journal_cache[path] = (version, journal)
+    return journal
+
+
+def _recover_from_journal(journal):
+    """Undo the temporary changes of objects that were interrupted mid-export.
+
+    Only hierarchies still pointing at their working mesh copies, or still
+    holding the temporary emission nodes, are touched. A file reopened from
+    before the export started is left as it is. Returns the number of
+    objects restored."""
+    from mathutils import Matrix
+
+    recovered = 0
+    for record in journal['started'].values():
+        restored = False
+
+        # Working copies can be shared, so they are removed once every object
+        # is back, and the originals get their names back after that
+        working_meshes = set()
+        renamed = {}
+        for obj_name, meshes in record['meshes'].items():
+            obj = bpy.data.objects.get(obj_name)
+            original = bpy.data.meshes.get(meshes['original'])
+            if obj is None or original is None:
+                continue
+            original.use_fake_user = meshes['fake_user']
+            renamed[original] = meshes.get('name', original.name)
+            if obj.data is not None and obj.data.name == meshes['working'] and obj.data != original:
+                working_meshes.add(obj.data)
+                obj.data = original
+                restored = True
+        if working_meshes:
+            bpy.data.batch_remove(list(working_meshes))
+        for original, name in renamed.items():
+            original.name = name
+
+        # Baked transforms only need undoing where the working copies were still in place
+        if restored:
+            for obj_name, transform in record['transforms'].items():
+                obj = bpy.data.objects.get(obj_name)
+                if obj is not None:
+                    obj.matrix_basis = Matrix(transform['basis'])
+                    obj.matrix_parent_inverse = Matrix(transform['parent_inverse'])
+
+        for entry in record['materials']:
+            mat = bpy.data.materials.get(entry['material'])
+            if mat is None or not mat.node_tree:
+                continue
+            nodes = mat.node_tree.nodes
+            emit_node = nodes.get(entry['emission'])
+            source = nodes.get(entry['node'])
+            if emit_node is None or emit_node.type != 'EMISSION' or source is None:
+                continue
+            for link in list(emit_node.outputs['Emission'].links):
+                for socket in source.outputs:
+                    if socket.identifier == entry['socket']:
+                        mat.node_tree.links.new(socket, link.to_socket)
+            nodes.remove(emit_node)
+            restored = True
+
+        # Temporary LOD and budget decimation left on the hierarchy
+        for obj_name in record.get('hierarchy', []):
+            obj = bpy.data.objects.get(obj_name)
+            if obj is None:
+                continue
+            for tag in (_LOD_TAG, _BUDGET_TAG):
+                modifier = obj.modifiers.get(tag)
+                if modifier is not None:
+                    obj.modifiers.remove(modifier)
+                    restored = True
+
+        if restored:
+            recovered += 1
+
+    # Temporary MSFT_lod copies
+    lod_objects = [obj for obj in bpy.data.objects if obj.get(_LOD_TAG)]
+    if lod_objects:
+        bpy.data.batch_remove(lod_objects)
+    return recovered
+
+
+# -----------------------------------------------------------------------------
+# Scene Change Handlers
+# -----------------------------------------------------------------------------
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Drop the cached queue hierarchies and list order after edits that can change them.
+
+    Anything but a pure geometry edit counts: transform, visibility,
+    parenting and scene or collection changes."""
+    hierarchy_changed = False
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            if update.is_updated_transform or not update.is_updated_geometry:
+                hierarchy_changed = True
+        elif isinstance(update.id, (bpy.types.Scene, bpy.types.Collection)):
+            hierarchy_changed = True
+    if hierarchy_changed:
+        _hierarchy_index.clear()
+        _queue_list_cache.clear()
+
+
+@persistent
+def _on_data_reloaded(*args):
+    """Drop all cached hierarchies after loading a file or undo/redo."""
+    _hierarchy_index.clear()
+    _queue_list_cache.clear()
+
+
+_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_data_reloaded),
+    (bpy.app.handlers.undo_post, _on_data_reloaded),
+    (bpy.app.handlers.redo_post, _on_data_reloaded),
+)
+
+
+# -----------------------------------------------------------------------------
+# Parallel Export Workers
+# -----------------------------------------------------------------------------
+
+def _settings_to_dict(settings):
+    """Serialize NexusExportSettings into a JSON-compatible dict."""
+    values = {}
+    for prop in settings.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        values[prop.identifier] = getattr(settings, prop.identifier)
+    return values
+
+
+def _apply_settings_dict(settings, values):
+    """Apply a dict of setting values to NexusExportSettings.
+
+    The platform and axis presets are applied first so that explicit values
+    in the dict take precedence over what the presets would set."""
+    for key in ('platform_preset', 'axis_preset'):
+        if key in values:
+            setattr(settings, key, values[key])
+    for key, value in values.items():
+        if key in {'platform_preset', 'axis_preset'}:
+            continue
+        if not hasattr(settings, key):
+            raise KeyError(f"Unknown export setting: {key}")
+        setattr(settings, key, value)
+
+
+def _write_job_manifest(job_dir, blend_path, output_dir, settings, object_names, worker_count):
+    """Split object names round-robin into shards and write the job manifest."""
+    shards = []
+    for index in range(worker_count):
+        shards.append({
+            'index': index,
+            'objects': object_names[index::worker_count],
+            'result': os.path.join(job_dir, f"result_{index}.json"),
+            'log': os.path.join(job_dir, f"worker_{index}.log"),
+        })
+
+    manifest = {
+        'version': 1,
+        'blend_file': blend_path,
+        'output_directory': output_dir,
+        'settings': _settings_to_dict(settings),
+        'shards': shards,
+    }
+    with open(os.path.join(job_dir, "manifest.json"), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _worker_command(blend_path, manifest_path, shard_index):
+    """Build the command line that runs one export shard in background Blender."""
+    expr = (
+        "import sys, addon_utils\n"
+        f"mod = sys.modules.get({__name__!r})\n"
+        "if not (mod and getattr(mod, '__addon_enabled__', False)):\n"
+        f"    mod = addon_utils.enable({__name__!r}, default_set=False)\n"
+        f"mod._run_export_worker({manifest_path!r}, {shard_index})\n"
+    )
+    return [bpy.app.binary_path, "-b", blend_path, "--python-expr", expr]
+
+
+def _run_export_worker(manifest_path, shard_index):
+    """Export one shard of a parallel job (runs inside a worker process)."""
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    shard = manifest['shards'][shard_index]
+
+    run_job({
+        'objects': shard['objects'],
+        'settings': dict(manifest['settings'], parallel_export=False, skip_unchanged=False,
+                         write_report_files=False, resumable_export=False),
+        'output_directory': manifest['output_directory'],
+        'report': shard['result'],
+    })
+
+
+def _shard_report(items):
+    """Build a report from finished items, counting their files and failures."""
+    return {
+        'items': list(items),
+        'total_files': sum(len(item['files']) for item in items),
+        'total_size': sum(item['file_size'] for item in items),
+        'errors': sum(1 for item in items if not item['success'] or item['error']),
+    }
+
+
+def _read_shard_report(shard, settings):
+    """Read the report a worker wrote for its shard.
+
+    A worker that crashed or never started wrote none, so every object of
+    its shard is reported as failed."""
+    if os.path.exists(shard['result']):
+        with open(shard['result']) as f:
+            result = json.load(f)
+        return {key: result[key] for key in ('items', 'total_files', 'total_size', 'errors')}
+
+    return _shard_report([{
+        'object_name': settings.export_prefix + name + settings.export_suffix,
+        'triangles': 0,
+        'file_size': 0,
+        'format': '',
+        'files': [],
+        'textures': '',
+        'success': False,
+        'error': f"Worker {shard['index']} failed (see {shard['log']})",
+    } for name in shard['objects']])
+
+
+# -----------------------------------------------------------------------------
+# Headless Batch Entry Point
+# -----------------------------------------------------------------------------
+
+def _collection_export_roots(collection, name_filter="", property_filter="", walker=None):
+    """Return the top-level exportable objects of a collection (and its children).
+
+    name_filter is a case-insensitive wildcard pattern the object names must
+    match, property_filter a custom property that must be set and true."""
+    walker = walker or _HierarchyWalker()
+    pattern = name_filter.lower()
+    members = set(collection.all_objects)
+    roots = []
+    for obj in collection.all_objects:
+        if obj.parent in members or not walker.is_visible(obj):
+            continue
+        if pattern and not fnmatch.fnmatchcase(obj.name.lower(), pattern):
+            continue
+        if property_filter and not obj.get(property_filter):
+            continue
+        if obj.type == 'MESH' or (obj.type == 'EMPTY' and walker.has_mesh_descendants(obj)):
+            roots.append(obj)
+    return roots
+
+
+def _resolve_queue(queue, walker, sources=None):
+    """Expand the included queue items into the objects to export, in queue order.
+
+    Collection items are resolved here, so they pick up whatever the
+    collection holds when the export starts. Objects reached more than once,
+    or nested under another exported object, are exported once. If sources
+    is given, it maps each exported object's name to the key of the queue
+    item it came from."""
+    origins = {}
+    for item in queue:
+        if not item.include:
+            continue
+        if item.obj:
+            objects = [item.obj]
+        elif item.collection:
+            objects = _collection_export_roots(item.collection, item.name_filter, item.property_filter, walker)
+        else:
+            continue
+        key = _queue_item_key(item)
+        for obj in objects:
+            origins.setdefault(obj, key)
+    export_objects = walker.without_nested(list(origins), set(origins))
+    if sources is not None:
+        sources.update((obj.name, origins[obj]) for obj in export_objects)
+    return export_objects
+
+
+def _record_queue_results(queue, sources, items, settings):
+    """Store the outcome of a batch on the queue items it came from.
+
+    sources maps exported object names to queue item keys, as filled in by
+    _resolve_queue. A collection item sums the results of its objects and
+    counts as failed if any of them failed."""
+    by_name = {item['object_name']: item for item in items}
+    rank = {'UNCHANGED': 0, 'EXPORTED': 1, 'FAILED': 2}
+    totals = {}
+    for name, key in sources.items():
+        item = by_name.get(settings.export_prefix + name + settings.export_suffix)
+        if item is None:
+            continue
+        if not item['success'] or item['error']:
+            status = 'FAILED'
+        else:
+            status = 'UNCHANGED' if item.get('cached') else 'EXPORTED'
+        total = totals.setdefault(key, {'status': status, 'triangles': 0, 'file_size': 0, 'duration': 0.0})
+        total['status'] = max(total['status'], status, key=rank.get)
+        total['triangles'] += item.get('triangles', 0)
+        total['file_size'] += item.get('file_size', 0)
+        total['duration'] += sum(timing['wall'] for timing in (item.get('timings') or {}).values())
+
+    for queue_item in queue:
+        total = totals.get(_queue_item_key(queue_item))
+        if total:
+            queue_item.last_status = total['status']
+            queue_item.last_triangles = min(total['triangles'], 2**31 - 1)
+            queue_item.last_file_size = total['file_size']
+            queue_item.last_duration = total['duration']
+    _queue_list_cache.clear()
+
+
+def run_job(spec):
+    """Run a batch export described by a job spec and return its report.
+
+    The spec is a dict (usually loaded from JSON) with these optional keys:
+        objects          -- names of objects to export
+        collections      -- names of collections whose top-level objects are exported
+        preset           -- platform preset identifier, e.g. 'WEB_MOBILE'
+        settings         -- NexusExportSettings values, applied after the preset
+        output_directory -- directory to export to (created if missing)
+        report           -- path of a JSON file to write the report to
+
+    When neither objects nor collections are given, the scene's export queue
+    is used. Objects that cannot be found are reported as failed items."""
+    global _export_override_objects, _export_report_data
+
+    if not hasattr(bpy.types.Scene, "nexus_export"):
+        register()
+
+    settings = bpy.context.scene.nexus_export
+    values = dict(spec.get('settings', {}))
+    if spec.get('preset'):
+        values['platform_preset'] = spec['preset']
+    _apply_settings_dict(settings, values)
+    settings.show_export_report = False
+
+    if spec.get('output_directory'):
+        output_dir = bpy.path.abspath(spec['output_directory'])
+        os.makedirs(output_dir, exist_ok=True)
+        settings.output_directory = output_dir
+
+    # Resolve the objects to export
+    missing = []
+    export_objects = []
+    for name in spec.get('objects', []):
+        obj = bpy.data.objects.get(name)
+        if obj:
+            export_objects.append(obj)
+        else:
+            missing.append(name)
+    for name in spec.get('collections', []):
+        collection = bpy.data.collections.get(name)
+        if collection:
+            export_objects.extend(o for o in _collection_export_roots(collection) if o not in export_objects)
+        else:
+            missing.append(name)
+
+    # Start from an empty report, so a skipped export does not return the previous job's items
+    _export_report_data = {
+        'items': [],
+        'total_files': 0,
+        'total_size': 0,
+        'errors': 0,
+    }
+
+    status = 'FINISHED'
+    error = None
+    if export_objects or not (spec.get('objects') or spec.get('collections')):
+        _export_override_objects = export_objects or None
+        try:
+            status = next(iter(bpy.ops.nexus.process_export()))
+        except RuntimeError as e:
+            # Raised when the operator reports an error, e.g. a missing output directory
+            status = 'CANCELLED'
+            error = str(e)
+        finally:
+            _export_override_objects = None
+
+    report = dict(_export_report_data, items=list(_export_report_data['items']))
+    for name in missing:
+        report['items'].append({
+            'object_name': settings.export_prefix + name + settings.export_suffix,
+            'triangles': 0,
+            'file_size': 0,
+            'format': '',
+            'files': [],
+            'textures': '',
+            'success': False,
+            'error': "Object or collection not found",
+        })
+        report['errors'] += 1
+    report['status'] = status
+    if error:
+        report['error'] = error
+    report['blend_file'] = bpy.data.filepath
+    report['output_directory'] = bpy.path.abspath(settings.output_directory)
+    report['settings'] = _settings_to_dict(settings)
+
+    if spec.get('report'):
+        with open(spec['report'], 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+
+def main(argv=None):
+    """Command-line entry point for headless exports. Returns a process exit code.
+
+    Arguments are read from after '--' on Blender's command line, e.g.:
+        blender -b scene.blend --python-expr "import sys, nexus_export_pro; sys.exit(nexus_export_pro.main())" -- --job job.json
+    """
+    import argparse
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(
+        prog="nexus_export_pro",
+        description="Batch export objects from a .blend file with Nexus Export Pro.",
+    )
+    parser.add_argument("--job", help="JSON job spec file (see run_job)")
+    parser.add_argument("--objects", nargs="+", help="Object names to export")
+    parser.add_argument("--collections", nargs="+", help="Collection names to export")
+    parser.add_argument("--preset", help="Platform preset, e.g. WEB_MOBILE")
+    parser.add_argument("--output", help="Output directory")
+    parser.add_argument("--report", help="Write the JSON report to this file")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override an export setting (value parsed as JSON if possible)")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.job:
+        with open(args.job) as f:
+            spec = json.load(f)
+    if args.objects:
+        spec['objects'] = args.objects
+    if args.collections:
+        spec['collections'] = args.collections
+    if args.preset:
+        spec['preset'] = args.preset
+    if args.output:
+        spec['output_directory'] = args.output
+    if args.report:
+        spec['report'] = args.report
+    for override in args.set:
+        key, _, raw = override.partition("=")
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        spec.setdefault('settings', {})[key] = value
+
+    report = run_job(spec)
+    print(f"Nexus Export: {report['total_files']} file(s), {report['errors']} error(s)")
+    if report.get('error'):
+        print(f"Nexus Export: {report['error']}")
+    if report['status'] != 'FINISHED' or report['errors']:
+        return 1
+    return 0
 
 
 # -----------------------------------------------------------------------------
@@ -1562,15 +4868,27 @@ class NexusExportPreferences(AddonPreferences):
     """Addon preferences for Nexus Export Pro (stores persistent settings)."""
     bl_idname = __name__
 
+    def update_toktx_path(self, context):
+        """Forget the cached encoder lookup when its path changes."""
+        _ktx2_encoder_lookup.clear()
+
     auto_check_updates: BoolProperty(
         name="Check for Updates on Startup",
         default=True,
         description="Automatically check for updates when the panel is first drawn"
     )
+    toktx_path: StringProperty(
+        name="toktx Executable",
+        subtype='FILE_PATH',
+        default="",
+        update=update_toktx_path,
+        description="KTX-Software encoder used for KTX2 textures (found on PATH when empty)"
+    )
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "auto_check_updates")
+        layout.prop(self, "toktx_path")
 
         version_str = ".".join(str(v) for v in bl_info["version"])
         layout.label(text=f"Installed Version: v{version_str}")
@@ -1749,6 +5067,7 @@ class NEXUS_PT_object_queue(Panel):
 
         col = row.column(align=True)
         col.operator("nexus.add_selected", icon='ADD', text="")
+        col.operator("nexus.add_collection", icon='OUTLINER_COLLECTION', text="")
         col.operator("nexus.remove_item", icon='REMOVE', text="").index = scene.nexus_queue_index
         col.separator()
         col.operator("nexus.clear_queue", icon='X', text="")
@@ -1758,38 +5077,40 @@ class NEXUS_PT_object_queue(Panel):
         row.operator("nexus.add_all_scene", text="Add All", icon='SCENE_DATA')
 
         queue = scene.nexus_queue
-        included = sum(1 for item in queue if item.include and item.obj)
-        layout.label(text=f"{included} of {len(queue)} objects included")
+        included = sum(1 for item in queue if item.include and (item.obj or item.collection))
+        layout.label(text=f"{included} of {len(queue)} items included")
 
         # Children preview for the selected queue item
         if queue and 0 <= scene.nexus_queue_index < len(queue):
             active_item = queue[scene.nexus_queue_index]
-            if active_item.obj and active_item.obj.children:
-                visible_descendants = get_all_descendants(active_item.obj, visible_only=True)
-                if visible_descendants:
+            if active_item.collection and not active_item.obj:
+                box = layout.box()
+                box.label(text="Collection Filters:", icon='FILTER')
+                box.prop(active_item, "name_filter", text="Name")
+                box.prop(active_item, "property_filter", text="Property")
+                box.label(text="Objects are resolved when the export starts", icon='INFO')
+            elif active_item.obj:
+                hierarchy = _hierarchy_index.get(active_item.obj)
+                if hierarchy['tree']:
                     box = layout.box()
                     header_row = box.row()
                     header_row.label(text="Export Contents:", icon='OUTLINER')
 
-                    self.draw_children_tree(box, active_item.obj, depth=0)
+                    self.draw_children_tree(box, hierarchy['tree'])
 
-                    mesh_count = sum(1 for c in visible_descendants if c.type == 'MESH')
-                    total_count = len(visible_descendants)
-                    box.label(text=f"{mesh_count} mesh(es), {total_count} object(s) total")
+                    total_count = len(hierarchy['tree'])
+                    box.label(text=f"{hierarchy['mesh_count']} mesh(es), {total_count} object(s) total")
 
                     # Warn about hidden objects that will be skipped
-                    all_descendants = get_all_descendants(active_item.obj, visible_only=False)
-                    hidden_count = len(all_descendants) - len(visible_descendants)
+                    hidden_count = hierarchy['hidden_count']
                     if hidden_count > 0:
                         row = box.row()
                         row.alert = True
                         row.label(text=f"{hidden_count} hidden object(s) excluded", icon='HIDE_ON')
 
-    def draw_children_tree(self, layout, obj, depth):
-        """Recursively draw a tree of visible child objects."""
-        for child in obj.children:
-            if not is_object_visible(child):
-                continue
+    def draw_children_tree(self, layout, tree):
+        """Draw a tree of visible child objects from (object, depth) pairs."""
+        for child, depth in tree:
             row = layout.row(align=True)
             # Indent with empty space based on depth
             if depth > 0:
@@ -1797,8 +5118,6 @@ class NEXUS_PT_object_queue(Panel):
             for i in range(depth):
                 row.label(text="", icon='BLANK1')
             row.label(text=child.name, icon=get_type_icon(child))
-            if child.children:
-                self.draw_children_tree(layout, child, depth + 1)
 
 
 class NEXUS_PT_platform_preset(Panel):
@@ -1870,6 +5189,8 @@ class NEXUS_PT_format_settings(Panel):
 
         col.separator()
         col.prop(settings, "material_mode")
+        if settings.export_glb:
+            col.prop(settings, "gpu_instancing")
 
 
 class NEXUS_PT_draco_settings(Panel):
@@ -1934,6 +5255,12 @@ class NEXUS_PT_texture_settings(Panel):
 
         if settings.texture_compression in {'JPEG', 'WEBP'}:
             col.prop(settings, "texture_quality")
+        elif settings.texture_compression == 'KTX2':
+            col.prop(settings, "ktx2_encoding")
+            col.prop(settings, "texture_quality")
+            col.prop(settings, "ktx2_mipmaps")
+            if _find_ktx2_encoder() is None:
+                col.label(text="toktx not found, set it in Preferences", icon='ERROR')
 
 
 class NEXUS_PT_usdz_settings(Panel):
@@ -1963,7 +5290,9 @@ class NEXUS_PT_usdz_settings(Panel):
         layout.active = settings.usdz_optimize_via_glb
 
         col = layout.column()
-        col.prop(settings, "usdz_use_draco")
+        col.prop(settings, "usdz_optimize_method")
+        if settings.usdz_optimize_method == 'GLB':
+            col.prop(settings, "usdz_use_draco")
         col.separator()
         col.prop(settings, "usdz_texture_compression")
         if settings.usdz_texture_compression in {'JPEG', 'WEBP'}:
@@ -2037,6 +5366,68 @@ class NEXUS_PT_mesh_cleanup(Panel):
         col.label(text="Applied to copy, original preserved", icon='INFO')
 
 
+class NEXUS_PT_lod_settings(Panel):
+    """LOD generation settings subpanel"""
+    bl_label = "LOD Generation"
+    bl_idname = "NEXUS_PT_lod_settings"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Nexus Export"
+    bl_parent_id = "NEXUS_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        settings = context.scene.nexus_export
+        self.layout.prop(settings, "generate_lods", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.nexus_export
+
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        layout.active = settings.generate_lods
+
+        col = layout.column()
+        col.prop(settings, "lod_count")
+        col.prop(settings, "lod_ratio")
+        col.prop(settings, "lod_mode")
+
+        col.separator()
+        col.label(text="Decimated on export, original preserved", icon='INFO')
+
+
+class NEXUS_PT_budget_settings(Panel):
+    """Platform budget settings subpanel"""
+    bl_label = "Platform Budget"
+    bl_idname = "NEXUS_PT_budget_settings"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Nexus Export"
+    bl_parent_id = "NEXUS_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        settings = context.scene.nexus_export
+        self.layout.prop(settings, "enforce_budget", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.nexus_export
+
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        layout.active = settings.enforce_budget
+
+        col = layout.column()
+        col.prop(settings, "budget_triangles")
+        col.prop(settings, "budget_size_mb")
+        col.prop(settings, "budget_max_attempts")
+
+        col.separator()
+        col.label(text="Limits are set by the platform preset", icon='INFO')
+
+
 class NEXUS_PT_texture_resize(Panel):
     """Global texture resize settings subpanel"""
     bl_label = "Texture Resize"
@@ -2075,6 +5466,36 @@ class NEXUS_PT_texture_resize(Panel):
         layout.label(text="Applies to all export formats", icon='INFO')
 
 
+class NEXUS_PT_texture_atlas(Panel):
+    """Texture atlas settings subpanel"""
+    bl_label = "Texture Atlas"
+    bl_idname = "NEXUS_PT_texture_atlas"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Nexus Export"
+    bl_parent_id = "NEXUS_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        settings = context.scene.nexus_export
+        self.layout.prop(settings, "atlas_textures", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.nexus_export
+
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        layout.active = settings.atlas_textures
+
+        col = layout.column()
+        col.prop(settings, "atlas_padding")
+
+        col.separator()
+        col.label(text=f"Atlases are at most {settings.max_texture_size}px", icon='INFO')
+        col.label(text="Only materials that differ in images merge")
+
+
 class NEXUS_PT_output(Panel):
     """Output settings and export button subpanel"""
     bl_label = "Output"
@@ -2121,16 +5542,34 @@ class NEXUS_PT_output(Panel):
 
         col.separator()
         col.prop(settings, "show_export_report")
+        col.prop(settings, "write_report_files")
+        col.prop(settings, "resumable_export")
+        col.prop(settings, "skip_unchanged")
+        col.prop(settings, "parallel_export")
+        if settings.parallel_export:
+            col.prop(settings, "parallel_workers")
 
         col.separator()
 
-        row = layout.row()
-        row.scale_y = 2.0
-        row.operator("nexus.process_export", icon='EXPORT')
+        if _export_progress['running']:
+            self.draw_progress(layout)
+        else:
+            # Offer to continue a batch that was interrupted
+            output_dir = bpy.path.abspath(settings.output_directory)
+            journal = _read_journal(output_dir) if output_dir else None
+            if journal is not None:
+                box = layout.box()
+                box.label(text=f"Interrupted export: {len(journal['done'])}/{len(journal['objects'])} done",
+                          icon='ERROR')
+                box.operator("nexus.resume_export", icon='PLAY')
 
-        row = layout.row()
-        row.scale_y = 1.5
-        row.operator("nexus.export_selected", icon='RESTRICT_SELECT_OFF')
+            row = layout.row()
+            row.scale_y = 2.0
+            row.operator("nexus.process_export", icon='EXPORT')
+
+            row = layout.row()
+            row.scale_y = 1.5
+            row.operator("nexus.export_selected", icon='RESTRICT_SELECT_OFF')
 
         # Open output folder button
         if settings.output_directory:
@@ -2138,11 +5577,32 @@ class NEXUS_PT_output(Panel):
             row.operator("nexus.open_output_folder", icon='FILEBROWSER')
 
         # Show report buttons if there's report data
-        if _export_report_data['items']:
+        if _export_report_data['items'] and not _export_progress['running']:
             row = layout.row(align=True)
             row.operator("nexus.show_report", text="View Report", icon='FILE_TEXT')
             row.operator("nexus.copy_report", text="Copy", icon='COPYDOWN')
 
+    def draw_progress(self, layout):
+        """Draw live status of the running export."""
+        progress = _export_progress
+        done = progress['index']
+        total = progress['total']
+
+        box = layout.box()
+        box.progress(factor=done / max(total, 1), type='BAR', text=f"Exporting {done}/{total}")
+        if done < total:
+            box.label(text=progress['current'], icon='EXPORT')
+        elapsed = time.perf_counter() - progress['start_time']
+        box.label(text=_export_throughput(done, progress['bytes'], elapsed), icon='SORTTIME')
+
+        col = box.column(align=True)
+        for line in reversed(progress['log']):
+            col.label(text=line)
+
+        row = box.row()
+        row.alert = True
+        row.operator("nexus.cancel_export", icon='CANCEL')
+
 
 # -----------------------------------------------------------------------------
 # Registration
@@ -2154,6 +5614,7 @@ classes = (
     NexusExportPreferences,
     NEXUS_UL_export_queue,
     NEXUS_OT_add_selected,
+    NEXUS_OT_add_collection,
     NEXUS_OT_remove_item,
     NEXUS_OT_clear_queue,
     NEXUS_OT_toggle_all,
@@ -2163,6 +5624,8 @@ classes = (
     NEXUS_OT_show_report,
     NEXUS_OT_copy_report,
     NEXUS_OT_process_export,
+    NEXUS_OT_cancel_export,
+    NEXUS_OT_resume_export,
     NEXUS_OT_check_update,
     NEXUS_OT_install_update,
     NEXUS_OT_restart_blender,
@@ -2175,7 +5638,10 @@ classes = (
     NEXUS_PT_usdz_settings,
     NEXUS_PT_fbx_settings,
     NEXUS_PT_mesh_cleanup,
+    NEXUS_PT_lod_settings,
+    NEXUS_PT_budget_settings,
     NEXUS_PT_texture_resize,
+    NEXUS_PT_texture_atlas,
     NEXUS_PT_output,
 )
 
@@ -2188,8 +5654,16 @@ def register():
     bpy.types.Scene.nexus_queue = CollectionProperty(type=ExportQueueItem)
     bpy.types.Scene.nexus_queue_index = IntProperty(name="Active Queue Index", default=0)
 
+    for handler_list, handler in _HANDLERS:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
 
 def unregister():
+    for handler_list, handler in _HANDLERS:
+        if handler in handler_list:
+            handler_list.remove(handler)
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -2200,3 +5674,5 @@ def unregister():
 
 if __name__ == "__main__":
     register()
+    if "--" in sys.argv:
+        sys.exit(main())
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Shared fixtures for the Nexus Export Pro tests.
+
+The tests need Blender's Python and skip themselves elsewhere. Run them with:
+
+    blender -b --factory-startup --python-exit-code 1 \
+        --python-expr "import sys, pytest; sys.exit(pytest.main(['tests']))"
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+
+@pytest.fixture
+def scene():
+    """An empty scene with the add-on registered."""
+    import bpy
+    import nexus_export_pro as addon
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon.register()
+    yield bpy.context.scene
+    addon.unregister()
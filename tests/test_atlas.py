@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for atlas packing and padded pixel copies."""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+np = pytest.importorskip("numpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _overlaps(a, b, padding):
+    _, ax, ay, aw, ah = a
+    _, bx, by, bw, bh = b
+    return (ax - padding < bx + bw + padding and bx - padding < ax + aw + padding
+            and ay - padding < by + bh + padding and by - padding < ay + ah + padding)
+
+
+@pytest.mark.parametrize("padding", [0, 2])
+def test_pack_keeps_rectangles_apart_and_on_the_page(padding):
+    sizes = [(i, w, h) for i, (w, h) in enumerate([(256, 256), (128, 64), (64, 128), (512, 128), (32, 32)] * 3)]
+    pages = addon._pack_atlas(sizes, 1024, padding)
+
+    placed = [placement for page in pages for placement in page]
+    assert sorted(p[0] for p in placed) == sorted(key for key, _, _ in sizes)
+    for page in pages:
+        for index, a in enumerate(page):
+            _, x, y, w, h = a
+            assert x >= padding and y >= padding
+            assert x + w + padding <= 1024 and y + h + padding <= 1024
+            assert not any(_overlaps(a, b, padding) for b in page[index + 1:])
+
+
+def test_pack_scales_down_oversized_rectangles():
+    (page,) = addon._pack_atlas([("huge", 4096, 2048)], 1024, 4)
+    (_, x, y, w, h) = page[0]
+    assert (x, y) == (4, 4)
+    assert (w, h) == (1016, 508)
+
+
+def test_pack_starts_a_new_page_when_full():
+    pages = addon._pack_atlas([(i, 512, 512) for i in range(5)], 1024, 0)
+    assert [len(page) for page in pages] == [4, 1]
+
+
+def test_blit_copies_pixels_and_repeats_edges():
+    pixels = np.arange(2 * 3 * 4, dtype=np.float32).reshape(2, 3, 4)
+    dest = np.full((6, 7, 4), -1.0, dtype=np.float32)
+
+    addon._blit_padded(dest, pixels, 2, 2, 1)
+
+    np.testing.assert_array_equal(dest[2:4, 2:5], pixels)
+    np.testing.assert_array_equal(dest[1, 2:5], pixels[0])
+    np.testing.assert_array_equal(dest[4, 2:5], pixels[-1])
+    np.testing.assert_array_equal(dest[2:4, 1], pixels[:, 0])
+    np.testing.assert_array_equal(dest[2:4, 5], pixels[:, -1])
+    np.testing.assert_array_equal(dest[1, 1], pixels[0, 0])
+    np.testing.assert_array_equal(dest[4, 5], pixels[-1, -1])
+    # Nothing outside the padded rectangle is touched
+    assert (dest[0] == -1.0).all() and (dest[5] == -1.0).all()
+    assert (dest[:, 0] == -1.0).all() and (dest[:, 6] == -1.0).all()
+
+
+def test_blit_without_padding():
+    pixels = np.ones((2, 2, 4), dtype=np.float32)
+    dest = np.zeros((4, 4, 4), dtype=np.float32)
+    addon._blit_padded(dest, pixels, 1, 1, 0)
+    assert dest.sum() == 16
+    assert (dest[1:3, 1:3] == 1.0).all()
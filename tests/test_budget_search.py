@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for the budget solver's search over quality levels."""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _exporter(threshold):
+    """A stand-in export that fits the budget at or below a quality level, recording each call."""
+    calls = []
+
+    def attempt(quality):
+        calls.append(quality)
+        fits = threshold is not None and quality <= threshold
+        return fits, {}, {'quality': quality}
+
+    return attempt, calls
+
+
+def test_full_quality_fit_exports_once():
+    attempt, calls = _exporter(1.0)
+    fits, _errors, result, attempts = addon._search_budget_quality(attempt, 6)
+    assert fits
+    assert attempts == 1
+    assert calls == [1.0]
+    assert result['quality'] == 1.0
+
+
+@pytest.mark.parametrize("max_attempts", range(2, 13))
+@pytest.mark.parametrize("threshold", [None, 0.0, 0.3, 0.99])
+def test_attempts_stay_within_bound(max_attempts, threshold):
+    attempt, calls = _exporter(threshold)
+    _fits, _errors, _result, attempts = addon._search_budget_quality(attempt, max_attempts)
+    assert attempts == len(calls)
+    assert attempts <= max_attempts
+
+
+@pytest.mark.parametrize("max_attempts", range(2, 13))
+def test_last_export_is_the_best_fit(max_attempts):
+    attempt, calls = _exporter(0.3)
+    fits, _errors, result, _attempts = addon._search_budget_quality(attempt, max_attempts)
+    fitting = [quality for quality in calls if quality <= 0.3]
+    if fitting:
+        assert fits
+        assert result['quality'] == max(fitting)
+    else:
+        assert not fits
+
+
+def test_search_narrows_in_on_the_threshold():
+    attempt, _calls = _exporter(0.3)
+    fits, _errors, result, _attempts = addon._search_budget_quality(attempt, 12)
+    assert fits
+    assert 0.3 - 0.02 <= result['quality'] <= 0.3
+
+
+def test_never_fitting_tries_lowest_quality():
+    attempt, calls = _exporter(None)
+    fits, _errors, _result, attempts = addon._search_budget_quality(attempt, 6)
+    assert not fits
+    assert attempts == 6
+    assert calls[-1] == 0.0
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for the skip-unchanged content hash and the export cache file."""
+
+import json
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+@pytest.fixture
+def cube(scene):
+    """A cube with a material, a color attribute, a vertex group and a keyframed location."""
+    mesh = bpy.data.meshes.new("Cube")
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.materials.append(bpy.data.materials.new("Paint"))
+    mesh.color_attributes.new("Col", 'FLOAT_COLOR', 'POINT')
+
+    obj = bpy.data.objects.new("Cube", mesh)
+    scene.collection.objects.link(obj)
+    obj.vertex_groups.new(name="Bone").add([0, 1], 0.5, 'REPLACE')
+    obj.keyframe_insert("location", frame=1)
+    obj.location.x = 2.0
+    obj.keyframe_insert("location", frame=10)
+    return obj
+
+
+def _digest(obj, scene):
+    return addon._hierarchy_content_hash([obj], scene.nexus_export, bpy.context.evaluated_depsgraph_get())
+
+
+def _shade_smooth(obj):
+    for polygon in obj.data.polygons:
+        polygon.use_smooth = True
+
+
+def _mark_sharp(obj):
+    obj.data.edges[0].use_edge_sharp = True
+
+
+def _custom_normals(obj):
+    obj.data.normals_split_custom_set_from_vertices([(0.0, 0.0, 1.0)] * len(obj.data.vertices))
+
+
+def _vertex_paint(obj):
+    obj.data.color_attributes["Col"].data[0].color = (1.0, 0.0, 0.0, 1.0)
+
+
+def _weight_paint(obj):
+    obj.vertex_groups["Bone"].add([0], 1.0, 'REPLACE')
+
+
+def _blend_mode(obj):
+    material = obj.data.materials[0]
+    material.alpha_threshold = 0.25
+
+
+def _backface_culling(obj):
+    material = obj.data.materials[0]
+    material.use_backface_culling = not material.use_backface_culling
+
+
+def _interpolation(obj):
+    for fcurve in obj.animation_data.action.fcurves:
+        for point in fcurve.keyframe_points:
+            point.interpolation = 'CONSTANT'
+
+
+def _handles(obj):
+    point = obj.animation_data.action.fcurves[0].keyframe_points[0]
+    point.handle_right_type = 'FREE'
+    point.handle_right.y += 1.0
+
+
+@pytest.mark.parametrize("edit", [
+    _shade_smooth, _mark_sharp, _custom_normals, _vertex_paint, _weight_paint,
+    _blend_mode, _backface_culling, _interpolation, _handles,
+])
+def test_edit_changes_digest(cube, scene, edit):
+    before = _digest(cube, scene)
+    edit(cube)
+    cube.data.update()
+    assert _digest(cube, scene) != before
+
+
+def test_digest_is_stable_without_edits(cube, scene):
+    assert _digest(cube, scene) == _digest(cube, scene)
+
+
+def test_cache_round_trip(tmp_path):
+    (tmp_path / "Chair.glb").write_bytes(b"glTF")
+    cache = addon._ExportCache(str(tmp_path))
+    cache.store("Chair", "abc", {'object_name': "Chair", 'files': ["Chair.glb"], 'timings': {}})
+    cache.save()
+
+    reloaded = addon._ExportCache(str(tmp_path))
+    item = reloaded.lookup("Chair", "abc")
+    assert item['cached'] is True
+    assert 'timings' not in item
+    assert reloaded.lookup("Chair", "def") is None
+    assert reloaded.lookup("Table", "abc") is None
+
+
+def test_cache_misses_when_files_are_gone(tmp_path):
+    cache = addon._ExportCache(str(tmp_path))
+    cache.store("Chair", "abc", {'object_name': "Chair", 'files': ["Chair.glb"]})
+    assert cache.lookup("Chair", "abc") is None
+
+
+@pytest.mark.parametrize("content", ["not json", json.dumps({'version': 0, 'entries': {'Chair': {}}})])
+def test_unreadable_cache_starts_empty(tmp_path, content):
+    (tmp_path / addon._ExportCache.FILENAME).write_text(content)
+    assert addon._ExportCache(str(tmp_path)).entries == {}
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for reading the export journal and recovering from it."""
+
+import json
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _write_journal(path, records, tail=""):
+    with open(path / addon._ExportJournal.FILENAME, 'w') as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+        f.write(tail)
+
+
+def test_read_journal_tracks_started_and_done(tmp_path):
+    _write_journal(tmp_path, [
+        {'event': 'batch', 'blend_file': "", 'objects': ["Chair", "Table"], 'settings': {}},
+        {'event': 'start', 'object': "Chair", 'hierarchy': ["Chair"], 'transforms': {}, 'meshes': {}},
+        {'event': 'done', 'object': "Chair"},
+        {'event': 'start', 'object': "Table", 'hierarchy': ["Table"], 'transforms': {}, 'meshes': {}},
+        {'event': 'unlit', 'object': "Table", 'materials': [{'material': "Wood"}]},
+    ])
+
+    journal = addon._read_journal(str(tmp_path))
+    assert journal['objects'] == ["Chair", "Table"]
+    assert journal['done'] == {"Chair"}
+    assert list(journal['started']) == ["Table"]
+    assert journal['started']["Table"]['materials'] == [{'material': "Wood"}]
+
+
+def test_read_journal_stops_at_torn_line(tmp_path):
+    _write_journal(tmp_path, [
+        {'event': 'batch', 'blend_file': "", 'objects': ["Chair"], 'settings': {}},
+        {'event': 'start', 'object': "Chair", 'hierarchy': ["Chair"], 'transforms': {}, 'meshes': {}},
+    ], tail='{"event": "done", "obj')
+
+    journal = addon._read_journal(str(tmp_path))
+    assert journal['done'] == set()
+    assert list(journal['started']) == ["Chair"]
+
+
+def test_read_journal_without_file(tmp_path):
+    assert addon._read_journal(str(tmp_path)) is None
+
+
+def _interrupted_export(scene, tmp_path):
+    """Leave a cube the way export_item does just before it exports, journal included."""
+    original = bpy.data.meshes.new("Cube")
+    obj = bpy.data.objects.new("Cube", original)
+    scene.collection.objects.link(obj)
+    obj.location = (1.0, 2.0, 3.0)
+    transforms = {obj.name: (obj.matrix_basis.copy(), obj.matrix_parent_inverse.copy())}
+
+    original.use_fake_user = True
+    original.name = "Cube" + addon._ORIGINAL_MESH_SUFFIX
+    obj.data = bpy.data.meshes.new("Cube")
+
+    journal = addon._ExportJournal(str(tmp_path))
+    journal.begin([obj.name], scene.nexus_export)
+    journal.item_start(obj.name, transforms, {obj.name: (original, False)}, {original: "Cube"}, [obj])
+    journal.file.close()
+
+    obj.location = (0.0, 0.0, 0.0)
+    return obj, original
+
+
+def test_recovery_restores_interrupted_object(scene, tmp_path):
+    obj, original = _interrupted_export(scene, tmp_path)
+
+    assert addon._recover_from_journal(addon._read_journal(str(tmp_path))) == 1
+    assert obj.data == original
+    assert original.name == "Cube"
+    assert not original.use_fake_user
+    assert len(bpy.data.meshes) == 1
+    assert tuple(obj.location) == pytest.approx((1.0, 2.0, 3.0))
+
+
+def test_recovery_leaves_restored_objects_alone(scene, tmp_path):
+    obj, original = _interrupted_export(scene, tmp_path)
+    working = obj.data
+    obj.data = original
+    bpy.data.meshes.remove(working)
+
+    assert addon._recover_from_journal(addon._read_journal(str(tmp_path))) == 0
+    assert tuple(obj.location) == pytest.approx((0.0, 0.0, 0.0))
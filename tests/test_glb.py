@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for reading and rewriting GLB files, and MSFT_lod embedding."""
+
+import struct
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _lod_document():
+    return {
+        'asset': {'version': "2.0"},
+        'scenes': [{'nodes': [0, 1, 2]}],
+        'nodes': [
+            {'name': "Chair", 'children': [3]},
+            {'name': "Chair_LOD1"},
+            {'name': "Chair_LOD2"},
+            {'name': "Cushion"},
+        ],
+        'buffers': [{'byteLength': 3}],
+    }
+
+
+def test_round_trip_pads_chunks(tmp_path):
+    path = str(tmp_path / "chair.glb")
+    gltf = {'asset': {'version': "2.0"}, 'buffers': [{'byteLength': 3}]}
+    addon._write_glb(path, gltf, b"abc")
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, length = struct.unpack_from('<III', data, 0)
+    json_length = struct.unpack_from('<I', data, 12)[0]
+    assert (magic, version, length) == (addon._GLB_MAGIC, 2, len(data))
+    assert json_length % 4 == 0
+    assert len(data) % 4 == 0
+
+    read_gltf, binary = addon._read_glb(path)
+    assert read_gltf == gltf
+    assert binary == b"abc\0"
+
+
+def test_round_trip_without_binary(tmp_path):
+    path = str(tmp_path / "empty.glb")
+    addon._write_glb(path, {'asset': {'version': "2.0"}}, None)
+    assert addon._read_glb(path) == ({'asset': {'version': "2.0"}}, None)
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "chair.glb"
+    path.write_bytes(b"not a glb at all")
+    with pytest.raises(ValueError):
+        addon._read_glb(str(path))
+
+
+def test_embed_msft_lod(tmp_path):
+    path = str(tmp_path / "chair.glb")
+    addon._write_glb(path, _lod_document(), b"abc")
+
+    addon._embed_msft_lod(path, {"Chair": ["Chair_LOD1", "Chair_LOD2"]}, [0.5, 0.2, 0.05, 0.01])
+
+    gltf, binary = addon._read_glb(path)
+    chair = gltf['nodes'][0]
+    assert chair['extensions']['MSFT_lod'] == {'ids': [1, 2]}
+    assert chair['extras']['MSFT_screencoverage'] == [0.5, 0.2, 0.05]
+    assert chair['children'] == [3]
+    assert gltf['scenes'][0]['nodes'] == [0]
+    assert gltf['extensionsUsed'] == ['MSFT_lod']
+    assert binary == b"abc\0"
+
+
+def test_embed_msft_lod_without_lod_nodes_leaves_file(tmp_path):
+    path = str(tmp_path / "chair.glb")
+    addon._write_glb(path, _lod_document(), b"abc")
+    with open(path, 'rb') as f:
+        before = f.read()
+
+    addon._embed_msft_lod(path, {"Chair": ["Chair_LOD3"]}, [0.5, 0.2])
+
+    with open(path, 'rb') as f:
+        assert f.read() == before
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for dropping exported objects nested under other exported objects."""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+class _Node:
+    """Stand-in for an object: without_nested only follows parents."""
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+
+    def __repr__(self):
+        return self.name
+
+
+def _without_nested(objects, anchors=None):
+    return addon._HierarchyWalker().without_nested(objects, set(objects if anchors is None else anchors))
+
+
+def test_nested_objects_are_dropped_in_order():
+    room = _Node("Room")
+    table = _Node("Table", _Node("Furniture", room))
+    lamp = _Node("Lamp", table)
+    chair = _Node("Chair")
+    assert _without_nested([lamp, chair, table, room]) == [chair, room]
+
+
+def test_objects_under_non_anchors_are_kept():
+    group = _Node("Group")
+    chair = _Node("Chair", group)
+    table = _Node("Table", group)
+    assert _without_nested([chair, table]) == [chair, table]
+
+
+def test_shared_ancestors_resolve_both_ways():
+    root = _Node("Root")
+    middle = _Node("Middle", root)
+    first = _Node("First", middle)
+    second = _Node("Second", middle)
+    other = _Node("Other", _Node("Loose"))
+    assert _without_nested([first, other, second], anchors=[first, second, other, root]) == [other]
+    assert _without_nested([first, other, second], anchors=[first, second, other]) == [first, other, second]
+
+
+def test_deep_chains_do_not_recurse():
+    node = root = _Node("Root")
+    for index in range(20000):
+        node = _Node(f"Node{index}", node)
+    leaf = _Node("Leaf", node)
+    assert _without_nested([leaf, root]) == [root]
+    assert _without_nested([leaf]) == [leaf]
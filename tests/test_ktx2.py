@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for re-encoding GLB textures as KTX2, using a stand-in encoder."""
+
+import json
+import os
+import struct
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stand-in encoder is a script")
+
+PNG = b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + struct.pack('>II', 6, 6) + b'\x08\x06\0\0\0'
+JPEG = b'\xff\xd8\xff\xd9'
+VERTICES = b'\x01\x02\x03\x04\x05\x06'
+
+
+def _settings(**values):
+    return SimpleNamespace(**dict({'ktx2_encoding': 'ETC1S', 'texture_quality': 80, 'ktx2_mipmaps': False}, **values))
+
+
+def _encoder(tmp_path, exit_code=0):
+    """A toktx stand-in that writes its options, as JSON, to the target file."""
+    path = tmp_path / "toktx"
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import json, sys\n"
+        "with open(sys.argv[-2], 'w') as f:\n"
+        "    json.dump(sys.argv[1:-2], f)\n"
+        f"sys.exit({exit_code})\n"
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+def _write_textured_glb(path):
+    """A GLB with a PNG base color, vertex data and a JPEG normal map, in that buffer order."""
+    binary = b''
+    views = []
+    for data in (PNG, VERTICES, JPEG):
+        binary += b'\0' * (-len(binary) % 4)
+        views.append({'buffer': 0, 'byteOffset': len(binary), 'byteLength': len(data)})
+        binary += data
+    gltf = {
+        'asset': {'version': "2.0"},
+        'buffers': [{'byteLength': len(binary)}],
+        'bufferViews': views,
+        'images': [{'mimeType': 'image/png', 'bufferView': 0}, {'mimeType': 'image/jpeg', 'bufferView': 2}],
+        'textures': [{'source': 0}, {'source': 1}],
+        'materials': [{
+            'pbrMetallicRoughness': {'baseColorTexture': {'index': 0}},
+            'normalTexture': {'index': 1},
+        }],
+    }
+    addon._write_glb(str(path), gltf, binary)
+
+
+def _view_data(gltf, binary, index):
+    view = gltf['bufferViews'][index]
+    return binary[view['byteOffset']:view['byteOffset'] + view['byteLength']]
+
+
+def test_command_rounds_sizes_up_to_multiples_of_four():
+    command = addon._ktx2_command("toktx", "in.png", "out.ktx2", True, (6, 8), _settings())
+    assert command[command.index("--resize") + 1] == "8x8"
+    assert command[-2:] == ["out.ktx2", "in.png"]
+    assert "--resize" not in addon._ktx2_command("toktx", "in.png", "out.ktx2", True, (8, 4), _settings())
+
+
+def test_command_encoding_options():
+    etc1s = addon._ktx2_command("toktx", "in.png", "out.ktx2", True, None, _settings(ktx2_mipmaps=True))
+    assert etc1s[etc1s.index("--encode") + 1] == "etc1s"
+    assert "--genmipmap" in etc1s
+    assert etc1s[etc1s.index("--assign_oetf") + 1] == "srgb"
+
+    uastc = addon._ktx2_command("toktx", "in.png", "out.ktx2", False, None, _settings(ktx2_encoding='UASTC'))
+    assert uastc[uastc.index("--encode") + 1] == "uastc"
+    assert uastc[uastc.index("--uastc_quality") + 1] == "3"
+    assert uastc[uastc.index("--assign_oetf") + 1] == "linear"
+
+
+def test_rebuilds_buffer_with_aligned_views(tmp_path):
+    path = tmp_path / "chair.glb"
+    _write_textured_glb(path)
+
+    assert addon._compress_glb_textures_ktx2(str(path), _encoder(tmp_path), _settings()) == 2
+
+    gltf, binary = addon._read_glb(str(path))
+    assert all(view['byteOffset'] % 4 == 0 for view in gltf['bufferViews'])
+    last = gltf['bufferViews'][-1]
+    assert gltf['buffers'][0]['byteLength'] == last['byteOffset'] + last['byteLength']
+    assert _view_data(gltf, binary, 1) == VERTICES
+
+    base_color = json.loads(_view_data(gltf, binary, 0))
+    normal = json.loads(_view_data(gltf, binary, 2))
+    assert base_color[base_color.index("--assign_oetf") + 1] == "srgb"
+    assert base_color[base_color.index("--resize") + 1] == "8x8"
+    assert normal[normal.index("--assign_oetf") + 1] == "linear"
+
+    assert [image['mimeType'] for image in gltf['images']] == ['image/ktx2', 'image/ktx2']
+    assert gltf['textures'] == [
+        {'extensions': {'KHR_texture_basisu': {'source': 0}}},
+        {'extensions': {'KHR_texture_basisu': {'source': 1}}},
+    ]
+    assert gltf['extensionsRequired'] == ['KHR_texture_basisu']
+
+
+def test_failed_encode_leaves_file(tmp_path):
+    path = tmp_path / "chair.glb"
+    _write_textured_glb(path)
+    before = path.read_bytes()
+
+    with pytest.raises(RuntimeError):
+        addon._compress_glb_textures_ktx2(str(path), _encoder(tmp_path, exit_code=1), _settings())
+    assert path.read_bytes() == before
+    assert not os.path.exists(str(path) + ".tmp")
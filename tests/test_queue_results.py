@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for storing export results on queue items."""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _report_item(name, triangles=12, file_size=2048, error=None):
+    """A report item as export_item builds it, with real stage timings."""
+    timer = addon._StageTimer()
+    with timer.stage('export'):
+        pass
+    with timer.stage('restore'):
+        pass
+    return {
+        'object_name': name,
+        'triangles': triangles,
+        'file_size': file_size,
+        'success': error is None,
+        'error': error,
+        'timings': timer.stages,
+    }
+
+
+def _add_object(scene, name):
+    obj = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+    scene.collection.objects.link(obj)
+    return obj
+
+
+def test_object_item_records_last_export(scene):
+    obj = _add_object(scene, "Chair")
+    queue_item = scene.nexus_queue.add()
+    queue_item.obj = obj
+    report_item = _report_item("Chair")
+
+    addon._record_queue_results(scene.nexus_queue, {"Chair": ('OBJECT', "Chair")},
+                                [report_item], scene.nexus_export)
+
+    assert queue_item.last_status == 'EXPORTED'
+    assert queue_item.last_triangles == 12
+    assert queue_item.last_file_size == 2048
+    expected = sum(timing['wall'] for timing in report_item['timings'].values())
+    assert queue_item.last_duration == pytest.approx(expected, abs=1e-6)
+
+
+def test_collection_item_sums_objects_and_keeps_failures(scene):
+    collection = bpy.data.collections.new("Props")
+    scene.collection.children.link(collection)
+    queue_item = scene.nexus_queue.add()
+    queue_item.collection = collection
+    settings = scene.nexus_export
+    settings.export_prefix = "Shop_"
+    items = [
+        _report_item("Shop_Lamp", triangles=10, file_size=100),
+        _report_item("Shop_Table", triangles=20, file_size=200, error="GLB: failed"),
+    ]
+    sources = {"Lamp": ('COLLECTION', "Props"), "Table": ('COLLECTION', "Props")}
+
+    addon._record_queue_results(scene.nexus_queue, sources, items, settings)
+
+    assert queue_item.last_status == 'FAILED'
+    assert queue_item.last_triangles == 30
+    assert queue_item.last_file_size == 300
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+"""Tests for the JSON Lines and CSV report files."""
+
+import csv
+import hashlib
+import json
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import nexus_export_pro as addon  # noqa: E402
+
+
+def _report_item(name, files=(), error=None, format_errors=None, cached=False):
+    """A report item as export_item builds it."""
+    return {
+        'object_name': name,
+        'triangles': 12,
+        'vertices': 8,
+        'file_size': 4 * len(files),
+        'format': ", ".join(f.rsplit('.', 1)[1].upper() for f in files),
+        'files': list(files),
+        'textures': '',
+        'texture_sizes': [],
+        'success': error is None,
+        'error': error,
+        'format_errors': format_errors or {},
+        'timings': {'export': {'wall': 0.5, 'cpu': 0.5}},
+        'cached': cached,
+    }
+
+
+def _records(path):
+    with open(path / addon._ReportWriter.JSONL_FILENAME) as f:
+        return [json.loads(line) for line in f]
+
+
+def _rows(path):
+    with open(path / addon._ReportWriter.CSV_FILENAME, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_one_record_per_file_and_missing_format(tmp_path):
+    (tmp_path / "Chair.glb").write_bytes(b"glTF")
+    writer = addon._ReportWriter(str(tmp_path))
+    writer.write_item(_report_item("Chair", ["Chair.glb"], format_errors={'USDZ': "USDZ failed"}))
+    writer.close([])
+
+    glb, usdz = _records(tmp_path)
+    assert glb['format'] == 'GLB'
+    assert glb['bytes'] == 4
+    assert glb['hash'] == hashlib.sha256(b"glTF").hexdigest()
+    assert glb['error'] is None
+    assert usdz['format'] == 'USDZ'
+    assert usdz['path'] is None
+    assert usdz['error'] == "USDZ failed"
+
+
+def test_failed_object_gets_one_record(tmp_path):
+    writer = addon._ReportWriter(str(tmp_path))
+    writer.write_item(_report_item("Chair", error="Object was deleted"))
+    writer.close([])
+
+    (record,) = _records(tmp_path)
+    assert record['format'] is None
+    assert record['error'] == "Object was deleted"
+
+
+def test_csv_has_one_row_per_object(tmp_path):
+    (tmp_path / "Chair.glb").write_bytes(b"glTF")
+    items = [
+        _report_item("Chair", ["Chair.glb"]),
+        _report_item("Lamp", ["Lamp.glb"], cached=True),
+        _report_item("Table", error="GLB: failed"),
+    ]
+    writer = addon._ReportWriter(str(tmp_path))
+    for item in items:
+        writer.write_item(item)
+    writer.close(items)
+
+    rows = _rows(tmp_path)
+    assert [(row['object'], row['status']) for row in rows] == [
+        ("Chair", "ok"), ("Lamp", "unchanged"), ("Table", "failed"),
+    ]
+    assert rows[0]['files'] == "Chair.glb"
+    assert rows[0]['vertices'] == "8"
+    assert rows[0]['seconds'] == "0.500"
+    assert rows[2]['error'] == "GLB: failed"
+
+
+def test_resumed_batch_keeps_earlier_objects(tmp_path):
+    (tmp_path / "Chair.glb").write_bytes(b"glTF")
+    first = [_report_item("Chair", ["Chair.glb"]), _report_item("Table", error="interrupted")]
+    writer = addon._ReportWriter(str(tmp_path))
+    for item in first:
+        writer.write_item(item)
+    writer.close(first)
+
+    (tmp_path / "Table.glb").write_bytes(b"glTF")
+    second = [_report_item("Table", ["Table.glb"])]
+    writer = addon._ReportWriter(str(tmp_path), resumed_objects={"Table"})
+    writer.write_item(second[0])
+    writer.close(second)
+
+    records = _records(tmp_path)
+    assert [(r['object'], r['error']) for r in records] == [("Chair", None), ("Table", None)]
+    assert [(row['object'], row['status']) for row in _rows(tmp_path)] == [("Chair", "ok"), ("Table", "ok")]
+
+
+def test_torn_final_line_is_ignored(tmp_path):
+    path = tmp_path / addon._ReportWriter.JSONL_FILENAME
+    path.write_text(json.dumps({'object': "Chair"}) + "\n" + '{"object": "Ta')
+    assert addon._read_report_records(str(path)) == [{'object': "Chair"}]